@@ -0,0 +1,15 @@
+"""Response classes shared by route modules."""
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class UploadProgressResponse(StreamingResponse):
+    """Stream progress while the request body is still being read.
+
+    ``StreamingResponse`` listens for disconnects on ``receive`` alongside the body,
+    which would swallow upload chunks the generator has not read yet. Here only the
+    upload reader consumes ``receive`` and surfaces disconnects itself.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
@@ -1,4 +1,11 @@
 """Route groups exposed by the API layer."""
-from . import glossary, health, metrics, submissions, translate
+from . import glossary, health, metrics, submissions, translate, translation_memory
 
-__all__ = ["glossary", "health", "metrics", "submissions", "translate"]
+__all__ = [
+    "glossary",
+    "health",
+    "metrics",
+    "submissions",
+    "translate",
+    "translation_memory",
+]
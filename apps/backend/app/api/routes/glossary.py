@@ -1,14 +1,23 @@
 """Glossary CRUD endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 
-from ...dependencies import get_glossary_service
-from ...services.glossary import GlossaryService
+from ...core.config import get_settings
+from ...db.session import get_sessionmaker
+from ...dependencies import (
+    get_glossary_impact_service,
+    get_glossary_service,
+    redraft_submission_in_session,
+)
 from ...schemas.glossary import (
     GlossaryEntryCreate,
     GlossaryEntryList,
     GlossaryEntryRead,
     GlossaryEntryUpdate,
+    GlossaryImpactList,
+    GlossaryRedraftQueued,
 )
+from ...services.glossary import GlossaryService
+from ...services.glossary_impact import GlossaryImpactService, redraft_submissions
 
 router = APIRouter(prefix="/glossary", tags=["glossary"])
 
@@ -49,15 +58,56 @@ async def get_glossary_entry(
 async def update_glossary_entry(
     entry_id: str,
     payload: GlossaryEntryUpdate,
+    background_tasks: BackgroundTasks,
     service: GlossaryService = Depends(get_glossary_service),
+    impact: GlossaryImpactService = Depends(get_glossary_impact_service),
 ) -> GlossaryEntryRead:
     try:
-        return await service.update_entry(entry_id, payload)
+        entry = await service.update_entry(entry_id, payload)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
 
+    if get_settings().glossary_auto_redraft and "thai_term" in payload.model_fields_set:
+        await _queue_redraft(entry, impact, background_tasks)
+    return entry
+
+
+@router.get("/{entry_id}/submissions", response_model=GlossaryImpactList)
+async def list_affected_submissions(
+    entry_id: str,
+    include_approved: bool = Query(default=False),
+    stale_only: bool = Query(
+        default=True, description="Only submissions drafted with a different Thai term"
+    ),
+    service: GlossaryService = Depends(get_glossary_service),
+    impact: GlossaryImpactService = Depends(get_glossary_impact_service),
+) -> GlossaryImpactList:
+    """List submissions whose drafts used this glossary term."""
+
+    entry = await _get_entry_or_404(service, entry_id)
+    return await impact.affected_submissions(
+        entry, include_approved=include_approved, stale_only=stale_only
+    )
+
+
+@router.post(
+    "/{entry_id}/redraft",
+    response_model=GlossaryRedraftQueued,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def redraft_affected_submissions(
+    entry_id: str,
+    background_tasks: BackgroundTasks,
+    service: GlossaryService = Depends(get_glossary_service),
+    impact: GlossaryImpactService = Depends(get_glossary_impact_service),
+) -> GlossaryRedraftQueued:
+    """Queue re-drafting of non-approved submissions drafted with an outdated term."""
+
+    entry = await _get_entry_or_404(service, entry_id)
+    return await _queue_redraft(entry, impact, background_tasks)
+
 
 @router.delete("/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_glossary_entry(
@@ -68,3 +118,28 @@ async def delete_glossary_entry(
         await service.delete_entry(entry_id)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+async def _get_entry_or_404(service: GlossaryService, entry_id: str) -> GlossaryEntryRead:
+    entry = await service.get_entry(entry_id)
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return GlossaryEntryRead.model_validate(entry)
+
+
+async def _queue_redraft(
+    entry: GlossaryEntryRead,
+    impact: GlossaryImpactService,
+    background_tasks: BackgroundTasks,
+) -> GlossaryRedraftQueued:
+    affected = await impact.affected_submissions(entry)
+    submission_ids = [item.id for item in affected.items]
+    if submission_ids:
+        background_tasks.add_task(
+            redraft_submissions,
+            submission_ids,
+            get_sessionmaker(),
+            redraft_submission_in_session,
+            get_settings().redraft_concurrency,
+        )
+    return GlossaryRedraftQueued(entry_id=entry.id, submission_ids=submission_ids)
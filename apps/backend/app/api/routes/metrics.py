@@ -3,9 +3,23 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 
-from ...dependencies import get_metrics_service
-from ...schemas import MetricsOverview
+from ...dependencies import (
+    get_metric_sketch_service,
+    get_metrics_service,
+    get_usage_analytics_service,
+)
+from ...schemas import (
+    GlossaryUsage,
+    MetricPercentiles,
+    MetricsOverview,
+    MetricsTimeseries,
+    SketchMetric,
+    TimeseriesGroup,
+    WarningBreakdown,
+)
 from ...services.metrics import MetricsService
+from ...services.sketches import MetricSketchService
+from ...services.usage_analytics import UsageAnalyticsService
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
@@ -18,3 +32,47 @@ async def get_overview(
     """Return aggregate statistics for submissions."""
 
     return await service.overview(days=days)
+
+
+@router.get("/timeseries", response_model=MetricsTimeseries)
+async def get_timeseries(
+    days: int = Query(30, ge=1, le=365),
+    group_by: Optional[TimeseriesGroup] = Query(None),
+    service: MetricsService = Depends(get_metrics_service),
+) -> MetricsTimeseries:
+    """Return per-day submission totals, optionally split by status, provider, or channel."""
+
+    return await service.timeseries(days=days, group_by=group_by)
+
+
+@router.get("/percentiles", response_model=MetricPercentiles)
+async def get_percentiles(
+    hours: int = Query(24, ge=1, le=24 * 90),
+    metric: Optional[SketchMetric] = Query(None),
+    by_provider: bool = Query(False),
+    service: MetricSketchService = Depends(get_metric_sketch_service),
+) -> MetricPercentiles:
+    """Return p50/p95/p99 of provider latency, tokens, and cost from merged sketches."""
+
+    return await service.percentiles(hours=hours, metric=metric, by_provider=by_provider)
+
+
+@router.get("/glossary-usage", response_model=GlossaryUsage)
+async def get_glossary_usage(
+    limit: int = Query(20, ge=1, le=200),
+    days: Optional[int] = Query(None, ge=1, le=365),
+    service: UsageAnalyticsService = Depends(get_usage_analytics_service),
+) -> GlossaryUsage:
+    """Return the glossary terms used by the most submissions."""
+
+    return await service.glossary_usage(limit=limit, days=days)
+
+
+@router.get("/warnings", response_model=WarningBreakdown)
+async def get_warning_breakdown(
+    days: Optional[int] = Query(None, ge=1, le=365),
+    service: UsageAnalyticsService = Depends(get_usage_analytics_service),
+) -> WarningBreakdown:
+    """Return warning rates by code with the most frequent terms for each."""
+
+    return await service.warning_breakdown(days=days)
@@ -1,23 +1,97 @@
 """Content submission workflow endpoints."""
-from typing import Optional
+import json
+from datetime import datetime
+from typing import AsyncIterator, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from ...dependencies import get_submission_service
+from ...core.config import get_settings
+from ...db.session import get_read_sessionmaker, get_sessionmaker
+from ...dependencies import (
+    build_submission_service,
+    get_near_duplicate_service,
+    get_revision_service,
+    get_search_service,
+    get_submission_reader,
+    get_submission_service,
+)
 from ...models import SubmissionStatus
-from ...schemas import SubmissionCreate, SubmissionList, SubmissionRead, SubmissionUpdate
-from ...services.exports import ExportService
-from ...services.submission import SubmissionService
+from ...schemas import (
+    NearDuplicateList,
+    NearDuplicateQuery,
+    SubmissionBulkTransition,
+    SubmissionBulkTransitionResult,
+    SubmissionCreate,
+    SubmissionFilter,
+    SubmissionList,
+    SubmissionRead,
+    SubmissionRevisionDiff,
+    SubmissionRevisionList,
+    SubmissionRevisionRead,
+    SubmissionSearchResults,
+    SubmissionStatusCounts,
+    SubmissionUpdate,
+)
+from ...services.bulk_ingest import BulkIngestService, detect_format
+from ...services.export_cache import etag_matches, export_etag, get_export_cache
+from ...services.exports import (
+    COLUMNAR_MEDIA_TYPES,
+    BulkExportService,
+    ExportService,
+    columnar_available,
+    resolve_columns,
+)
+from ...services.near_duplicates import NearDuplicateService
+from ...services.revisions import RevisionService
+from ...services.search import SearchService
+from ...services.submission import SubmissionService, filter_criteria
+from ..responses import UploadProgressResponse
 
 router = APIRouter(prefix="/submissions", tags=["submissions"])
 
 
-@router.get("", response_model=SubmissionList)
+@router.get("", response_model=SubmissionList, response_model_exclude_unset=True)
 async def list_submissions(
     status: Optional[SubmissionStatus] = Query(default=None),
-    service: SubmissionService = Depends(get_submission_service),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated columns to return instead of the summary"
+    ),
+    service: SubmissionService = Depends(get_submission_reader),
 ) -> SubmissionList:
-    return await service.list_submissions(status=status)
+    try:
+        return await service.list_submissions(
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            fields=fields.split(",") if fields else None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get("/counts", response_model=SubmissionStatusCounts)
+async def get_submission_counts(
+    service: SubmissionService = Depends(get_submission_reader),
+) -> SubmissionStatusCounts:
+    """Return per-status totals for the status filter tabs."""
+
+    return await service.status_counts()
+
+
+@router.get("/search", response_model=SubmissionSearchResults)
+async def search_submissions(
+    q: str = Query(..., min_length=1, max_length=200),
+    status: Optional[SubmissionStatus] = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    service: SearchService = Depends(get_search_service),
+) -> SubmissionSearchResults:
+    """Rank submissions by title, source, draft and final copy matching ``q``."""
+
+    return await service.search(q, status=status, limit=limit, offset=offset)
 
 
 @router.post("", response_model=SubmissionRead, status_code=status.HTTP_201_CREATED)
@@ -28,15 +102,192 @@ async def create_submission(
     return await service.create_submission(payload)
 
 
+@router.post("/bulk", response_class=StreamingResponse)
+async def bulk_ingest_submissions(
+    request: Request,
+    format: Optional[str] = Query(
+        default=None, description="csv or jsonl; inferred from Content-Type when omitted"
+    ),
+) -> StreamingResponse:
+    """Create submissions from a streamed CSV or JSON Lines upload.
+
+    Columns/keys: title, source (or source_text), tone, audience, channel. The response
+    is NDJSON with one event per row and a final ``done`` summary.
+    """
+
+    try:
+        upload_format = detect_format(format, request.headers.get("content-type"))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    settings = get_settings()
+
+    async def events() -> AsyncIterator[str]:
+        # The stream outlives the request-scoped session, so it opens its own.
+        async with get_sessionmaker()() as session:
+            ingest = BulkIngestService(
+                build_submission_service(session),
+                batch_size=settings.bulk_ingest_batch_size,
+                concurrency=settings.bulk_ingest_concurrency,
+            )
+            async for event in ingest.ingest(request.stream(), upload_format):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return UploadProgressResponse(events(), media_type="application/x-ndjson")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_submissions(
+    format: Literal["csv", "zip", "parquet", "arrow"] = Query("csv"),
+    status: Optional[SubmissionStatus] = Query(default=None),
+    channel: Optional[str] = Query(default=None),
+    created_after: Optional[datetime] = Query(default=None),
+    created_before: Optional[datetime] = Query(default=None),
+    columns: Optional[str] = Query(
+        default=None, description="Comma-separated columns for parquet/arrow exports"
+    ),
+) -> StreamingResponse:
+    """Stream every matching submission as one CSV or a ZIP of DOCX and text files.
+
+    ``parquet`` and ``arrow`` (an Arrow IPC stream) write the ``columns`` selected,
+    batch by batch from the cursor, for analytics tools to scan directly.
+    """
+
+    columnar = format in COLUMNAR_MEDIA_TYPES
+    if columnar:
+        if not columnar_available():
+            raise HTTPException(
+                status_code=400,
+                detail="Parquet and Arrow exports need the 'analytics' extra (pyarrow)",
+            )
+        try:
+            selected = resolve_columns(columns.split(",") if columns else None)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    criteria = filter_criteria(
+        SubmissionFilter(
+            status=status,
+            channel=channel,
+            created_after=created_after,
+            created_before=created_before,
+        )
+    )
+
+    async def chunks() -> AsyncIterator[bytes]:
+        # The stream outlives the request-scoped session, so it opens its own, on the
+        # replica when one is configured.
+        async with get_read_sessionmaker()() as session:
+            exporter = BulkExportService(session)
+            if columnar:
+                stream = exporter.stream_columnar(criteria, format, selected)
+            elif format == "csv":
+                stream = exporter.stream_csv(criteria)
+            else:
+                stream = exporter.stream_zip(criteria)
+            async for chunk in stream:
+                yield chunk
+
+    filename = BulkExportService.filename(format)
+    media_types = {"csv": "text/csv", "zip": "application/zip", **COLUMNAR_MEDIA_TYPES}
+    return StreamingResponse(
+        chunks(),
+        media_type=media_types[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.post("/bulk-transition", response_model=SubmissionBulkTransitionResult)
+async def bulk_transition_submissions(
+    payload: SubmissionBulkTransition,
+    service: SubmissionService = Depends(get_submission_service),
+) -> SubmissionBulkTransitionResult:
+    """Apply one review transition to a list of IDs or to every row matching a filter."""
+
+    return await service.bulk_transition(payload)
+
+
+@router.post("/near-duplicates", response_model=NearDuplicateList)
+async def find_near_duplicates(
+    payload: NearDuplicateQuery,
+    service: NearDuplicateService = Depends(get_near_duplicate_service),
+) -> NearDuplicateList:
+    """Return submissions whose source text is a near-duplicate of the supplied copy."""
+
+    items = await service.find(
+        payload.source_text,
+        max_distance=payload.max_distance,
+        limit=payload.limit,
+        approved_only=payload.approved_only,
+    )
+    return NearDuplicateList(items=items)
+
+
 @router.get("/{submission_id}", response_model=SubmissionRead)
 async def get_submission(
     submission_id: str,
     service: SubmissionService = Depends(get_submission_service),
 ) -> SubmissionRead:
+    submission = await service.get_submission_detail(submission_id)
+    if submission is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return submission
+
+
+@router.get("/{submission_id}/near-duplicates", response_model=NearDuplicateList)
+async def get_submission_near_duplicates(
+    submission_id: str,
+    max_distance: Optional[int] = Query(default=None, ge=0, le=16),
+    limit: int = Query(default=5, ge=1, le=50),
+    approved_only: bool = Query(default=False),
+    service: SubmissionService = Depends(get_submission_service),
+    near_duplicates: NearDuplicateService = Depends(get_near_duplicate_service),
+) -> NearDuplicateList:
     submission = await service.get_submission(submission_id)
     if submission is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
-    return SubmissionRead.model_validate(submission)
+
+    items = await near_duplicates.find(
+        submission.source_text,
+        max_distance=max_distance,
+        limit=limit,
+        approved_only=approved_only,
+        exclude_id=submission.id,
+    )
+    return NearDuplicateList(items=items)
+
+
+@router.get("/{submission_id}/revisions", response_model=SubmissionRevisionList)
+async def list_submission_revisions(
+    submission_id: str,
+    revisions: RevisionService = Depends(get_revision_service),
+) -> SubmissionRevisionList:
+    return await revisions.list_revisions(submission_id)
+
+
+@router.get("/{submission_id}/revisions/diff", response_model=SubmissionRevisionDiff)
+async def diff_submission_revisions(
+    submission_id: str,
+    from_revision: int = Query(..., alias="from", ge=1),
+    to_revision: int = Query(..., alias="to", ge=1),
+    revisions: RevisionService = Depends(get_revision_service),
+) -> SubmissionRevisionDiff:
+    """Token-level diff of draft and final copy between two revisions."""
+
+    diff = await revisions.diff(submission_id, from_revision, to_revision)
+    if diff is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+    return diff
+
+
+@router.get("/{submission_id}/revisions/{revision}", response_model=SubmissionRevisionRead)
+async def get_submission_revision(
+    submission_id: str,
+    revision: int,
+    revisions: RevisionService = Depends(get_revision_service),
+) -> SubmissionRevisionRead:
+    found = await revisions.get_revision(submission_id, revision)
+    if found is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+    return found
 
 
 @router.put("/{submission_id}", response_model=SubmissionRead)
@@ -49,18 +300,31 @@ async def update_submission(
         return await service.update_submission(submission_id, payload)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get("/{submission_id}/export")
 async def export_submission(
     submission_id: str,
-    format: str = Query("csv"),
+    format: Literal["csv", "docx", "social"] = Query("csv"),
+    if_none_match: Optional[str] = Header(None),
     service: SubmissionService = Depends(get_submission_service),
 ) -> Response:
     submission = await service.get_submission(submission_id)
     if submission is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
 
-    payload = ExportService(submission).generate(format)
-    headers = {"Content-Disposition": f"attachment; filename={payload.filename}"}
+    # Clients revalidate with If-None-Match; an unchanged submission costs no rendering.
+    etag = export_etag(submission, format)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cache = get_export_cache()
+    if cache is None:
+        payload = await ExportService(submission).render(format)
+    else:
+        payload = await cache.fetch(submission, format)
+    headers["Content-Disposition"] = f"attachment; filename={payload.filename}"
     return Response(content=payload.content, media_type=payload.media_type, headers=headers)
@@ -2,8 +2,9 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
+from ...core.locales import PRIMARY_LOCALE, normalize_locales
 from ...dependencies import get_translation_service
 from ...services.translation import TranslationResult, TranslationService
 
@@ -15,6 +16,37 @@ class TranslatePayload(BaseModel):
     tone: Optional[str] = Field(None, description="Desired tone for the Thai adaptation")
     audience: Optional[str] = Field(None, description="Target audience to bias localization")
     channel: Optional[str] = Field(None, description="Channel or asset type (ads, social, etc.)")
+    target_locales: list[str] = Field(
+        default_factory=list,
+        description="Locales drafted alongside Thai in the same request (vi, id, ms)",
+    )
+
+    @field_validator("target_locales")
+    @classmethod
+    def _validate_locales(cls, value: list[str]) -> list[str]:
+        return normalize_locales(value)
+
+
+class LocaleTranslateResponse(BaseModel):
+    locale: str
+    text: str
+    provider_name: Optional[str] = None
+    usage_tokens: Optional[int] = None
+    cost_usd: Optional[float] = None
+    warnings: list[str] = Field(default_factory=list)
+    notes: Optional[str] = None
+
+    @classmethod
+    def from_result(cls, result: TranslationResult) -> "LocaleTranslateResponse":
+        return cls(
+            locale=result.locale,
+            text=result.thai_text,
+            provider_name=result.provider_name,
+            usage_tokens=result.usage_tokens,
+            cost_usd=result.cost_usd,
+            warnings=result.warnings,
+            notes=result.notes,
+        )
 
 
 class TranslateResponse(BaseModel):
@@ -26,6 +58,7 @@ class TranslateResponse(BaseModel):
     usage_tokens: Optional[int] = None
     cost_usd: Optional[float] = None
     warnings: list[str] = Field(default_factory=list)
+    translations: list[LocaleTranslateResponse] = Field(default_factory=list)
 
     @classmethod
     def from_result(cls, result: TranslationResult) -> "TranslateResponse":
@@ -46,12 +79,17 @@ async def translate(
     payload: TranslatePayload,
     service: TranslationService = Depends(get_translation_service),
 ) -> TranslateResponse:
-    """Produce a Thai draft while honoring glossary and tone requirements."""
+    """Produce a Thai draft, plus any extra locales, honoring glossary and tone requirements."""
 
-    result = await service.translate(
+    results = await service.translate_many(
         english_text=payload.text,
+        locales=normalize_locales(payload.target_locales),
         tone=payload.tone,
         audience=payload.audience,
         channel=payload.channel,
     )
-    return TranslateResponse.from_result(result)
+    response = TranslateResponse.from_result(results.pop(PRIMARY_LOCALE))
+    response.translations = [
+        LocaleTranslateResponse.from_result(result) for result in results.values()
+    ]
+    return response
@@ -0,0 +1,108 @@
+"""Translation memory exchange endpoints (TMX and XLIFF)."""
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from ...core.config import get_settings
+from ...core.locales import PRIMARY_LOCALE
+from ...db.session import get_read_sessionmaker, get_sessionmaker
+from ...dependencies import get_translation_memory_service
+from ...schemas import (
+    TranslationMemoryExportScope,
+    TranslationMemoryFormat,
+    TranslationMemoryImportRead,
+    TranslationMemoryLookup,
+)
+from ...services.translation_memory import (
+    SOURCE_LOCALE,
+    TM_MEDIA_TYPES,
+    TranslationMemoryExporter,
+    TranslationMemoryService,
+)
+from ..responses import UploadProgressResponse
+
+router = APIRouter(prefix="/translation-memory", tags=["translation-memory"])
+
+
+@router.post("/imports", response_class=StreamingResponse)
+async def import_translation_memory(
+    request: Request,
+    import_id: Optional[str] = Query(
+        default=None, description="Resume this unfinished import by re-uploading its file"
+    ),
+    filename: Optional[str] = Query(default=None),
+    service: TranslationMemoryService = Depends(get_translation_memory_service),
+) -> StreamingResponse:
+    """Stream a TMX or XLIFF upload into the translation memory.
+
+    The format is detected from the root element. The response is NDJSON: a
+    ``started`` event with the import id, ``progress`` after every committed batch,
+    and a final ``done`` or ``failed`` event.
+    """
+
+    try:
+        record = await service.start_import(import_id=import_id, filename=filename)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    batch_size = get_settings().tm_import_batch_size
+
+    async def events() -> AsyncIterator[str]:
+        # The stream outlives the request-scoped session, so it opens its own.
+        async with get_sessionmaker()() as session:
+            importer = TranslationMemoryService(session)
+            async for event in importer.run_import(record.id, request.stream(), batch_size):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return UploadProgressResponse(events(), media_type="application/x-ndjson")
+
+
+@router.get("/imports/{import_id}", response_model=TranslationMemoryImportRead)
+async def get_translation_memory_import(
+    import_id: str,
+    service: TranslationMemoryService = Depends(get_translation_memory_service),
+) -> TranslationMemoryImportRead:
+    record = await service.get_import(import_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return TranslationMemoryImportRead.model_validate(record)
+
+
+@router.get("/lookup", response_model=TranslationMemoryLookup)
+async def lookup_translation_memory(
+    text: str = Query(..., min_length=1),
+    source_locale: str = Query(default=SOURCE_LOCALE),
+    target_locale: str = Query(default=PRIMARY_LOCALE),
+    limit: int = Query(default=10, ge=1, le=100),
+    service: TranslationMemoryService = Depends(get_translation_memory_service),
+) -> TranslationMemoryLookup:
+    return await service.lookup(
+        text, source_locale=source_locale, target_locale=target_locale, limit=limit
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_translation_memory(
+    format: TranslationMemoryFormat = Query("tmx"),
+    scope: TranslationMemoryExportScope = Query("all"),
+    target_locale: str = Query(default=PRIMARY_LOCALE),
+) -> StreamingResponse:
+    """Stream approved submissions and glossary entries as TMX 1.4 or XLIFF 1.2."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        # The stream outlives the request-scoped session, so it opens its own, on the
+        # replica when one is configured.
+        async with get_read_sessionmaker()() as session:
+            exporter = TranslationMemoryExporter(session)
+            async for chunk in exporter.stream(format, scope, target_locale):
+                yield chunk
+
+    filename = TranslationMemoryExporter.filename(format)
+    return StreamingResponse(
+        chunks(),
+        media_type=TM_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
@@ -0,0 +1,132 @@
+"""Operational commands, run as ``python -m app.cli <command>``."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from .core.config import get_settings
+from .db.init_db import upgrade_schema
+from .db.session import get_sessionmaker
+from .services.archive import archive_submissions as archive_cold_submissions
+from .services.glossary_impact import GlossaryImpactService
+from .services.metrics import MetricsService
+from .services.near_duplicates import backfill_fingerprints as backfill_source_fingerprints
+from .services.rollups import DailyRollups
+from .services.search import SearchService
+from .services.status_counts import StatusCounter
+from .services.text_blobs import compact_text_storage
+from .services.usage_analytics import UsageAnalyticsService
+
+
+async def archive_submissions(args: argparse.Namespace) -> None:
+    """Move approved submissions older than the retention age to the archive table."""
+
+    settings = get_settings()
+    if settings.archive_after_days <= 0:
+        raise SystemExit("Set LEO_ARCHIVE_AFTER_DAYS to the retention age in days.")
+    archived = await archive_cold_submissions(
+        settings.archive_after_days, settings.archive_batch_size
+    )
+    print(f"Archived {archived} submissions; run VACUUM on SQLite to reclaim the freed space.")
+
+
+async def backfill_fingerprints(args: argparse.Namespace) -> None:
+    """Fingerprint submissions created before near-duplicate lookups existed."""
+
+    async with get_sessionmaker()() as session:
+        updated = await backfill_source_fingerprints(session)
+    print(f"Fingerprinted {updated} submissions.")
+
+
+async def backfill_edit_metrics(args: argparse.Namespace) -> None:
+    """Compute post-edit distance and time-to-approval for existing submissions."""
+
+    async with get_sessionmaker()() as session:
+        updated = await MetricsService(session).backfill_edit_metrics()
+        # The rollups carry the edit metrics too.
+        rows = await DailyRollups(session).rebuild()
+    print(f"Updated edit metrics on {updated} submissions; rebuilt {rows} daily rollup rows.")
+
+
+async def rebuild_daily_rollups(args: argparse.Namespace) -> None:
+    """Recompute the per-day metrics rollups from the submissions table."""
+
+    async with get_sessionmaker()() as session:
+        rows = await DailyRollups(session).rebuild()
+    print(f"Rebuilt {rows} daily rollup rows.")
+
+
+async def rebuild_glossary_index(args: argparse.Namespace) -> None:
+    """Rebuild the glossary term to submission index from stored drafts."""
+
+    async with get_sessionmaker()() as session:
+        written = await GlossaryImpactService(session).rebuild_index()
+    print(f"Indexed {written} glossary term usages.")
+
+
+async def rebuild_warning_index(args: argparse.Namespace) -> None:
+    """Rebuild structured submission warnings from the stored warning messages."""
+
+    async with get_sessionmaker()() as session:
+        written = await UsageAnalyticsService(session).rebuild_warning_index()
+    print(f"Indexed {written} submission warnings.")
+
+
+async def rebuild_status_counts(args: argparse.Namespace) -> None:
+    """Recount submissions per status into the status counter table."""
+
+    async with get_sessionmaker()() as session:
+        counts = await StatusCounter(session).rebuild()
+    print(", ".join(f"{status}={total}" for status, total in counts.items()))
+
+
+async def rebuild_search_index(args: argparse.Namespace) -> None:
+    """Re-index every submission for full-text search."""
+
+    async with get_sessionmaker()() as session:
+        indexed = await SearchService(session).rebuild()
+    print(f"Indexed {indexed} submissions for search.")
+
+
+async def compact_text(args: argparse.Namespace) -> None:
+    """Move inline prompts into the blob store and compress legacy text columns."""
+
+    async with get_sessionmaker()() as session:
+        rewritten = await compact_text_storage(session)
+    print(f"Compacted {rewritten} rows; run VACUUM on SQLite to reclaim the freed space.")
+
+
+COMMANDS: dict[str, Callable[[argparse.Namespace], Awaitable[None]]] = {
+    "archive-submissions": archive_submissions,
+    "backfill-edit-metrics": backfill_edit_metrics,
+    "backfill-fingerprints": backfill_fingerprints,
+    "compact-text-storage": compact_text,
+    "rebuild-daily-rollups": rebuild_daily_rollups,
+    "rebuild-glossary-index": rebuild_glossary_index,
+    "rebuild-search-index": rebuild_search_index,
+    "rebuild-status-counts": rebuild_status_counts,
+    "rebuild-warning-index": rebuild_warning_index,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, handler in COMMANDS.items():
+        subparsers.add_parser(name, help=(handler.__doc__ or "").strip())
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    await upgrade_schema()
+    await COMMANDS[args.command](args)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    main()
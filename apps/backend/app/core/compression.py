@@ -0,0 +1,49 @@
+"""Compression codecs for large stored text."""
+from __future__ import annotations
+
+import hashlib
+import zlib
+
+try:  # pragma: no cover - exercised only when the optional extra is installed
+    import zstandard
+except ImportError:  # pragma: no cover - zlib is always available
+    zstandard = None
+
+# The first byte of every compressed payload names its codec, so rows written with
+# zstd stay readable after switching back to zlib and vice versa.
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+_ZSTD = b"\x02"
+
+# Below this size the codec header and dictionary overhead outweigh any savings.
+MIN_COMPRESS_BYTES = 96
+
+
+def text_digest(text: str) -> str:
+    """Content address (SHA-256 hex) of ``text``."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_text(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return _RAW + raw
+    if zstandard is not None:
+        packed = _ZSTD + zstandard.ZstdCompressor(level=10).compress(raw)
+    else:
+        packed = _ZLIB + zlib.compress(raw, 9)
+    return packed if len(packed) < len(raw) + 1 else _RAW + raw
+
+
+def decompress_text(payload: bytes) -> str:
+    codec, body = payload[:1], payload[1:]
+    if codec == _RAW:
+        return body.decode("utf-8")
+    if codec == _ZLIB:
+        return zlib.decompress(body).decode("utf-8")
+    if codec == _ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed text requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress(body).decode("utf-8")
+    raise ValueError(f"Unknown text codec {codec!r}")
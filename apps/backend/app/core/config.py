@@ -1,6 +1,6 @@
 """Application settings and configuration helpers."""
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,6 +11,21 @@ class Settings(BaseSettings):
 
     database_url: str = "sqlite+aiosqlite:///./leo.db"
     database_echo: bool = False
+    # Read replica for listings, search, metrics and bulk exports; the primary serves
+    # every read when unset.
+    database_replica_url: Optional[str] = None
+    # PostgreSQL (asyncpg) connection pool; a 0 statement cache suits PgBouncer.
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = 1800
+    database_pool_pre_ping: bool = True
+    database_statement_cache_size: int = 100
+    # SQLite connection pragmas: WAL so readers never wait on a writer.
+    database_sqlite_wal: bool = True
+    database_sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    database_sqlite_busy_timeout_ms: int = 5000
+    database_sqlite_mmap_size: int = 256 * 1024 * 1024
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4.1-mini"
     openai_temperature: float = 0.3
@@ -21,6 +36,42 @@ class Settings(BaseSettings):
     seed_initial_glossary: bool = True
     initial_glossary_path: str = "app/data/initial_glossary.json"
     blocked_terms: list[str] = Field(default_factory=list)
+    near_duplicate_max_distance: int = 3
+    # Re-draft submissions that used a glossary term as soon as its Thai term changes.
+    glossary_auto_redraft: bool = False
+    redraft_concurrency: int = 4
+    # Bulk uploads insert this many rows per transaction, drafting up to
+    # ``bulk_ingest_concurrency`` of them at once.
+    bulk_ingest_batch_size: int = 200
+    bulk_ingest_concurrency: int = 8
+    # Group commit: single-submission creates arriving within this many milliseconds
+    # share one transaction (up to ``submission_group_commit_max_batch``); 0 disables.
+    submission_group_commit_ms: float = 0.0
+    submission_group_commit_max_batch: int = 64
+    # Approved submissions untouched for this many days move their text to the
+    # compressed archive table, ``archive_batch_size`` rows per transaction, every
+    # ``archive_interval_seconds``; 0 disables the background job.
+    archive_after_days: int = 0
+    archive_batch_size: int = 200
+    archive_interval_seconds: float = 3600.0
+    # Revision history stores full text every N revisions and token deltas in between.
+    revision_snapshot_interval: int = 20
+    # Latency/token/cost quantile sketches are kept in memory and written to
+    # ``metric_sketches`` this often; relative accuracy bounds each quantile's error.
+    metric_sketch_flush_seconds: float = 60.0
+    metric_sketch_relative_accuracy: float = 0.01
+    # DOCX exports render on a bounded "thread" or "process" pool, starting from this
+    # .docx template (python-docx's default when unset).
+    export_render_pool: Literal["thread", "process"] = "thread"
+    export_render_workers: int = 2
+    export_docx_template_path: Optional[str] = None
+    # Rendered single-submission exports are cached on disk in this directory (an
+    # absolute path) up to this many bytes, least recently used first out. The cache is
+    # off while the directory is unset or the byte budget is 0.
+    export_cache_dir: Optional[str] = None
+    export_cache_max_bytes: int = 256 * 1024 * 1024
+    # TMX/XLIFF imports commit this many translation units per transaction.
+    tm_import_batch_size: int = 1000
     # Comma-separated or JSON list via env: LEO_CORS_ALLOWED_ORIGINS
     cors_allowed_origins: list[str] = Field(
         default_factory=lambda: [
@@ -0,0 +1,74 @@
+"""Token-level text deltas used for compact revision storage."""
+from __future__ import annotations
+
+import re
+from difflib import SequenceMatcher
+from typing import Literal, Union
+
+# Latin words and numbers stay whole; whitespace runs are one token; everything else
+# (Thai, which has no word delimiters, and punctuation) is diffed per character.
+_TOKEN = re.compile(r"[A-Za-z0-9]+|\s+|.", re.DOTALL)
+
+# A delta is a list of ops applied left to right to the previous text's tokens:
+# ``n > 0`` keeps n tokens, ``n < 0`` skips n tokens, and a string is inserted.
+DeltaOp = Union[int, str]
+DiffOp = Literal["equal", "insert", "delete"]
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text)
+
+
+def _opcodes(old_tokens: list[str], new_tokens: list[str]):
+    return SequenceMatcher(None, old_tokens, new_tokens, autojunk=False).get_opcodes()
+
+
+def make_delta(old: str, new: str) -> list[DeltaOp]:
+    """Encode ``new`` as edits against ``old``."""
+
+    old_tokens, new_tokens = tokenize(old), tokenize(new)
+    delta: list[DeltaOp] = []
+    for tag, i1, i2, j1, j2 in _opcodes(old_tokens, new_tokens):
+        if tag == "equal":
+            delta.append(i2 - i1)
+            continue
+        if i2 > i1:
+            delta.append(i1 - i2)
+        if j2 > j1:
+            delta.append("".join(new_tokens[j1:j2]))
+    # A trailing keep is implied by the end of the delta.
+    if delta and isinstance(delta[-1], int) and delta[-1] > 0:
+        delta.pop()
+    return delta
+
+
+def apply_delta(old: str, delta: list[DeltaOp]) -> str:
+    tokens = tokenize(old)
+    position = 0
+    parts: list[str] = []
+    for op in delta:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.extend(tokens[position : position + op])
+            position += op
+        else:
+            position -= op
+    parts.extend(tokens[position:])
+    return "".join(parts)
+
+
+def diff_segments(old: str, new: str) -> list[tuple[DiffOp, str]]:
+    """Human-readable diff as ``(op, text)`` segments."""
+
+    old_tokens, new_tokens = tokenize(old), tokenize(new)
+    segments: list[tuple[DiffOp, str]] = []
+    for tag, i1, i2, j1, j2 in _opcodes(old_tokens, new_tokens):
+        if tag == "equal":
+            segments.append(("equal", "".join(old_tokens[i1:i2])))
+            continue
+        if i2 > i1:
+            segments.append(("delete", "".join(old_tokens[i1:i2])))
+        if j2 > j1:
+            segments.append(("insert", "".join(new_tokens[j1:j2])))
+    return segments
@@ -0,0 +1,32 @@
+"""Target locales supported by the translation pipeline."""
+from __future__ import annotations
+
+PRIMARY_LOCALE = "th"
+
+LOCALE_LANGUAGES: dict[str, str] = {
+    "th": "Thai",
+    "vi": "Vietnamese",
+    "id": "Bahasa Indonesia",
+    "ms": "Bahasa Melayu",
+}
+
+
+def language_name(locale: str) -> str:
+    return LOCALE_LANGUAGES[locale]
+
+
+def normalize_locales(locales: list[str] | None) -> list[str]:
+    """Lower-case, de-duplicate and validate locales, always leading with Thai.
+
+    Thai stays the primary locale because the review workflow (``thai_*`` columns)
+    is built around it; other locales fan out alongside it.
+    """
+
+    ordered = [PRIMARY_LOCALE]
+    for locale in locales or []:
+        normalized = locale.strip().lower()
+        if normalized not in LOCALE_LANGUAGES:
+            raise ValueError(f"Unsupported locale '{locale}'")
+        if normalized not in ordered:
+            ordered.append(normalized)
+    return ordered
@@ -0,0 +1,41 @@
+"""Text segmentation helpers for scripts written without spaces (Thai)."""
+from __future__ import annotations
+
+import re
+
+_THAI_RUN = re.compile(r"[฀-๿]+")
+_INDEX_TOKEN = re.compile(r"[\w฀-๿]+")
+
+
+def thai_bigrams(run: str) -> list[str]:
+    """Split a run of Thai characters into overlapping character bigrams."""
+
+    if len(run) < 2:
+        return [run]
+    return [run[index : index + 2] for index in range(len(run) - 1)]
+
+
+def _expand_thai(match: re.Match[str]) -> str:
+    return " " + " ".join(thai_bigrams(match.group())) + " "
+
+
+def segment_for_search(text: str) -> str:
+    """Lower-case ``text`` and expand Thai runs into space-separated bigrams.
+
+    Thai has no word delimiters, so a plain word tokenizer would index whole sentences
+    as single tokens. Indexing bigrams lets any substring of two or more characters match
+    without a dictionary-based word segmenter.
+    """
+
+    return _THAI_RUN.sub(_expand_thai, text.lower())
+
+
+def search_phrases(query: str) -> list[list[str]]:
+    """Split a user query into phrases of index tokens, one phrase per query word."""
+
+    phrases = []
+    for word in query.split():
+        tokens = _INDEX_TOKEN.findall(segment_for_search(word))
+        if tokens:
+            phrases.append(tokens)
+    return phrases
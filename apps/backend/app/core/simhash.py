@@ -0,0 +1,71 @@
+"""SimHash fingerprints and the bands used to look them up."""
+from __future__ import annotations
+
+import hashlib
+import re
+
+FINGERPRINT_BITS = 64
+BAND_COUNT = 4
+_BAND_BITS = FINGERPRINT_BITS // BAND_COUNT
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_NUMBER_PATTERN = re.compile(r"^\d[\d.,:/-]*$")
+
+
+def _tokens(text: str) -> list[str]:
+    # Numbers (prices, dates, SKUs) collapse to one placeholder so copy that only differs
+    # by those details lands on the same or a very close fingerprint.
+    return [
+        "#" if _NUMBER_PATTERN.match(token) else token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+    ]
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """Return an unsigned 64-bit SimHash of word unigrams and bigrams in ``text``."""
+
+    tokens = _tokens(text)
+    features = tokens + [f"{left} {right}" for left, right in zip(tokens, tokens[1:])]
+    if not features:
+        return 0
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        hashed = _feature_hash(feature)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if hashed >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def to_signed(fingerprint: int) -> int:
+    """Map an unsigned fingerprint onto the signed BIGINT range used for storage."""
+
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >= 1 << 63 else fingerprint
+
+
+def to_unsigned(stored: int) -> int:
+    return stored + (1 << FINGERPRINT_BITS) if stored < 0 else stored
+
+
+def bands(fingerprint: int) -> list[int]:
+    """Split ``fingerprint`` (unsigned, or signed as stored) into four 16-bit bands.
+
+    Two fingerprints within distance 3 must agree exactly on at least one band
+    (pigeonhole), so a lookup only has to compare against fingerprints sharing a band
+    value with the query.
+    """
+
+    return [fingerprint >> (band * _BAND_BITS) & _BAND_MASK for band in range(BAND_COUNT)]
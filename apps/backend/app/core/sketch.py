@@ -0,0 +1,115 @@
+"""Mergeable quantile sketches (DDSketch) for latency, token and cost distributions."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# Values at or below this are counted in the zero bucket rather than a log bin.
+MIN_INDEXABLE = 1e-9
+
+
+class DDSketch:
+    """Relative-error quantile sketch of non-negative values.
+
+    Values land in logarithmic bins of ratio ``gamma``, so every quantile is within
+    ``relative_accuracy`` of the true value. Sketches with the same accuracy merge
+    exactly by adding bin counts, which is what lets per-worker, per-bucket rows be
+    combined at query time. When more than ``max_bins`` bins are in use the lowest
+    ones are collapsed, trading accuracy at the bottom of the range for the tail.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: int = 1) -> None:
+        if value < 0 or math.isnan(value):
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value <= MIN_INDEXABLE:
+            self.zero_count += weight
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[index] = self.bins.get(index, 0) + weight
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += weight
+        self.sum += value * weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: DDSketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for index, weight in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + weight
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        # The extremes are tracked exactly.
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                value = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def average(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def _collapse(self) -> None:
+        ordered = sorted(self.bins)
+        excess = len(ordered) - self.max_bins
+        target = ordered[excess]
+        self.bins[target] += sum(self.bins.pop(index) for index in ordered[:excess])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(index): weight for index, weight in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], max_bins: int = 2048) -> DDSketch:
+        sketch = cls(data["relative_accuracy"], max_bins=max_bins)
+        sketch.bins = {int(index): weight for index, weight in data["bins"].items()}
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
@@ -1,8 +1,12 @@
 """Declarative base and mixins for ORM models."""
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 from sqlalchemy.types import DateTime
 
+from .types import UTCDateTime
+
 
 class Base(DeclarativeBase):
     """Base declarative class for all ORM models."""
@@ -10,12 +14,25 @@ class Base(DeclarativeBase):
     pass
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
-    """Mixin adding created/updated timestamps."""
+    """Mixin adding created/updated timestamps.
+
+    Values are generated client-side so they carry microseconds on every backend
+    (SQLite's ``CURRENT_TIMESTAMP`` only has second resolution), which keeps
+    ``(created_at, id)`` keyset cursors stable; the server defaults cover raw SQL inserts.
+    """
 
     created_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        UTCDateTime, default=utcnow, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        UTCDateTime,
+        default=utcnow,
+        server_default=func.now(),
+        onupdate=utcnow,
+        nullable=False,
     )
@@ -0,0 +1,40 @@
+"""DDL for the dialect-specific submission full-text index."""
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+SQLITE_FTS_TABLE = "submissions_fts"
+POSTGRES_SEARCH_TABLE = "submission_search"
+
+# Keep Thai combining vowels/tone marks (category M*) inside tokens; unicode61 would
+# otherwise treat them as separators.
+_SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "title, source_text, thai_draft, thai_final, "
+    "tokenize = \"unicode61 categories 'L* N* Co M*' remove_diacritics 0\")"
+)
+_POSTGRES_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {POSTGRES_SEARCH_TABLE} ("
+    "submission_id VARCHAR(36) PRIMARY KEY REFERENCES submissions(id) ON DELETE CASCADE, "
+    "document TSVECTOR NOT NULL)",
+    f"CREATE INDEX IF NOT EXISTS ix_{POSTGRES_SEARCH_TABLE}_document "
+    f"ON {POSTGRES_SEARCH_TABLE} USING GIN (document)",
+)
+
+
+def create_search_schema(conn: Connection) -> None:
+    """Create the full-text index structures for the connected backend."""
+
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(_SQLITE_DDL))
+    elif conn.dialect.name == "postgresql":
+        for statement in _POSTGRES_DDL:
+            conn.execute(text(statement))
+
+
+def drop_search_schema(conn: Connection) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}"))
+    elif conn.dialect.name == "postgresql":
+        conn.execute(text(f"DROP TABLE IF EXISTS {POSTGRES_SEARCH_TABLE}"))
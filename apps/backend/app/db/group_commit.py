@@ -0,0 +1,79 @@
+"""Group commit: concurrent writers share one transaction."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Batch(Generic[T]):
+    def __init__(self) -> None:
+        self.items: list[tuple[T, asyncio.Future[None]]] = []
+        self.full = asyncio.Event()
+
+
+class GroupCommitter(Generic[T]):
+    """Collect items submitted within ``window_seconds`` and write them with one call.
+
+    The first ``submit`` opens a batch; the batch is written by ``flush`` once the
+    window elapses or ``max_batch`` items have joined, and every submitter returns when
+    its batch is committed. If a batch fails, its items are retried one at a time so
+    only the offending item's submitter sees the error.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[None]],
+        window_seconds: float,
+        max_batch: int,
+    ) -> None:
+        self._flush = flush
+        self._window = window_seconds
+        self._max_batch = max(1, max_batch)
+        self._batch: _Batch[T] | None = None
+        # Flushes run as tasks so a cancelled submitter cannot abandon its batch.
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if self._batch is None:
+            self._batch = _Batch()
+            task = asyncio.create_task(self._run(self._batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch = self._batch
+        batch.items.append((item, future))
+        if len(batch.items) >= self._max_batch:
+            batch.full.set()
+            self._batch = None
+        await asyncio.shield(future)
+
+    async def _run(self, batch: _Batch[T]) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self._window)
+        except asyncio.TimeoutError:
+            pass
+        if self._batch is batch:
+            self._batch = None
+        items = batch.items
+        try:
+            await self._flush([item for item, _ in items])
+        except Exception as exc:
+            if len(items) == 1:
+                items[0][1].set_exception(exc)
+                return
+            for item, future in items:
+                await self._flush_one(item, future)
+            return
+        for _, future in items:
+            future.set_result(None)
+
+    async def _flush_one(self, item: T, future: asyncio.Future[None]) -> None:
+        try:
+            await self._flush([item])
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(None)
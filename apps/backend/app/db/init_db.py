@@ -4,21 +4,36 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from sqlalchemy import select
+from alembic import command
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import get_settings
 from ..models import GlossaryEntry
-from .base import Base
+from .migrations import BASELINE_REVISION, alembic_config
 from .session import get_engine
 
+_MIGRATION_LOCK_KEY = 0x4C454F  # "LEO"
 
-async def create_all() -> None:
-    """Create database tables if they do not yet exist."""
+
+async def upgrade_schema() -> None:
+    """Apply pending migrations (``app/db/migrations``) to the configured database."""
 
     engine = get_engine()
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade)
+
+
+def _upgrade(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        # Workers starting together would otherwise apply the same revision twice.
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+    config = alembic_config(conn)
+    tables = set(inspect(conn).get_table_names())
+    if "submissions" in tables and "alembic_version" not in tables:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
 
 
 async def seed_glossary(session: AsyncSession) -> None:
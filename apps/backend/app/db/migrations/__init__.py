@@ -0,0 +1,50 @@
+"""Alembic migrations for the application schema.
+
+``env.py`` and ``versions/`` are loaded by Alembic; this module holds what the app,
+the environment and the tests share.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from alembic.config import Config
+from sqlalchemy.engine import Connection
+
+from ..fts import POSTGRES_SEARCH_TABLE, SQLITE_FTS_TABLE
+from ..types import CompressedText
+
+MIGRATIONS_DIR = Path(__file__).parent
+# The schema ``Base.metadata.create_all`` built before the app shipped migrations.
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection: Connection) -> Config:
+    """Config that runs migrations on ``connection`` inside its transaction."""
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    return config
+
+
+def compare_type(
+    context: Any,
+    inspected_column: Any,
+    metadata_column: Any,
+    inspected_type: Any,
+    metadata_type: Any,
+) -> bool | None:
+    # ``CompressedText`` lives in plain TEXT columns (SQLite stores the compressed
+    # bytes there unchanged), so it is not a type change.
+    if isinstance(metadata_type, CompressedText):
+        return False
+    return None
+
+
+def include_name(name: str | None, type_: str, parent_names: Any) -> bool:
+    # The full-text tables (and SQLite's FTS5 shadow tables) are raw DDL from
+    # ``app.db.fts``, not models.
+    return type_ != "table" or not (name or "").startswith(
+        (SQLITE_FTS_TABLE, POSTGRES_SEARCH_TABLE)
+    )
@@ -0,0 +1,51 @@
+"""Alembic environment.
+
+``app.db.init_db.upgrade_schema`` runs migrations on the application's own connection
+(passed as ``config.attributes["connection"]``); the ``alembic`` command line builds an
+engine from the ``LEO_`` settings instead.
+"""
+from __future__ import annotations
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.migrations import compare_type, include_name
+from app.db.session import create_engine
+
+# Import the models so every table is registered on ``Base.metadata``.
+import app.models  # noqa: F401  isort: skip
+
+
+def _run(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=Base.metadata,
+        compare_type=compare_type,
+        include_name=include_name,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def _run_with_engine() -> None:
+    engine = create_engine(get_settings())
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(_run)
+    finally:
+        await engine.dispose()
+
+
+connection = context.config.attributes.get("connection")
+if connection is not None:
+    _run(connection)
+else:
+    if context.config.config_file_name is not None:
+        fileConfig(context.config.config_file_name)
+    asyncio.run(_run_with_engine())
@@ -0,0 +1,87 @@
+"""Baseline schema: glossary entries and submissions.
+
+Databases created by ``create_all`` before migrations existed hold exactly this schema
+and are stamped with this revision on their first upgrade.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "glossary_entries",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("source_term", sa.String(length=255), nullable=False),
+        sa.Column("thai_term", sa.String(length=255), nullable=False),
+        sa.Column("part_of_speech", sa.String(length=64), nullable=True),
+        sa.Column("context", sa.Text(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("is_sensitive", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_glossary_entries_source_term", "glossary_entries", ["source_term"], unique=True
+    )
+    op.create_table(
+        "submissions",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("tone", sa.String(length=64), nullable=True),
+        sa.Column("audience", sa.String(length=128), nullable=True),
+        sa.Column("channel", sa.String(length=128), nullable=True),
+        sa.Column("thai_draft", sa.Text(), nullable=False),
+        sa.Column("thai_final", sa.Text(), nullable=True),
+        sa.Column("translation_prompt", sa.Text(), nullable=True),
+        sa.Column("provider_name", sa.String(length=64), nullable=True),
+        sa.Column("usage_tokens", sa.Integer(), nullable=True),
+        sa.Column("cost_usd", sa.Float(), nullable=True),
+        sa.Column("glossary_terms", sa.JSON(), nullable=False),
+        sa.Column("warnings", sa.JSON(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("reviewer_notes", sa.Text(), nullable=True),
+        sa.Column("last_reviewed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("submissions")
+    op.drop_index("ix_glossary_entries_source_term", table_name="glossary_entries")
+    op.drop_table("glossary_entries")
@@ -0,0 +1,236 @@
+"""Per-locale translations, revisions, metrics, search, translation memory and archives.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:05:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.db.fts import create_search_schema, drop_search_schema
+from app.db.types import CompressedText, UTCDateTime
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", UTCDateTime, server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", UTCDateTime, server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _submission_fk() -> sa.Column:
+    return sa.Column(
+        "submission_id",
+        sa.String(length=36),
+        sa.ForeignKey("submissions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+
+def upgrade() -> None:
+    op.add_column("submissions", sa.Column("source_fingerprint", sa.BigInteger(), nullable=True))
+    op.add_column("submissions", sa.Column("prompt_sections", sa.JSON(), nullable=True))
+    op.add_column("submissions", sa.Column("post_edit_distance", sa.Integer(), nullable=True))
+    op.add_column("submissions", sa.Column("post_edit_ratio", sa.Float(), nullable=True))
+    op.add_column(
+        "submissions", sa.Column("time_to_approval_seconds", sa.Float(), nullable=True)
+    )
+    op.add_column("submissions", sa.Column("archived_at", UTCDateTime, nullable=True))
+    op.create_index(
+        "ix_submissions_status_created_at", "submissions", ["status", "created_at", "id"]
+    )
+    op.create_index("ix_submissions_created_at_id", "submissions", ["created_at", "id"])
+    op.create_index(
+        "ix_submissions_archive_candidates",
+        "submissions",
+        ["status", "archived_at", "created_at"],
+    )
+    for column in ("post_edit_distance", "post_edit_ratio", "time_to_approval_seconds"):
+        op.create_index(f"ix_submissions_{column}", "submissions", [column])
+
+    op.create_table(
+        "submission_translations",
+        _submission_fk(),
+        sa.Column("locale", sa.String(length=16), primary_key=True),
+        sa.Column("draft_text", CompressedText, nullable=False),
+        sa.Column("final_text", CompressedText, nullable=True),
+        sa.Column("translation_prompt", sa.Text(), nullable=True),
+        sa.Column("prompt_sections", sa.JSON(), nullable=True),
+        sa.Column("provider_name", sa.String(length=64), nullable=True),
+        sa.Column("usage_tokens", sa.Integer(), nullable=True),
+        sa.Column("cost_usd", sa.Float(), nullable=True),
+        sa.Column("warnings", sa.JSON(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_table(
+        "submission_revisions",
+        _submission_fk(),
+        sa.Column("revision", sa.Integer(), primary_key=True),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column("is_snapshot", sa.Boolean(), nullable=False),
+        sa.Column("thai_draft", CompressedText, nullable=True),
+        sa.Column("thai_final", CompressedText, nullable=True),
+        sa.Column("draft_delta", sa.JSON(), nullable=True),
+        sa.Column("final_delta", sa.JSON(), nullable=True),
+        sa.Column("has_final", sa.Boolean(), nullable=False),
+        sa.Column("created_at", UTCDateTime, nullable=False),
+    )
+    op.create_table(
+        "submission_archives",
+        _submission_fk(),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("archived_at", UTCDateTime, nullable=False),
+    )
+    op.create_table(
+        "submission_status_counts",
+        sa.Column("status", sa.String(length=32), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "submission_daily_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", sa.String(length=32), primary_key=True),
+        sa.Column("provider", sa.String(length=64), primary_key=True),
+        sa.Column("channel", sa.String(length=128), primary_key=True),
+        sa.Column("submissions", sa.Integer(), nullable=False),
+        sa.Column("usage_tokens", sa.BigInteger(), nullable=False),
+        sa.Column("cost_usd", sa.Float(), nullable=False),
+        sa.Column("with_warnings", sa.Integer(), nullable=False),
+        sa.Column("post_edit_ratio_sum", sa.Float(), nullable=False),
+        sa.Column("post_edit_ratio_count", sa.Integer(), nullable=False),
+        sa.Column("approval_seconds_sum", sa.Float(), nullable=False),
+        sa.Column("approval_seconds_count", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "submission_glossary_terms",
+        _submission_fk(),
+        sa.Column("source_term", sa.String(length=255), primary_key=True),
+        sa.Column("thai_term", sa.String(length=255), nullable=False),
+        sa.Column(
+            "glossary_entry_id",
+            sa.String(length=36),
+            sa.ForeignKey("glossary_entries.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_submission_glossary_terms_term",
+        "submission_glossary_terms",
+        ["source_term", "thai_term"],
+    )
+    op.create_index(
+        "ix_submission_glossary_terms_glossary_entry_id",
+        "submission_glossary_terms",
+        ["glossary_entry_id"],
+    )
+    op.create_table(
+        "submission_warnings",
+        _submission_fk(),
+        sa.Column("code", sa.String(length=32), primary_key=True),
+        sa.Column("term", sa.String(length=255), primary_key=True),
+    )
+    op.create_index("ix_submission_warnings_code_term", "submission_warnings", ["code", "term"])
+
+    op.create_table(
+        "metric_sketches",
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("metric", sa.String(length=64), primary_key=True),
+        sa.Column("provider", sa.String(length=64), primary_key=True),
+        sa.Column("worker", sa.String(length=128), primary_key=True),
+        sa.Column("sketch", sa.JSON(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_metric_sketches_metric_bucket", "metric_sketches", ["metric", "bucket_start"]
+    )
+    op.create_table(
+        "text_blobs",
+        sa.Column("digest", sa.String(length=64), primary_key=True),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.create_table(
+        "tm_imports",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("format", sa.String(length=16), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("head_digest", sa.String(length=80), nullable=True),
+        sa.Column("units_seen", sa.Integer(), nullable=False),
+        sa.Column("units_skipped", sa.Integer(), nullable=False),
+        sa.Column("units_imported", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_table(
+        "tm_units",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "import_id",
+            sa.String(length=36),
+            sa.ForeignKey("tm_imports.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("source_locale", sa.String(length=16), nullable=False),
+        sa.Column("target_locale", sa.String(length=16), nullable=False),
+        sa.Column("source_text", CompressedText, nullable=False),
+        sa.Column("target_text", CompressedText, nullable=False),
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("unit_hash", sa.String(length=64), nullable=False, unique=True),
+    )
+    op.create_index("ix_tm_units_import_id", "tm_units", ["import_id"])
+    op.create_index(
+        "ix_tm_units_source_hash_locales",
+        "tm_units",
+        ["source_hash", "source_locale", "target_locale"],
+    )
+
+    create_search_schema(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_search_schema(op.get_bind())
+    for table in (
+        "tm_units",
+        "tm_imports",
+        "text_blobs",
+        "metric_sketches",
+        "submission_warnings",
+        "submission_glossary_terms",
+        "submission_daily_rollups",
+        "submission_status_counts",
+        "submission_archives",
+        "submission_revisions",
+        "submission_translations",
+    ):
+        op.drop_table(table)
+    for index in (
+        "ix_submissions_time_to_approval_seconds",
+        "ix_submissions_post_edit_ratio",
+        "ix_submissions_post_edit_distance",
+        "ix_submissions_archive_candidates",
+        "ix_submissions_created_at_id",
+        "ix_submissions_status_created_at",
+    ):
+        op.drop_index(index, table_name="submissions")
+    with op.batch_alter_table("submissions") as batch:
+        for column in (
+            "archived_at",
+            "time_to_approval_seconds",
+            "post_edit_ratio",
+            "post_edit_distance",
+            "prompt_sections",
+            "source_fingerprint",
+        ):
+            batch.drop_column(column)
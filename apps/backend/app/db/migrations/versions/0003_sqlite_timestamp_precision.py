@@ -0,0 +1,37 @@
+"""Rewrite second-resolution SQLite timestamps in the format SQLAlchemy binds.
+
+Rows written via ``CURRENT_TIMESTAMP`` store ``YYYY-MM-DD HH:MM:SS`` while bound
+parameters carry microseconds, so equality on ``created_at`` (used by keyset
+pagination) would never match them. Only the baseline tables ever relied on the
+server default; the app has generated timestamps client-side since.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:10:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for table in ("glossary_entries", "submissions"):
+        for column in ("created_at", "updated_at"):
+            op.execute(
+                sa.text(
+                    f"UPDATE {table} SET {column} = {column} || '.000000' "
+                    f"WHERE length({column}) = 19"
+                )
+            )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,46 @@
+"""Indexed SimHash bands for database-side near-duplicate lookups.
+
+Existing fingerprints are split in SQL; both SQLite and PostgreSQL shift signed
+integers arithmetically, so masking yields the same bands as ``app.core.simhash``.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:15:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+_BANDS = range(4)
+
+
+def upgrade() -> None:
+    for band in _BANDS:
+        op.add_column("submissions", sa.Column(f"source_band_{band}", sa.Integer(), nullable=True))
+    op.execute(
+        sa.text(
+            "UPDATE submissions SET "
+            + ", ".join(
+                f"source_band_{band} = (source_fingerprint >> {band * 16}) & 65535"
+                for band in _BANDS
+            )
+            + " WHERE source_fingerprint IS NOT NULL"
+        )
+    )
+    for band in _BANDS:
+        op.create_index(
+            f"ix_submissions_source_band_{band}", "submissions", [f"source_band_{band}"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("submissions") as batch:
+        for band in _BANDS:
+            batch.drop_index(f"ix_submissions_source_band_{band}")
+            batch.drop_column(f"source_band_{band}")
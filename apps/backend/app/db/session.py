@@ -1,14 +1,117 @@
 """Database session and engine management."""
 from collections.abc import AsyncGenerator
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from ..core.config import get_settings
+from ..core.config import Settings, get_settings
 
 _engine: Optional[AsyncEngine] = None
 _sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
 _cached_dsn: Optional[str] = None
+# Engine for read-only traffic when ``database_replica_url`` is set.
+_read_engine: Optional[AsyncEngine] = None
+_read_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+_cached_read_dsn: Optional[str] = None
+
+
+def database_url(settings: Settings, url: Optional[str] = None) -> str:
+    """The configured URL (or ``url``), with bare ``postgres(ql)://`` URLs on asyncpg."""
+
+    url = url or settings.database_url
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix) :]
+    return url
+
+
+def engine_options(
+    settings: Settings, url: Optional[str] = None, read_only: bool = False
+) -> dict[str, Any]:
+    """``create_async_engine`` keyword arguments for the configured backend."""
+
+    backend = make_url(database_url(settings, url)).get_backend_name()
+    options: dict[str, Any] = {"echo": settings.database_echo, "future": True}
+    if backend == "postgresql":
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=settings.database_pool_pre_ping,
+            connect_args={
+                # SQLAlchemy's prepared statement cache and asyncpg's own; set both to 0
+                # behind PgBouncer in transaction pooling mode.
+                "prepared_statement_cache_size": settings.database_statement_cache_size,
+                "statement_cache_size": settings.database_statement_cache_size,
+            },
+        )
+        if read_only:
+            # Guards against writes even if the replica URL points at the primary.
+            options["connect_args"]["server_settings"] = {
+                "default_transaction_read_only": "on"
+            }
+    elif backend == "sqlite":
+        # Seconds the driver waits on a locked database before raising.
+        options["connect_args"] = {"timeout": settings.database_sqlite_busy_timeout_ms / 1000}
+    return options
+
+
+def sqlite_pragmas(
+    settings: Settings, in_memory: bool = False, read_only: bool = False
+) -> list[str]:
+    """Per-connection SQLite settings.
+
+    WAL lets readers proceed while a write is in progress, and ``synchronous=NORMAL``
+    is durable in WAL mode except for the last commits on power loss. The journal mode
+    is persistent in the file, but is re-asserted on every connection so existing
+    databases switch over; in-memory databases cannot use WAL.
+    """
+
+    pragmas = [f"PRAGMA busy_timeout={int(settings.database_sqlite_busy_timeout_ms)}"]
+    if settings.database_sqlite_wal and not in_memory:
+        pragmas += [
+            "PRAGMA journal_mode=WAL",
+            f"PRAGMA synchronous={settings.database_sqlite_synchronous}",
+        ]
+    if settings.database_sqlite_mmap_size and not in_memory:
+        pragmas.append(f"PRAGMA mmap_size={int(settings.database_sqlite_mmap_size)}")
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def create_engine(
+    settings: Settings, url: Optional[str] = None, read_only: bool = False
+) -> AsyncEngine:
+    """Build an engine tuned for the configured backend (see ``engine_options``).
+
+    ``url`` overrides ``settings.database_url``; ``read_only`` engines reject writes.
+    """
+
+    url = database_url(settings, url)
+    engine = create_async_engine(url, **engine_options(settings, url, read_only))
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        pragmas = sqlite_pragmas(
+            settings, in_memory=parsed.database in (None, "", ":memory:"), read_only=read_only
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return engine
 
 
 def _ensure_engine() -> None:
@@ -16,15 +119,24 @@ def _ensure_engine() -> None:
 
     settings = get_settings()
     if _engine is None or _cached_dsn != settings.database_url:
-        _engine = create_async_engine(
-            settings.database_url,
-            echo=settings.database_echo,
-            future=True,
-        )
+        _engine = create_engine(settings)
         _sessionmaker = async_sessionmaker(bind=_engine, expire_on_commit=False)
         _cached_dsn = settings.database_url
 
 
+def _ensure_read_engine() -> None:
+    global _read_engine, _read_sessionmaker, _cached_read_dsn
+
+    settings = get_settings()
+    replica = settings.database_replica_url
+    if not replica:
+        _read_engine = _read_sessionmaker = _cached_read_dsn = None
+    elif _read_engine is None or _cached_read_dsn != replica:
+        _read_engine = create_engine(settings, url=replica, read_only=True)
+        _read_sessionmaker = async_sessionmaker(bind=_read_engine, expire_on_commit=False)
+        _cached_read_dsn = replica
+
+
 def get_engine() -> AsyncEngine:
     """Return the configured async engine instance."""
 
@@ -42,8 +154,37 @@ def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency that provides an async database session."""
+    """FastAPI dependency that provides an async database session.
+
+    The session checks out a connection on its first statement, so endpoints that
+    never reach the database (e.g. ``/translate`` with a warm glossary cache) leave the
+    pool alone.
+    """
+
+    async with get_sessionmaker()() as session:
+        yield session
+
+
+def get_read_engine() -> AsyncEngine:
+    """Engine for read-only queries: the replica if configured, else the primary."""
+
+    _ensure_read_engine()
+    return _read_engine or get_engine()
+
+
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Sessionmaker for read-only work; falls back to the primary without a replica.
+
+    Replicas lag the primary, so reads that must see the caller's own writes (e.g.
+    fetching a submission right after saving it) stay on ``get_sessionmaker``.
+    """
+
+    _ensure_read_engine()
+    return _read_sessionmaker or get_sessionmaker()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that provides a session on the read engine."""
 
-    session_factory = get_sessionmaker()
-    async with session_factory() as session:
+    async with get_read_sessionmaker()() as session:
         yield session
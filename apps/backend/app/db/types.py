@@ -0,0 +1,64 @@
+"""Custom column types."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import DateTime, LargeBinary, Text, TypeDecorator, TypeEngine
+
+from ..core.compression import compress_text, decompress_text
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text stored compressed on SQLite and as plain ``TEXT`` elsewhere.
+
+    PostgreSQL already compresses large values out of line (TOAST), so only SQLite
+    needs help. Existing SQLite ``TEXT`` columns accept the compressed blobs unchanged,
+    and rows written before compression was enabled still read back as strings.
+    Values are only decompressed when the column is actually loaded, which list views
+    avoid by selecting summary columns.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> Any:
+        if value is None or dialect.name != "sqlite":
+            return value
+        return compress_text(value)
+
+    def result_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Callable[[Any], str | None] | None:
+        if dialect.name != "sqlite":
+            return super().result_processor(dialect, coltype)
+
+        def process(value: Any) -> str | None:
+            if value is None or isinstance(value, str):
+                return value
+            return decompress_text(bytes(value))
+
+        return process
+
+
+class UTCDateTime(TypeDecorator[datetime]):
+    """``DateTime(timezone=True)`` that always loads timezone-aware UTC values.
+
+    SQLite drops the offset on storage, so without this a row read back there differs
+    from the instance that was just written, and responses built from the written
+    instance (instead of a re-select) would not match later reads.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_result_value(self, value: datetime | None, dialect: Dialect) -> datetime | None:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -0,0 +1,14 @@
+"""Dialect-aware ``INSERT ... ON CONFLICT`` helpers."""
+from __future__ import annotations
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(session: AsyncSession, table: Table):
+    """Return an insert construct supporting ``on_conflict_do_*`` for the bound dialect."""
+
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
@@ -6,18 +6,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from .core.cache import GlossaryCache
 from .core.config import get_settings
-from .db.session import get_session
+from .db.group_commit import GroupCommitter
+from .db.session import get_read_session, get_session, get_sessionmaker
 from .services.glossary import GlossaryService
+from .services.glossary_impact import GlossaryImpactService
 from .services.metrics import MetricsService
+from .services.near_duplicates import NearDuplicateService
 from .services.orchestrator import TranslationOrchestrator
 from .services.providers.google_translate_provider import GoogleTranslateProvider
 from .services.providers.openai_provider import OpenAITranslationProvider
-from .services.submission import SubmissionService
+from .services.revisions import RevisionService
+from .services.search import SearchService
+from .services.sketches import MetricSketchService
+from .services.submission import SubmissionDraft, SubmissionService
 from .services.translation import TranslationService
+from .services.translation_memory import TranslationMemoryService
+from .services.usage_analytics import UsageAnalyticsService
 
 _glossary_cache = GlossaryCache(ttl_seconds=300)
 _orchestrator_cache: TranslationOrchestrator | None = None
 _orchestrator_providers: tuple[str, ...] | None = None
+_group_commit: GroupCommitter[SubmissionDraft] | None = None
+_group_commit_config: tuple[float, int] | None = None
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -27,6 +37,13 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Expose a session on the read replica (the primary when none is configured)."""
+
+    async for session in get_read_session():
+        yield session
+
+
 async def get_glossary_service(
     session: AsyncSession = Depends(get_db_session),
 ) -> GlossaryService:
@@ -35,6 +52,22 @@ async def get_glossary_service(
     return GlossaryService(session=session, cache=_glossary_cache)
 
 
+async def get_glossary_impact_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> GlossaryImpactService:
+    """Provide glossary term to submission lookups."""
+
+    return GlossaryImpactService(session=session)
+
+
+async def get_search_service(
+    session: AsyncSession = Depends(get_read_db_session),
+) -> SearchService:
+    """Provide full-text search over submissions."""
+
+    return SearchService(session=session)
+
+
 def get_translation_orchestrator() -> TranslationOrchestrator | None:
     """Provide a cached orchestrator based on configured providers."""
 
@@ -81,18 +114,132 @@ def get_translation_service(
     )
 
 
+async def get_near_duplicate_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> NearDuplicateService:
+    """Provide near-duplicate lookups scoped per request."""
+
+    return NearDuplicateService(
+        session=session, max_distance=get_settings().near_duplicate_max_distance
+    )
+
+
+async def get_revision_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> RevisionService:
+    """Provide submission revision history."""
+
+    return RevisionService(
+        session=session, snapshot_interval=get_settings().revision_snapshot_interval
+    )
+
+
+async def _persist_submission_drafts(drafts: list[SubmissionDraft]) -> None:
+    async with get_sessionmaker()() as session:
+        await build_submission_service(session).persist_drafts(drafts)
+
+
+def get_submission_group_commit() -> GroupCommitter[SubmissionDraft] | None:
+    """Provide the shared group committer for creates, or None when it is disabled."""
+
+    global _group_commit, _group_commit_config
+
+    settings = get_settings()
+    if settings.submission_group_commit_ms <= 0:
+        _group_commit = _group_commit_config = None
+        return None
+    config = (settings.submission_group_commit_ms, settings.submission_group_commit_max_batch)
+    if _group_commit is None or _group_commit_config != config:
+        _group_commit = GroupCommitter(
+            _persist_submission_drafts,
+            window_seconds=config[0] / 1000,
+            max_batch=config[1],
+        )
+        _group_commit_config = config
+    return _group_commit
+
+
 async def get_submission_service(
     session: AsyncSession = Depends(get_db_session),
     translation_service: TranslationService = Depends(get_translation_service),
+    near_duplicates: NearDuplicateService = Depends(get_near_duplicate_service),
+    revisions: RevisionService = Depends(get_revision_service),
+    group_commit: GroupCommitter[SubmissionDraft] | None = Depends(get_submission_group_commit),
 ) -> SubmissionService:
     """Provide the submission workflow service."""
 
-    return SubmissionService(session=session, translation_service=translation_service)
+    return SubmissionService(
+        session=session,
+        translation_service=translation_service,
+        near_duplicates=near_duplicates,
+        revisions=revisions,
+        group_commit=group_commit,
+    )
+
+
+async def get_submission_reader(
+    session: AsyncSession = Depends(get_read_db_session),
+) -> SubmissionService:
+    """Provide a SubmissionService on the read replica for listings and counts."""
+
+    return build_submission_service(session)
 
 
 async def get_metrics_service(
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_read_db_session),
 ) -> MetricsService:
     """Provide analytics helper."""
 
     return MetricsService(session=session)
+
+
+async def get_usage_analytics_service(
+    session: AsyncSession = Depends(get_read_db_session),
+) -> UsageAnalyticsService:
+    """Provide glossary usage and warning analytics."""
+
+    return UsageAnalyticsService(session)
+
+
+async def get_metric_sketch_service(
+    session: AsyncSession = Depends(get_read_db_session),
+) -> MetricSketchService:
+    """Provide the quantile sketch reader."""
+
+    return MetricSketchService(session)
+
+
+async def get_translation_memory_service(
+    session: AsyncSession = Depends(get_db_session),
+) -> TranslationMemoryService:
+    """Provide translation memory imports and lookups."""
+
+    return TranslationMemoryService(session)
+
+
+def build_submission_service(session: AsyncSession) -> SubmissionService:
+    """Assemble a SubmissionService outside a request, e.g. for background jobs."""
+
+    settings = get_settings()
+    translation_service = TranslationService(
+        settings=settings,
+        glossary_service=GlossaryService(session=session, cache=_glossary_cache),
+        orchestrator=get_translation_orchestrator(),
+    )
+    near_duplicates = NearDuplicateService(
+        session=session, max_distance=settings.near_duplicate_max_distance
+    )
+    return SubmissionService(
+        session=session,
+        translation_service=translation_service,
+        near_duplicates=near_duplicates,
+        revisions=RevisionService(
+            session=session, snapshot_interval=settings.revision_snapshot_interval
+        ),
+    )
+
+
+async def redraft_submission_in_session(session: AsyncSession, submission_id: str) -> None:
+    """Background-job entrypoint re-drafting one submission in its own session."""
+
+    await build_submission_service(session).redraft_submission(submission_id)
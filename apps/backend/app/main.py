@@ -1,22 +1,50 @@
 """FastAPI application entrypoint."""
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .api.routes import glossary, health, metrics, submissions, translate
+from .api.routes import glossary, health, metrics, submissions, translate, translation_memory
 from .core.config import get_settings
-from .db.init_db import create_all, seed_glossary
+from .db.init_db import seed_glossary, upgrade_schema
 from .db.session import get_sessionmaker
+from .services.archive import run_periodic_archival
+from .services.docx_render import shutdown_docx_pool
+from .services.rollups import DailyRollups
+from .services.sketches import flush_sketches, run_periodic_flush
+from .services.status_counts import StatusCounter
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pragma: no cover - framework hook
-    await create_all()
+    await upgrade_schema()
     session_factory = get_sessionmaker()
     async with session_factory() as session:
         await seed_glossary(session)
-    yield
+        await StatusCounter(session).ensure_initialized()
+        await DailyRollups(session).ensure_initialized()
+    settings = get_settings()
+    tasks = [asyncio.create_task(run_periodic_flush(settings.metric_sketch_flush_seconds))]
+    if settings.archive_after_days > 0:
+        tasks.append(
+            asyncio.create_task(
+                run_periodic_archival(
+                    settings.archive_after_days,
+                    settings.archive_batch_size,
+                    settings.archive_interval_seconds,
+                )
+            )
+        )
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await flush_sketches()
+        shutdown_docx_pool()
 
 
 def create_app() -> FastAPI:
@@ -45,6 +73,7 @@ def create_app() -> FastAPI:
     app.include_router(metrics.router)
     app.include_router(submissions.router)
     app.include_router(translate.router)
+    app.include_router(translation_memory.router)
 
     @app.get("/", tags=["root"])
     async def root() -> dict[str, str]:
@@ -1,5 +1,33 @@
 """Expose ORM models for application imports."""
 from .glossary import GlossaryEntry
-from .submission import Submission, SubmissionStatus
+from .metric_sketch import MetricSketch
+from .submission import (
+    Submission,
+    SubmissionArchive,
+    SubmissionDailyRollup,
+    SubmissionGlossaryTerm,
+    SubmissionRevision,
+    SubmissionStatus,
+    SubmissionStatusCount,
+    SubmissionTranslation,
+    SubmissionWarning,
+)
+from .text_blob import TextBlob
+from .translation_memory import TranslationMemoryImport, TranslationMemoryUnit
 
-__all__ = ["GlossaryEntry", "Submission", "SubmissionStatus"]
+__all__ = [
+    "GlossaryEntry",
+    "MetricSketch",
+    "Submission",
+    "SubmissionArchive",
+    "SubmissionDailyRollup",
+    "SubmissionGlossaryTerm",
+    "SubmissionRevision",
+    "SubmissionStatus",
+    "SubmissionStatusCount",
+    "SubmissionTranslation",
+    "SubmissionWarning",
+    "TextBlob",
+    "TranslationMemoryImport",
+    "TranslationMemoryUnit",
+]
@@ -0,0 +1,32 @@
+"""ORM model for flushed quantile sketches."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base, utcnow
+
+
+class MetricSketch(Base):
+    """One worker's DDSketch of a metric for an hourly bucket.
+
+    Each worker only rewrites its own rows, so flushes never contend; readers merge
+    every worker's sketch for the buckets they need.
+    """
+
+    __tablename__ = "metric_sketches"
+    __table_args__ = (Index("ix_metric_sketches_metric_bucket", "metric", "bucket_start"),)
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    metric: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # ``""`` when the value is not attributed to a provider.
+    provider: Mapped[str] = mapped_column(String(64), primary_key=True, default="")
+    worker: Mapped[str] = mapped_column(String(128), primary_key=True)
+    # ``DDSketch.to_dict()``.
+    sketch: Mapped[dict] = mapped_column(JSON, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, nullable=False
+    )
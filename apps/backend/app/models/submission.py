@@ -2,12 +2,28 @@
 from __future__ import annotations
 
 import uuid
+from datetime import date, datetime
 from enum import Enum
 
-from sqlalchemy import JSON, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from ..db.base import Base, TimestampMixin
+from ..core.simhash import bands
+from ..db.base import Base, TimestampMixin, utcnow
+from ..db.types import CompressedText, UTCDateTime
 
 
 class SubmissionStatus(str, Enum):
@@ -19,19 +35,35 @@ class SubmissionStatus(str, Enum):
 
 class Submission(TimestampMixin, Base):
     __tablename__ = "submissions"
+    __table_args__ = (
+        # Status tabs and the default listing both page on (created_at, id).
+        Index("ix_submissions_status_created_at", "status", "created_at", "id"),
+        Index("ix_submissions_created_at_id", "created_at", "id"),
+        # Finds approved rows that are not archived yet, oldest first.
+        Index("ix_submissions_archive_candidates", "status", "archived_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    source_text: Mapped[str] = mapped_column(Text, nullable=False)
+    source_text: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    # Signed 64-bit SimHash of ``source_text`` used for near-duplicate lookups, and its
+    # four 16-bit bands, which the lookups filter on (see ``fingerprint_columns``).
+    source_fingerprint: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    source_band_0: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    source_band_1: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    source_band_2: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    source_band_3: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     tone: Mapped[str | None] = mapped_column(String(64), nullable=True)
     audience: Mapped[str | None] = mapped_column(String(128), nullable=True)
     channel: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
-    thai_draft: Mapped[str] = mapped_column(Text, nullable=False)
-    thai_final: Mapped[str | None] = mapped_column(Text, nullable=True)
+    thai_draft: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    thai_final: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    # Legacy inline prompt; new rows reference ``text_blobs`` via ``prompt_sections``.
     translation_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
+    prompt_sections: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     provider_name: Mapped[str | None] = mapped_column(String(64), nullable=True)
     usage_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     cost_usd: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -42,7 +74,167 @@ class Submission(TimestampMixin, Base):
 
     status: Mapped[str] = mapped_column(String(32), default=SubmissionStatus.EDITING.value)
     reviewer_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    last_reviewed_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_reviewed_at: Mapped[DateTime | None] = mapped_column(UTCDateTime, nullable=True)
+
+    # Quality/turnaround metrics maintained on write so dashboards aggregate them in SQL.
+    post_edit_distance: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    post_edit_ratio: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
+    time_to_approval_seconds: Mapped[float | None] = mapped_column(
+        Float, nullable=True, index=True
+    )
+    # Set when the text columns were moved to ``submission_archives``; the row keeps
+    # the metadata and metrics, with empty text, as a stub.
+    archived_at: Mapped[datetime | None] = mapped_column(UTCDateTime, nullable=True)
+
+    # Drafts for locales other than Thai, which keeps the ``thai_*`` columns above.
+    translations: Mapped[list[SubmissionTranslation]] = relationship(
+        back_populates="submission",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="SubmissionTranslation.locale",
+    )
 
     def __repr__(self) -> str:  # pragma: no cover - repr helper
         return f"Submission(id={self.id!r}, title={self.title!r}, status={self.status!r})"
+
+
+def fingerprint_columns(fingerprint: int) -> dict[str, int]:
+    """``Submission`` column values storing a signed ``fingerprint`` and its bands."""
+
+    return {
+        "source_fingerprint": fingerprint,
+        **{f"source_band_{band}": value for band, value in enumerate(bands(fingerprint))},
+    }
+
+
+class SubmissionTranslation(TimestampMixin, Base):
+    """Per-locale draft and final copy for a submission."""
+
+    __tablename__ = "submission_translations"
+
+    submission_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    locale: Mapped[str] = mapped_column(String(16), primary_key=True)
+    draft_text: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    final_text: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    translation_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)
+    prompt_sections: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
+    provider_name: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    usage_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cost_usd: Mapped[float | None] = mapped_column(Float, nullable=True)
+    warnings: Mapped[list[str]] = mapped_column(JSON, default=list)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    submission: Mapped[Submission] = relationship(back_populates="translations")
+
+
+class SubmissionRevision(Base):
+    """One saved state of a submission's draft and final copy.
+
+    Every ``revision_snapshot_interval``-th revision stores full text; the others store
+    token deltas against the previous revision (see ``app.core.delta``).
+    """
+
+    __tablename__ = "submission_revisions"
+
+    submission_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    revision: Mapped[int] = mapped_column(Integer, primary_key=True)
+    reason: Mapped[str] = mapped_column(String(32), nullable=False)
+    is_snapshot: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    thai_draft: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    thai_final: Mapped[str | None] = mapped_column(CompressedText, nullable=True)
+    draft_delta: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    final_delta: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    # Distinguishes "no final copy yet" from an empty final in delta revisions.
+    has_final: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, default=utcnow, nullable=False)
+
+
+class SubmissionArchive(Base):
+    """Compressed text of an archived submission and its per-locale translations.
+
+    ``payload`` is a compressed JSON document (see ``app.services.archive``), so a
+    cold submission costs one row here instead of wide rows in the hot tables.
+    """
+
+    __tablename__ = "submission_archives"
+
+    submission_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(UTCDateTime, default=utcnow, nullable=False)
+
+
+class SubmissionStatusCount(Base):
+    """Running submission totals per status, adjusted on every status transition."""
+
+    __tablename__ = "submission_status_counts"
+
+    status: Mapped[str] = mapped_column(String(32), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SubmissionDailyRollup(Base):
+    """Per-day submission aggregates, adjusted in the same transaction as each write.
+
+    Rows are keyed by the UTC day a submission was created; missing provider or channel
+    values are stored as ``""`` because they are part of the primary key.
+    """
+
+    __tablename__ = "submission_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), primary_key=True)
+    provider: Mapped[str] = mapped_column(String(64), primary_key=True, default="")
+    channel: Mapped[str] = mapped_column(String(128), primary_key=True, default="")
+    submissions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    usage_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cost_usd: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    with_warnings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Sum/count pairs so averages can be combined across rows and days.
+    post_edit_ratio_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    post_edit_ratio_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    approval_seconds_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    approval_seconds_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class SubmissionGlossaryTerm(Base):
+    """Normalized glossary term usage per submission, indexed for reverse lookups."""
+
+    __tablename__ = "submission_glossary_terms"
+    __table_args__ = (
+        Index("ix_submission_glossary_terms_term", "source_term", "thai_term"),
+    )
+
+    submission_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Lower-cased, whitespace-collapsed English term.
+    source_term: Mapped[str] = mapped_column(String(255), primary_key=True)
+    thai_term: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Null for rows indexed before entry ids were recorded, or whose entry was deleted.
+    glossary_entry_id: Mapped[str | None] = mapped_column(
+        String(36),
+        ForeignKey("glossary_entries.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
+
+class SubmissionWarning(Base):
+    """One structured warning on a submission's primary draft, e.g. a blocked term."""
+
+    __tablename__ = "submission_warnings"
+    __table_args__ = (Index("ix_submission_warnings_code_term", "code", "term"),)
+
+    submission_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("submissions.id", ondelete="CASCADE"), primary_key=True
+    )
+    # See ``app.services.usage_analytics`` for the codes.
+    code: Mapped[str] = mapped_column(String(32), primary_key=True)
+    # Lower-cased term the warning is about; ``""`` when it is not about a term.
+    term: Mapped[str] = mapped_column(String(255), primary_key=True, default="")
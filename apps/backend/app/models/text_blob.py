@@ -0,0 +1,23 @@
+"""ORM model for content-addressed text blobs."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base, utcnow
+
+
+class TextBlob(Base):
+    """Compressed text stored once per distinct content (SHA-256 of the UTF-8 text)."""
+
+    __tablename__ = "text_blobs"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # Codec byte followed by the payload; see ``app.core.compression``.
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
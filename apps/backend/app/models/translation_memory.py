@@ -0,0 +1,57 @@
+"""ORM models for imported translation memory."""
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base, TimestampMixin
+from ..db.types import CompressedText
+
+
+class TranslationMemoryImport(TimestampMixin, Base):
+    """Progress of one TMX/XLIFF upload.
+
+    ``units_seen`` only advances when a batch commits, so a re-upload of the same file
+    with this import's id skips exactly the units that are already stored.
+    """
+
+    __tablename__ = "tm_imports"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4()), nullable=False
+    )
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # ``tmx`` or ``xliff``, detected from the root element.
+    format: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # ``running`` (including uploads that were cut off), ``completed`` or ``failed``.
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="running")
+    # ``<length>:<sha256>`` of the first 64 KiB, to reject resuming with another file.
+    head_digest: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    units_seen: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    units_skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    units_imported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class TranslationMemoryUnit(Base):
+    """One source/target segment pair, de-duplicated across imports by ``unit_hash``."""
+
+    __tablename__ = "tm_units"
+    __table_args__ = (
+        Index("ix_tm_units_source_hash_locales", "source_hash", "source_locale", "target_locale"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    import_id: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("tm_imports.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    source_locale: Mapped[str] = mapped_column(String(16), nullable=False)
+    target_locale: Mapped[str] = mapped_column(String(16), nullable=False)
+    source_text: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    target_text: Mapped[str] = mapped_column(CompressedText, nullable=False)
+    # SHA-256 of the whitespace-normalized source, for exact-match lookups.
+    source_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # SHA-256 over both locales and both texts; identical pairs are stored once.
+    unit_hash: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
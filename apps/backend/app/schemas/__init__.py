@@ -5,24 +5,104 @@ from .glossary import (
     GlossaryEntryList,
     GlossaryEntryRead,
     GlossaryEntryUpdate,
+    GlossaryImpactItem,
+    GlossaryImpactList,
+    GlossaryRedraftQueued,
+)
+from .metrics import (
+    GlossaryUsage,
+    GlossaryUsageItem,
+    MetricDistribution,
+    MetricPercentiles,
+    MetricsOverview,
+    MetricsTimeseries,
+    MetricsTimeseriesPoint,
+    SketchMetric,
+    TimeseriesGroup,
+    WarningBreakdown,
+    WarningCodeBreakdown,
+    WarningTermCount,
 )
-from .metrics import MetricsOverview
 from .submission import (
+    DiffSegment,
+    NearDuplicateList,
+    NearDuplicateMatch,
+    NearDuplicateQuery,
+    SubmissionBulkFilter,
+    SubmissionBulkTransition,
+    SubmissionBulkTransitionResult,
     SubmissionCreate,
+    SubmissionFilter,
     SubmissionList,
     SubmissionRead,
+    SubmissionRevisionDiff,
+    SubmissionRevisionList,
+    SubmissionRevisionRead,
+    SubmissionRevisionSummary,
+    SubmissionSearchHit,
+    SubmissionSearchResults,
+    SubmissionStatusCounts,
+    SubmissionSummary,
+    SubmissionTransitionOutcome,
+    SubmissionTranslationRead,
     SubmissionUpdate,
 )
+from .translation_memory import (
+    TranslationMemoryExportScope,
+    TranslationMemoryFormat,
+    TranslationMemoryImportRead,
+    TranslationMemoryImportStatus,
+    TranslationMemoryLookup,
+    TranslationMemoryMatch,
+)
 
 __all__ = [
+    "DiffSegment",
     "GlossaryEntryBase",
     "GlossaryEntryCreate",
     "GlossaryEntryList",
     "GlossaryEntryRead",
     "GlossaryEntryUpdate",
+    "GlossaryImpactItem",
+    "GlossaryImpactList",
+    "GlossaryRedraftQueued",
+    "GlossaryUsage",
+    "GlossaryUsageItem",
+    "MetricDistribution",
+    "MetricPercentiles",
     "MetricsOverview",
+    "MetricsTimeseries",
+    "MetricsTimeseriesPoint",
+    "NearDuplicateList",
+    "NearDuplicateMatch",
+    "NearDuplicateQuery",
+    "SketchMetric",
+    "SubmissionBulkFilter",
+    "SubmissionBulkTransition",
+    "SubmissionBulkTransitionResult",
     "SubmissionCreate",
+    "SubmissionFilter",
     "SubmissionList",
     "SubmissionRead",
+    "SubmissionRevisionDiff",
+    "SubmissionRevisionList",
+    "SubmissionRevisionRead",
+    "SubmissionRevisionSummary",
+    "SubmissionSearchHit",
+    "SubmissionSearchResults",
+    "SubmissionStatusCounts",
+    "SubmissionSummary",
+    "SubmissionTransitionOutcome",
+    "SubmissionTranslationRead",
     "SubmissionUpdate",
+    "TimeseriesGroup",
+    "TranslationMemoryExportScope",
+    "TranslationMemoryFormat",
+    "TranslationMemoryImportRead",
+    "TranslationMemoryImportStatus",
+    "TranslationMemoryLookup",
+    "TranslationMemoryMatch",
+    "WarningBreakdown",
+    "WarningCodeBreakdown",
+    "WarningTermCount",
 ]
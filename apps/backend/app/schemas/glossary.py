@@ -1,10 +1,13 @@
 """Pydantic schemas for glossary resources."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from ..models import SubmissionStatus
+
 
 class GlossaryEntryBase(BaseModel):
     source_term: str = Field(..., max_length=255, description="English term to map")
@@ -37,3 +40,21 @@ class GlossaryEntryRead(GlossaryEntryBase):
 class GlossaryEntryList(BaseModel):
     items: list[GlossaryEntryRead]
     total: int
+
+
+class GlossaryImpactItem(BaseModel):
+    id: str
+    title: str
+    status: SubmissionStatus
+    thai_term_used: str
+    updated_at: datetime
+
+
+class GlossaryImpactList(BaseModel):
+    items: list[GlossaryImpactItem]
+    total: int
+
+
+class GlossaryRedraftQueued(BaseModel):
+    entry_id: str
+    submission_ids: list[str]
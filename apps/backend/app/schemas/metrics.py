@@ -1,8 +1,8 @@
 """Pydantic schemas describing analytics responses."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict
+from datetime import date, datetime
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -16,4 +16,83 @@ class MetricsOverview(BaseModel):
     average_tokens: float | None
     total_tokens: int
     total_cost_usd: float
+    average_post_edit_distance: float | None = None
+    average_post_edit_ratio: float | None = None
+    average_time_to_approval_hours: float | None = None
 
+
+
+TimeseriesGroup = Literal["status", "provider", "channel"]
+
+
+class MetricsTimeseriesPoint(BaseModel):
+    day: date
+    group: Optional[str] = None
+    submissions: int
+    approved: int
+    usage_tokens: int
+    cost_usd: float
+    submissions_with_warnings: int
+    average_post_edit_ratio: float | None = None
+    average_time_to_approval_hours: float | None = None
+
+
+class MetricsTimeseries(BaseModel):
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    days: int
+    group_by: Optional[TimeseriesGroup] = None
+    points: List[MetricsTimeseriesPoint]
+
+
+SketchMetric = Literal["provider_latency_ms", "usage_tokens", "cost_usd"]
+
+
+class MetricDistribution(BaseModel):
+    metric: SketchMetric
+    provider: Optional[str] = None
+    count: int
+    p50: float | None
+    p95: float | None
+    p99: float | None
+    min: float | None
+    max: float | None
+    average: float | None
+
+
+class MetricPercentiles(BaseModel):
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    hours: int
+    items: List[MetricDistribution]
+
+
+class GlossaryUsageItem(BaseModel):
+    source_term: str
+    glossary_entry_id: Optional[str] = None
+    submissions: int
+    # Submissions drafted with a Thai term that differs from the entry's current one.
+    stale_submissions: int
+
+
+class GlossaryUsage(BaseModel):
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    days: Optional[int] = None
+    items: List[GlossaryUsageItem]
+
+
+class WarningTermCount(BaseModel):
+    term: str
+    submissions: int
+
+
+class WarningCodeBreakdown(BaseModel):
+    code: str
+    submissions: int
+    rate: float
+    terms: List[WarningTermCount]
+
+
+class WarningBreakdown(BaseModel):
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    days: Optional[int] = None
+    total_submissions: int
+    items: List[WarningCodeBreakdown]
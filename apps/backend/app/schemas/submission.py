@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from ..core.locales import normalize_locales
 from ..models import SubmissionStatus
 
 
@@ -15,12 +16,91 @@ class SubmissionCreate(BaseModel):
     tone: Optional[str] = Field(None, max_length=64)
     audience: Optional[str] = Field(None, max_length=128)
     channel: Optional[str] = Field(None, max_length=128)
+    reuse_near_duplicate: bool = Field(
+        False,
+        description="Adapt the closest approved near-duplicate instead of drafting from scratch",
+    )
+    target_locales: list[str] = Field(
+        default_factory=list,
+        description="Locales drafted alongside Thai in the same request (vi, id, ms)",
+    )
+
+    @field_validator("target_locales")
+    @classmethod
+    def _validate_locales(cls, value: list[str]) -> list[str]:
+        return normalize_locales(value)
 
 
 class SubmissionUpdate(BaseModel):
     thai_final: Optional[str] = None
     status: Optional[SubmissionStatus] = None
     reviewer_notes: Optional[str] = None
+    locale_finals: Optional[dict[str, str]] = Field(
+        None, description="Final copy for non-Thai locales keyed by locale"
+    )
+
+
+class SubmissionFilter(BaseModel):
+    """Selects submissions by status, channel and creation time; all criteria optional."""
+
+    status: Optional[SubmissionStatus] = None
+    channel: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class SubmissionBulkFilter(SubmissionFilter):
+    """Selects submissions for a bulk transition; at least one criterion is required."""
+
+    @model_validator(mode="after")
+    def _require_criterion(self) -> SubmissionBulkFilter:
+        if all(value is None for value in self.model_dump().values()):
+            raise ValueError("Filter needs at least one criterion")
+        return self
+
+
+class SubmissionBulkTransition(BaseModel):
+    ids: Optional[list[str]] = Field(None, min_length=1, max_length=5000)
+    filter: Optional[SubmissionBulkFilter] = None
+    status: SubmissionStatus
+    reviewer_notes: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _require_target(self) -> SubmissionBulkTransition:
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of 'ids' or 'filter'")
+        return self
+
+
+class SubmissionTransitionOutcome(BaseModel):
+    id: str
+    outcome: Literal["updated", "unchanged", "not_found"]
+    previous_status: Optional[SubmissionStatus] = None
+
+
+class SubmissionBulkTransitionResult(BaseModel):
+    """Per-ID outcomes; filter-based requests only list the rows they updated."""
+
+    items: list[SubmissionTransitionOutcome]
+    updated: int
+    unchanged: int
+    not_found: int
+
+
+class SubmissionTranslationRead(BaseModel):
+    locale: str
+    draft_text: str
+    final_text: Optional[str]
+    translation_prompt: Optional[str]
+    provider_name: Optional[str]
+    usage_tokens: Optional[int]
+    cost_usd: Optional[float]
+    warnings: list[str]
+    notes: Optional[str]
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
 
 
 class SubmissionRead(BaseModel):
@@ -44,11 +124,111 @@ class SubmissionRead(BaseModel):
     last_reviewed_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    translations: list[SubmissionTranslationRead] = Field(default_factory=list)
 
     class Config:
         from_attributes = True
 
 
+class SubmissionSummary(BaseModel):
+    """List-view projection; only the requested columns are populated."""
+
+    id: str
+    title: Optional[str] = None
+    status: Optional[SubmissionStatus] = None
+    tone: Optional[str] = None
+    audience: Optional[str] = None
+    channel: Optional[str] = None
+    provider_name: Optional[str] = None
+    usage_tokens: Optional[int] = None
+    cost_usd: Optional[float] = None
+    last_reviewed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    source_text: Optional[str] = None
+    thai_draft: Optional[str] = None
+    thai_final: Optional[str] = None
+    translation_prompt: Optional[str] = None
+    notes: Optional[str] = None
+    reviewer_notes: Optional[str] = None
+    glossary_terms: Optional[list[str]] = None
+    warnings: Optional[list[str]] = None
+
+
+class SubmissionStatusCounts(BaseModel):
+    counts: dict[str, int]
+    total: int
+
+
 class SubmissionList(BaseModel):
-    items: list[SubmissionRead]
+    items: list[SubmissionSummary]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class SubmissionSearchHit(BaseModel):
+    id: str
+    title: str
+    status: SubmissionStatus
+    channel: Optional[str]
+    created_at: datetime
+    rank: float
+
+
+class SubmissionSearchResults(BaseModel):
+    items: list[SubmissionSearchHit]
+    total: int
+
+
+class SubmissionRevisionSummary(BaseModel):
+    revision: int
+    reason: str
+    is_snapshot: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SubmissionRevisionList(BaseModel):
+    items: list[SubmissionRevisionSummary]
     total: int
+
+
+class SubmissionRevisionRead(BaseModel):
+    revision: int
+    reason: str
+    created_at: datetime
+    thai_draft: str
+    thai_final: Optional[str]
+
+
+class DiffSegment(BaseModel):
+    op: Literal["equal", "insert", "delete"]
+    text: str
+
+
+class SubmissionRevisionDiff(BaseModel):
+    from_revision: int
+    to_revision: int
+    thai_draft: list[DiffSegment]
+    thai_final: list[DiffSegment]
+
+
+class NearDuplicateQuery(BaseModel):
+    source_text: str = Field(..., min_length=1)
+    max_distance: Optional[int] = Field(None, ge=0, le=16)
+    limit: int = Field(5, ge=1, le=50)
+    approved_only: bool = False
+
+
+class NearDuplicateMatch(BaseModel):
+    id: str
+    title: str
+    status: SubmissionStatus
+    distance: int
+    thai_final: Optional[str]
+
+
+class NearDuplicateList(BaseModel):
+    items: list[NearDuplicateMatch]
@@ -0,0 +1,41 @@
+"""Pydantic schemas for translation memory import, lookup and export."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel
+
+TranslationMemoryFormat = Literal["tmx", "xliff"]
+TranslationMemoryImportStatus = Literal["running", "completed", "failed"]
+# What a TMX/XLIFF export contains.
+TranslationMemoryExportScope = Literal["all", "submissions", "glossary"]
+
+
+class TranslationMemoryImportRead(BaseModel):
+    id: str
+    filename: Optional[str] = None
+    format: Optional[TranslationMemoryFormat] = None
+    status: TranslationMemoryImportStatus
+    units_seen: int
+    units_skipped: int
+    units_imported: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TranslationMemoryMatch(BaseModel):
+    source_locale: str
+    target_locale: str
+    source_text: str
+    target_text: str
+    import_id: Optional[str] = None
+
+
+class TranslationMemoryLookup(BaseModel):
+    text: str
+    items: List[TranslationMemoryMatch]
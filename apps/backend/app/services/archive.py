@@ -0,0 +1,343 @@
+"""Hot/cold archival of old approved submissions.
+
+Archiving keeps the ``submissions`` row as a stub (ids, status, timestamps, glossary
+terms, warnings and every metrics column, so listings, counts, rollups and dashboards
+are unchanged) and moves the text columns plus the per-locale translation rows into
+one compressed ``submission_archives`` row. Readers that need the text call
+``SubmissionArchiver.hydrate`` (ORM objects) or ``hydrate_rows`` (Core rows); writers
+call ``restore`` first, which moves the text back.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import bindparam, delete, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..core.compression import compress_text, decompress_text
+from ..core.simhash import simhash, to_signed
+from ..db.session import get_sessionmaker
+from ..models import Submission, SubmissionArchive, SubmissionStatus, SubmissionTranslation
+from ..models.submission import fingerprint_columns
+
+logger = logging.getLogger(__name__)
+
+# Text columns moved out of ``submissions``, with the value the stub row keeps.
+ARCHIVED_FIELDS: dict[str, Any] = {
+    "source_text": "",
+    "thai_draft": "",
+    "thai_final": None,
+    "translation_prompt": None,
+    "prompt_sections": None,
+    "notes": None,
+    "reviewer_notes": None,
+}
+_TRANSLATION_COLUMNS = tuple(
+    column.name
+    for column in SubmissionTranslation.__table__.columns
+    if column.name != "submission_id"
+)
+_TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+# ``(created_at, id)`` of the last candidate an archival pass looked at.
+_Keyset = tuple[datetime, str]
+
+
+@dataclass
+class ArchivedSubmission:
+    fields: dict[str, Any]
+    translations: list[dict[str, Any]] = field(default_factory=list)
+
+    def translation(self, locale: str) -> dict[str, Any] | None:
+        return next((row for row in self.translations if row["locale"] == locale), None)
+
+    def merged(self, current: dict[str, Any]) -> dict[str, Any]:
+        """Archived values for the fields in ``current`` that still hold the stub value.
+
+        A field written after archiving (e.g. by an edit that raced the job) keeps the
+        newer value.
+        """
+
+        return {
+            name: self.fields.get(name) if value == ARCHIVED_FIELDS[name] else value
+            for name, value in current.items()
+        }
+
+
+def encode_archive(fields: dict[str, Any], translations: Iterable[dict[str, Any]]) -> bytes:
+    rows = [
+        {
+            name: value.isoformat() if name in _TIMESTAMP_COLUMNS and value else value
+            for name, value in row.items()
+        }
+        for row in translations
+    ]
+    return compress_text(json.dumps({"fields": fields, "translations": rows}, ensure_ascii=False))
+
+
+def decode_archive(payload: bytes) -> ArchivedSubmission:
+    document = json.loads(decompress_text(bytes(payload)))
+    translations = [
+        {
+            name: datetime.fromisoformat(value) if name in _TIMESTAMP_COLUMNS and value else value
+            for name, value in row.items()
+        }
+        for row in document["translations"]
+    ]
+    return ArchivedSubmission(fields=document["fields"], translations=translations)
+
+
+class SubmissionArchiver:
+    """Move cold submissions to ``submission_archives`` and read them back."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def load(self, submission_ids: Iterable[str]) -> dict[str, ArchivedSubmission]:
+        ids = list(dict.fromkeys(submission_ids))
+        if not ids:
+            return {}
+        table = SubmissionArchive.__table__
+        result = await self._session.execute(
+            select(table.c.submission_id, table.c.payload).where(table.c.submission_id.in_(ids))
+        )
+        return {row.submission_id: decode_archive(row.payload) for row in result}
+
+    async def hydrate(
+        self,
+        submissions: Sequence[Submission],
+        fields: Iterable[str] = ARCHIVED_FIELDS,
+        translations: bool = True,
+    ) -> None:
+        """Fill archived text into loaded ``submissions`` as committed (unchanged) state.
+
+        ``fields`` must be loaded on every submission; ``translations`` also fills the
+        ``translations`` collection, which must be loaded too.
+        """
+
+        names = [name for name in fields if name in ARCHIVED_FIELDS]
+        archived = [submission for submission in submissions if submission.archived_at]
+        if not archived or not (names or translations):
+            return
+        payloads = await self.load(submission.id for submission in archived)
+        for submission in archived:
+            payload = payloads.get(submission.id)
+            if payload is None:
+                continue
+            current = {name: getattr(submission, name) for name in names}
+            for name, value in payload.merged(current).items():
+                set_committed_value(submission, name, value)
+            if translations and not submission.translations:
+                set_committed_value(
+                    submission,
+                    "translations",
+                    [
+                        SubmissionTranslation(submission_id=submission.id, **row)
+                        for row in payload.translations
+                    ],
+                )
+
+    async def hydrate_rows(
+        self, rows: Sequence[dict[str, Any]], translation_locale: str | None = None
+    ) -> None:
+        """Fill archived text into Core row mappings (``id`` and ``archived_at`` keys).
+
+        With ``translation_locale``, the rows also get that locale's archived
+        ``draft_text``/``final_text`` when they lack them.
+        """
+
+        archived = [row for row in rows if row.get("archived_at")]
+        if not archived:
+            return
+        payloads = await self.load(row["id"] for row in archived)
+        for row in archived:
+            payload = payloads.get(row["id"])
+            if payload is None:
+                continue
+            row.update(payload.merged({name: row[name] for name in row if name in ARCHIVED_FIELDS}))
+            if translation_locale is not None and row.get("draft_text") is None:
+                translation = payload.translation(translation_locale) or {}
+                row["draft_text"] = translation.get("draft_text")
+                row["final_text"] = translation.get("final_text")
+
+    async def restore(self, submission_id: str) -> bool:
+        """Move an archived submission's text back into the hot tables (no commit).
+
+        Returns whether anything was restored; call before loading a submission to
+        modify it.
+        """
+
+        archive = SubmissionArchive.__table__
+        payload = await self._session.scalar(
+            select(archive.c.payload).where(archive.c.submission_id == submission_id)
+        )
+        if payload is None:
+            return False
+        archived = decode_archive(payload)
+        table = Submission.__table__
+        current = (
+            await self._session.execute(
+                select(*(table.c[name] for name in ARCHIVED_FIELDS)).where(
+                    table.c.id == submission_id
+                )
+            )
+        ).one()
+        await self._session.execute(
+            update(table)
+            .where(table.c.id == submission_id)
+            .values(
+                archived_at=None,
+                updated_at=table.c.updated_at,
+                **archived.merged(dict(current._mapping)),
+            )
+        )
+        translations = SubmissionTranslation.__table__
+        live = set(
+            await self._session.scalars(
+                select(translations.c.locale).where(translations.c.submission_id == submission_id)
+            )
+        )
+        missing = [row for row in archived.translations if row["locale"] not in live]
+        if missing:
+            await self._session.execute(
+                insert(translations),
+                [{"submission_id": submission_id, **row} for row in missing],
+            )
+        await self._session.execute(delete(archive).where(archive.c.submission_id == submission_id))
+        return True
+
+    async def archive_batch(
+        self, cutoff: datetime, batch_size: int, after: _Keyset | None = None
+    ) -> tuple[int, _Keyset | None]:
+        """Archive up to ``batch_size`` candidates after the ``after`` keyset; commits.
+
+        Returns the number archived and the keyset to continue from (None when done).
+        Rows are claimed by setting ``archived_at`` before their text is copied, so the
+        copy happens under the write lock and concurrent archivers skip each other's
+        rows.
+        """
+
+        table = Submission.__table__
+        candidates = (
+            select(table.c.id, table.c.created_at)
+            .where(
+                table.c.status == SubmissionStatus.APPROVED.value,
+                table.c.archived_at.is_(None),
+                table.c.created_at < cutoff,
+                table.c.updated_at < cutoff,
+            )
+            .order_by(table.c.created_at, table.c.id)
+            .limit(batch_size)
+        )
+        if after is not None:
+            candidates = candidates.where(tuple_(table.c.created_at, table.c.id) > after)
+        rows = (await self._session.execute(candidates)).all()
+        if not rows:
+            return 0, None
+        ids = [row.id for row in rows]
+        claimed_at = datetime.now(timezone.utc)
+        await self._session.execute(
+            update(table)
+            .where(
+                table.c.id.in_(ids),
+                table.c.archived_at.is_(None),
+                table.c.status == SubmissionStatus.APPROVED.value,
+                table.c.updated_at < cutoff,
+            )
+            .values(archived_at=claimed_at, updated_at=table.c.updated_at)
+        )
+        claimed = (
+            await self._session.execute(
+                select(
+                    table.c.id,
+                    table.c.source_fingerprint,
+                    *(table.c[name] for name in ARCHIVED_FIELDS),
+                ).where(table.c.id.in_(ids), table.c.archived_at == claimed_at)
+            )
+        ).all()
+        if claimed:
+            await self._move(claimed)
+        await self._session.commit()
+        return len(claimed), (rows[-1].created_at, rows[-1].id)
+
+    async def _move(self, claimed: Sequence[Any]) -> None:
+        table = Submission.__table__
+        translations = SubmissionTranslation.__table__
+        ids = [row.id for row in claimed]
+        by_submission: dict[str, list[dict[str, Any]]] = {}
+        result = await self._session.execute(
+            select(translations).where(translations.c.submission_id.in_(ids))
+        )
+        for row in result:
+            by_submission.setdefault(row.submission_id, []).append(
+                {name: row._mapping[name] for name in _TRANSLATION_COLUMNS}
+            )
+        await self._session.execute(
+            insert(SubmissionArchive.__table__),
+            [
+                {
+                    "submission_id": row.id,
+                    "payload": encode_archive(
+                        {name: row._mapping[name] for name in ARCHIVED_FIELDS},
+                        by_submission.get(row.id, []),
+                    ),
+                }
+                for row in claimed
+            ],
+        )
+        await self._session.execute(
+            delete(translations).where(translations.c.submission_id.in_(ids))
+        )
+        await self._session.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            .values(updated_at=table.c.updated_at, **ARCHIVED_FIELDS),
+            [
+                {
+                    "row_id": row.id,
+                    # Near-duplicate lookups need the fingerprint, and the stub no longer
+                    # has the source to compute it from.
+                    **fingerprint_columns(
+                        row.source_fingerprint
+                        if row.source_fingerprint is not None
+                        else to_signed(simhash(row.source_text))
+                    ),
+                }
+                for row in claimed
+            ],
+        )
+
+    async def archive_older_than(self, days: int, batch_size: int) -> int:
+        """Archive every approved submission untouched for ``days``; returns the count."""
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        archived, after = 0, None
+        while True:
+            count, after = await self.archive_batch(cutoff, batch_size, after)
+            archived += count
+            if after is None:
+                return archived
+
+
+async def archive_submissions(days: int, batch_size: int) -> int:
+    async with get_sessionmaker()() as session:
+        return await SubmissionArchiver(session).archive_older_than(days, batch_size)
+
+
+async def run_periodic_archival(days: int, batch_size: int, interval: float) -> None:
+    """Archive cold submissions every ``interval`` seconds until cancelled."""
+
+    while True:
+        try:
+            archived = await archive_submissions(days, batch_size)
+            if archived:
+                logger.info("Archived %d submissions", archived)
+        except Exception:  # pragma: no cover - keep the loop alive across DB hiccups
+            logger.exception("Failed to archive submissions")
+        await asyncio.sleep(interval)
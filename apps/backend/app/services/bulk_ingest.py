@@ -0,0 +1,195 @@
+"""Streaming bulk ingestion of submissions from CSV or JSON Lines uploads."""
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from typing import Any
+
+from pydantic import ValidationError
+
+from ..schemas import SubmissionCreate
+from .submission import SubmissionService
+
+logger = logging.getLogger(__name__)
+
+INGEST_FORMATS = ("csv", "jsonl")
+_CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/json-lines": "jsonl",
+}
+# Column aliases accepted in uploads, mapped to ``SubmissionCreate`` fields.
+_FIELD_ALIASES = {"source": "source_text"}
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode a UTF-8 byte stream (BOM tolerated) into lines, keeping line endings."""
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        if "\n" not in pending:
+            continue
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+class _NeedMoreLines(Exception):
+    """The buffered lines end inside a quoted field."""
+
+
+def _buffered(lines: list[str]) -> Iterator[str]:
+    yield from lines
+    raise _NeedMoreLines
+
+
+async def iter_csv_rows(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    """Yield one mapping per CSV record, keyed by the header row.
+
+    ``csv.reader`` parses each record from the lines received so far; when it asks for
+    a line that has not arrived (a quoted field spanning lines), the record is parsed
+    again once it has. Quotes inside unquoted fields stay literal.
+    """
+
+    header: list[str] | None = None
+    record: list[str] = []
+    async for line in lines:
+        record.append(line)
+        try:
+            values = next(csv.reader(_buffered(record)), [])
+        except _NeedMoreLines:
+            continue
+        record = []
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+        if not any(value.strip() for value in values):
+            continue
+        yield {
+            name: value.strip() or None
+            for name, value in zip(header, values)
+            if name
+        }
+    if record:
+        raise ValueError("Unterminated quoted field at end of CSV upload")
+
+
+async def iter_jsonl_rows(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield {"__error__": f"Invalid JSON: {exc.msg}"}
+            continue
+        yield row if isinstance(row, dict) else {"__error__": "Row must be a JSON object"}
+
+
+def detect_format(requested: str | None, content_type: str | None) -> str:
+    """Pick the upload format from an explicit value or the request content type."""
+
+    if requested:
+        if requested not in INGEST_FORMATS:
+            raise ValueError(f"Unsupported format '{requested}'; use csv or jsonl")
+        return requested
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in _CONTENT_TYPE_FORMATS:
+        return _CONTENT_TYPE_FORMATS[media_type]
+    raise ValueError("Pass format=csv or format=jsonl, or send a text/csv or NDJSON body")
+
+
+def _parse_row(row: dict[str, Any]) -> SubmissionCreate:
+    if "__error__" in row:
+        raise ValueError(row["__error__"])
+    data = {_FIELD_ALIASES.get(key, key): value for key, value in row.items()}
+    data = {key: value for key, value in data.items() if value is not None}
+    if isinstance(data.get("target_locales"), str):
+        # CSV cells carry locales as a comma- or semicolon-separated list.
+        data["target_locales"] = data["target_locales"].replace(";", ",").split(",")
+    return SubmissionCreate.model_validate(data)
+
+
+def _describe_errors(exc: Exception) -> list[str]:
+    if isinstance(exc, ValidationError):
+        return [
+            f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+            for error in exc.errors()
+        ]
+    return [str(exc)]
+
+
+class BulkIngestService:
+    """Validate rows as they arrive and create submissions in drafted batches.
+
+    Every row produces one progress event (``created``, ``invalid`` or ``failed``)
+    and the stream ends with a ``done`` summary.
+    """
+
+    def __init__(
+        self, submission_service: SubmissionService, batch_size: int, concurrency: int
+    ) -> None:
+        self._submissions = submission_service
+        self._batch_size = max(1, batch_size)
+        self._concurrency = concurrency
+
+    async def ingest(
+        self, chunks: AsyncIterable[bytes], format: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        if format not in INGEST_FORMATS:
+            raise ValueError(f"Unsupported format '{format}'")
+        reader = iter_csv_rows if format == "csv" else iter_jsonl_rows
+        totals = {"created": 0, "invalid": 0, "failed": 0}
+        batch: list[tuple[int, SubmissionCreate]] = []
+        row_number = 0
+        try:
+            async for row in reader(iter_lines(chunks)):
+                row_number += 1
+                try:
+                    batch.append((row_number, _parse_row(row)))
+                except ValueError as exc:  # ValidationError is a ValueError
+                    totals["invalid"] += 1
+                    errors = _describe_errors(exc)
+                    yield {"row": row_number, "status": "invalid", "errors": errors}
+                    continue
+                if len(batch) >= self._batch_size:
+                    async for event in self._flush(batch, totals):
+                        yield event
+                    batch = []
+        except ValueError as exc:
+            # Malformed stream (e.g. bad encoding); rows already queued are still created.
+            yield {"row": row_number + 1, "status": "invalid", "errors": [str(exc)]}
+            totals["invalid"] += 1
+        if batch:
+            async for event in self._flush(batch, totals):
+                yield event
+        yield {"status": "done", "rows": row_number, **totals}
+
+    async def _flush(
+        self, batch: list[tuple[int, SubmissionCreate]], totals: dict[str, int]
+    ) -> AsyncIterator[dict[str, Any]]:
+        try:
+            outcomes = await self._submissions.create_many(
+                [payload for _, payload in batch], concurrency=self._concurrency
+            )
+        except Exception as exc:  # noqa: BLE001 - the batch is reported, not raised
+            logger.exception("Bulk ingest batch of %d rows failed", len(batch))
+            outcomes = [exc] * len(batch)
+
+        for (row_number, _), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                totals["failed"] += 1
+                yield {"row": row_number, "status": "failed", "error": str(outcome)}
+            else:
+                totals["created"] += 1
+                yield {"row": row_number, "status": "created", "id": outcome.id}
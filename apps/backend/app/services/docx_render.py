@@ -0,0 +1,156 @@
+"""DOCX rendering off the event loop, from a preloaded base template."""
+from __future__ import annotations
+
+import asyncio
+import io
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from docx import Document
+
+from ..core.config import get_settings
+from ..models import Submission
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Bytes of the base document every render starts from. Set once per process (for
+# process pools, by the worker initializer) so renders skip locating and reading it.
+_template: bytes | None = None
+
+
+@dataclass(frozen=True)
+class DocxContent:
+    """Plain-data copy of the fields a DOCX export shows.
+
+    Renders run on other threads or processes, so they must not touch ORM objects.
+    """
+
+    title: str
+    status: str
+    tone: str | None
+    audience: str | None
+    channel: str | None
+    source_text: str
+    thai_draft: str
+    thai_final: str | None
+    reviewer_notes: str | None
+    warnings: tuple[str, ...]
+
+    @classmethod
+    def from_submission(cls, submission: Submission) -> DocxContent:
+        return cls(
+            title=submission.title,
+            status=submission.status,
+            tone=submission.tone,
+            audience=submission.audience,
+            channel=submission.channel,
+            source_text=submission.source_text,
+            thai_draft=submission.thai_draft,
+            thai_final=submission.thai_final,
+            reviewer_notes=submission.reviewer_notes,
+            warnings=tuple(submission.warnings or ()),
+        )
+
+
+def load_template(path: str | None = None) -> bytes:
+    """Read a branded base template, or serialize python-docx's default one."""
+
+    if path:
+        return Path(path).read_bytes()
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+def install_template(template: bytes) -> None:
+    global _template
+    _template = template
+
+
+def render_docx(content: DocxContent) -> bytes:
+    """Render synchronously; safe to call from any thread or worker process."""
+
+    if _template is None:
+        install_template(load_template(get_settings().export_docx_template_path))
+    document = Document(io.BytesIO(_template))  # type: ignore[arg-type]
+    document.add_heading(content.title, level=1)
+    document.add_paragraph(f"Status: {content.status}")
+    document.add_paragraph(f"Tone: {content.tone or 'default'}")
+    document.add_paragraph(f"Audience: {content.audience or 'unspecified'}")
+    document.add_paragraph(f"Channel: {content.channel or 'unspecified'}")
+
+    document.add_heading("English Source", level=2)
+    document.add_paragraph(content.source_text)
+
+    document.add_heading("Generated Draft", level=2)
+    document.add_paragraph(content.thai_draft)
+
+    document.add_heading("Final Copy", level=2)
+    document.add_paragraph(content.thai_final or "Pending edits")
+
+    if content.reviewer_notes:
+        document.add_heading("Reviewer Notes", level=2)
+        document.add_paragraph(content.reviewer_notes)
+
+    if content.warnings:
+        document.add_heading("Warnings", level=2)
+        for warning in content.warnings:
+            document.add_paragraph(warning, style="List Bullet")
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class DocxRenderPool:
+    """Bounded executor for DOCX renders.
+
+    At most ``workers`` renders run at once and at most twice that many wait for a
+    worker, so a burst of exports queues on the semaphore instead of piling rendered
+    documents up in memory.
+    """
+
+    def __init__(self, workers: int, kind: str = "thread", template: bytes | None = None) -> None:
+        workers = max(1, workers)
+        if template is None:
+            template = load_template(get_settings().export_docx_template_path)
+        self._executor: Executor
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=install_template, initargs=(template,)
+            )
+        elif kind == "thread":
+            install_template(template)
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="docx-render"
+            )
+        else:
+            raise ValueError(f"Unknown DOCX render pool kind: {kind}")
+        self._slots = asyncio.Semaphore(workers * 2)
+
+    async def render(self, content: DocxContent) -> bytes:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, render_docx, content)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: DocxRenderPool | None = None
+
+
+def get_docx_pool() -> DocxRenderPool:
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        _pool = DocxRenderPool(settings.export_render_workers, settings.export_render_pool)
+    return _pool
+
+
+def shutdown_docx_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -0,0 +1,160 @@
+"""On-disk LRU cache of rendered single-submission exports."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from ..core.config import get_settings
+from ..models import Submission
+from .exports import ExportPayload, ExportService
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def export_etag(submission: Submission, format: str) -> str:
+    """Strong ETag of one export; it changes whenever the submission is edited."""
+
+    return f'"{_digest(submission.id, submission.updated_at.isoformat(), format.lower())}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # If-None-Match uses the weak comparison, so ``W/`` prefixes are ignored.
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+class ExportCache:
+    """Rendered exports stored as files, evicted least recently used first.
+
+    Entries are keyed by (submission id, ``updated_at``, format). Editing a submission
+    bumps ``updated_at``, so its old entries are never read again; they are deleted
+    when a newer version of the same submission is stored, or age out by eviction.
+    Reads touch the file's mtime, which orders entries when the index is rebuilt after
+    a restart. Workers sharing a directory each track sizes from their own scan; a
+    file removed by another worker is simply a miss.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] | None = None
+        self._size = 0
+
+    async def get(self, submission: Submission, format: str) -> ExportPayload | None:
+        return await asyncio.to_thread(self._read, self._name(submission, format))
+
+    async def put(self, submission: Submission, format: str, payload: ExportPayload) -> None:
+        await asyncio.to_thread(self._write, self._name(submission, format), payload)
+
+    async def fetch(self, submission: Submission, format: str) -> ExportPayload:
+        """Return the cached export, rendering and storing it on a miss."""
+
+        payload = await self.get(submission, format)
+        if payload is None:
+            payload = await ExportService(submission).render(format)
+            await self.put(submission, format, payload)
+        return payload
+
+    @staticmethod
+    def _name(submission: Submission, format: str) -> str:
+        # ``<submission>-<version>-<format>``, so a submission's older versions are easy to
+        # find. Only formats that rendered successfully are ever written.
+        version = _digest(submission.id, submission.updated_at.isoformat())
+        return f"{_digest(submission.id)}-{version}-{format.lower()}"
+
+    def _index(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            found = [
+                (entry.stat().st_mtime, entry.name, entry.stat().st_size)
+                for entry in os.scandir(self.directory)
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+            self._entries = OrderedDict((name, size) for _, name, size in sorted(found))
+            self._size = sum(self._entries.values())
+        return self._entries
+
+    def _read(self, name: str) -> ExportPayload | None:
+        path = self.directory / name
+        try:
+            raw = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(name)
+            return None
+        with self._lock:
+            entries = self._index()
+            if name not in entries:
+                # Written by another worker since this one scanned the directory.
+                entries[name] = len(raw)
+                self._size += len(raw)
+            entries.move_to_end(name)
+        header, _, content = raw.partition(b"\n")
+        meta = json.loads(header)
+        return ExportPayload(
+            filename=meta["filename"], media_type=meta["media_type"], content=content
+        )
+
+    def _write(self, name: str, payload: ExportPayload) -> None:
+        header = json.dumps({"filename": payload.filename, "media_type": payload.media_type})
+        raw = header.encode("utf-8") + b"\n" + payload.content
+        if len(raw) > self.max_bytes:
+            return
+        submission_key, version, _ = name.split("-")
+        with self._lock:
+            entries = self._index()
+            path = self.directory / name
+            temporary = path.with_name(f"{name}.{threading.get_ident()}.tmp")
+            temporary.write_bytes(raw)
+            os.replace(temporary, path)
+            self._size += len(raw) - entries.pop(name, 0)
+            entries[name] = len(raw)
+            current = f"{submission_key}-{version}-"
+            stale = [
+                other
+                for other in entries
+                if other.startswith(f"{submission_key}-") and not other.startswith(current)
+            ]
+            for other in stale:
+                self._evict(other)
+            while self._size > self.max_bytes:
+                self._evict(next(iter(entries)))
+
+    def _evict(self, name: str) -> None:
+        assert self._entries is not None
+        self._size -= self._entries.pop(name)
+        (self.directory / name).unlink(missing_ok=True)
+
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            if self._entries is not None and name in self._entries:
+                self._size -= self._entries.pop(name)
+
+
+_cache: ExportCache | None = None
+
+
+def get_export_cache() -> ExportCache | None:
+    """The process-wide cache, or ``None`` unless ``LEO_EXPORT_CACHE_DIR`` is set and
+    ``LEO_EXPORT_CACHE_MAX_BYTES`` is positive."""
+
+    global _cache
+    settings = get_settings()
+    if not settings.export_cache_dir or settings.export_cache_max_bytes <= 0:
+        return None
+    directory = Path(settings.export_cache_dir)
+    if _cache is None or _cache.directory != directory:
+        _cache = ExportCache(directory, settings.export_cache_max_bytes)
+    return _cache
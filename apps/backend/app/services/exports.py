@@ -3,12 +3,79 @@ from __future__ import annotations
 
 import csv
 import io
+import re
+import zipfile
+from collections import namedtuple
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
-from docx import Document
 from fastapi import HTTPException
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models import Submission
+from .archive import ARCHIVED_FIELDS, SubmissionArchiver
+from .docx_render import DOCX_MEDIA_TYPE, DocxContent, get_docx_pool, render_docx
+
+try:  # pragma: no cover - exercised only when the optional extra is installed
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - Parquet/Arrow exports are unavailable without it
+    pyarrow = None
+
+BULK_EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "status",
+    "tone",
+    "audience",
+    "channel",
+    "source_text",
+    "thai_draft",
+    "thai_final",
+    "reviewer_notes",
+    "warnings",
+    "glossary_terms",
+    "provider_name",
+    "usage_tokens",
+    "cost_usd",
+    "created_at",
+    "updated_at",
+)
+# Parquet/Arrow exports pick from these; the metrics columns are numeric analytics data.
+COLUMNAR_COLUMNS = BULK_EXPORT_COLUMNS + (
+    "post_edit_distance",
+    "post_edit_ratio",
+    "time_to_approval_seconds",
+    "last_reviewed_at",
+)
+COLUMNAR_DEFAULT_COLUMNS = (
+    "id",
+    "title",
+    "status",
+    "channel",
+    "provider_name",
+    "usage_tokens",
+    "cost_usd",
+    "post_edit_distance",
+    "post_edit_ratio",
+    "time_to_approval_seconds",
+    "created_at",
+    "updated_at",
+    "last_reviewed_at",
+)
+COLUMNAR_MEDIA_TYPES = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+# Rows fetched per round trip, and the CSV/ZIP output buffered before each yield.
+_EXPORT_BATCH_SIZE = 500
+_FLUSH_BYTES = 64 * 1024
+# Columnar exports write one record batch (and one Parquet row group) per fetch, so
+# they fetch more rows at a time than the row-oriented formats.
+_COLUMNAR_BATCH_SIZE = 10_000
 
 
 @dataclass
@@ -50,38 +117,15 @@ class ExportService:
         )
 
     def to_docx(self) -> ExportPayload:
-        document = Document()
-        document.add_heading(self._submission.title, level=1)
-        document.add_paragraph(f"Status: {self._submission.status}")
-        document.add_paragraph(f"Tone: {self._submission.tone or 'default'}")
-        document.add_paragraph(f"Audience: {self._submission.audience or 'unspecified'}")
-        document.add_paragraph(f"Channel: {self._submission.channel or 'unspecified'}")
-
-        document.add_heading("English Source", level=2)
-        document.add_paragraph(self._submission.source_text)
+        """Render on the calling thread; async callers should use ``render``."""
 
-        document.add_heading("Generated Draft", level=2)
-        document.add_paragraph(self._submission.thai_draft)
-
-        document.add_heading("Final Copy", level=2)
-        document.add_paragraph(self._submission.thai_final or "Pending edits")
-
-        if self._submission.reviewer_notes:
-            document.add_heading("Reviewer Notes", level=2)
-            document.add_paragraph(self._submission.reviewer_notes)
-
-        if self._submission.warnings:
-            document.add_heading("Warnings", level=2)
-            for warning in self._submission.warnings:
-                document.add_paragraph(warning, style="List Bullet")
-
-        buffer = io.BytesIO()
-        document.save(buffer)
+        return self._docx_payload(render_docx(DocxContent.from_submission(self._submission)))
 
+    def _docx_payload(self, content: bytes) -> ExportPayload:
         return ExportPayload(
             filename=f"submission-{self._submission.id}.docx",
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            content=buffer.getvalue(),
+            media_type=DOCX_MEDIA_TYPE,
+            content=content,
         )
 
     def to_social(self) -> ExportPayload:
@@ -105,6 +149,14 @@ class ExportService:
             content=text.getvalue().encode("utf-8"),
         )
 
+    async def render(self, format: str) -> ExportPayload:
+        """Like ``generate``, but DOCX documents render on the shared worker pool."""
+
+        if format.lower() == "docx":
+            content = await get_docx_pool().render(DocxContent.from_submission(self._submission))
+            return self._docx_payload(content)
+        return self.generate(format)
+
     def generate(self, format: str) -> ExportPayload:
         format = format.lower()
         if format == "csv":
@@ -114,3 +166,188 @@ class ExportService:
         if format == "social":
             return self.to_social()
         raise HTTPException(status_code=400, detail="Unsupported export format")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable file that collects ``ZipFile`` output for streaming."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self._chunks, self.size = b"".join(self._chunks), [], 0
+        return data
+
+
+class BulkExportService:
+    """Stream many submissions as CSV, ZIP, Parquet or Arrow without holding them in memory.
+
+    Rows come from a server-side cursor in batches of ``_EXPORT_BATCH_SIZE``; output is
+    yielded roughly every ``_FLUSH_BYTES``, so memory stays flat whatever the size.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @staticmethod
+    def filename(format: str) -> str:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        # Arrow IPC streams conventionally use ``.arrows``; ``.arrow`` is the file format.
+        extension = "arrows" if format == "arrow" else format
+        return f"submissions-{stamp}.{extension}"
+
+    async def _partitions(
+        self,
+        criteria: Sequence[ColumnElement[bool]],
+        columns: Sequence[str] = BULK_EXPORT_COLUMNS,
+        batch_size: int = _EXPORT_BATCH_SIZE,
+    ):
+        table = Submission.__table__
+        archived = any(name in ARCHIVED_FIELDS for name in columns)
+        # Archived rows are stubs; their text is read back from the archive per batch.
+        extra = (
+            tuple(name for name in ("id", "archived_at") if name not in columns) if archived else ()
+        )
+        result = await self._session.stream(
+            select(*(table.c[name] for name in (*columns, *extra)))
+            .where(*criteria)
+            .order_by(table.c.created_at, table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if not archived:
+            async for partition in result.partitions():
+                yield partition
+            return
+        row_type = namedtuple("ExportRow", columns)  # type: ignore[misc]
+        archiver = SubmissionArchiver(self._session)
+        async for partition in result.partitions():
+            rows = [dict(row._mapping) for row in partition]
+            await archiver.hydrate_rows(rows)
+            yield [row_type(*(row[name] for name in columns)) for row in rows]
+
+    async def _rows(self, criteria: Sequence[ColumnElement[bool]]):
+        async for partition in self._partitions(criteria):
+            for row in partition:
+                yield row
+
+    async def stream_csv(self, criteria: Sequence[ColumnElement[bool]]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # BOM so spreadsheet apps read the Thai text as UTF-8, as in single exports.
+        buffer.write("\ufeff")
+        writer.writerow(BULK_EXPORT_COLUMNS)
+        async for row in self._rows(criteria):
+            writer.writerow([_csv_value(value) for value in row])
+            if buffer.tell() >= _FLUSH_BYTES:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode("utf-8")
+
+    async def stream_zip(self, criteria: Sequence[ColumnElement[bool]]) -> AsyncIterator[bytes]:
+        """One DOCX and one plain-text file per submission."""
+
+        pool = get_docx_pool()
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, mode="w") as archive:
+            async for row in self._rows(criteria):
+                exporter = ExportService(row)  # type: ignore[arg-type]
+                stem = f"{_slug(row.title)}-{row.id}"
+                docx = await pool.render(DocxContent.from_submission(row))  # type: ignore[arg-type]
+                # DOCX is already deflated; storing it again compressed only costs CPU.
+                archive.writestr(f"{stem}.docx", docx, compress_type=zipfile.ZIP_STORED)
+                archive.writestr(
+                    f"{stem}.txt", exporter.to_social().content, compress_type=zipfile.ZIP_DEFLATED
+                )
+                if sink.size >= _FLUSH_BYTES:
+                    yield sink.drain()
+        yield sink.drain()
+
+    async def stream_columnar(
+        self,
+        criteria: Sequence[ColumnElement[bool]],
+        format: str,
+        columns: Sequence[str] = COLUMNAR_DEFAULT_COLUMNS,
+    ) -> AsyncIterator[bytes]:
+        """Parquet (zstd) or an Arrow IPC stream, one record batch per cursor fetch."""
+
+        if pyarrow is None:
+            raise RuntimeError("Parquet and Arrow exports need the 'analytics' extra")
+        types = _arrow_types()
+        schema = pyarrow.schema([(name, types[name]) for name in columns])
+        sink = _ChunkSink()
+        if format == "parquet":
+            writer = pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd")
+        else:
+            writer = pyarrow.ipc.new_stream(sink, schema)
+        try:
+            async for partition in self._partitions(criteria, columns, _COLUMNAR_BATCH_SIZE):
+                arrays = [
+                    pyarrow.array(values, type=field.type)
+                    for field, values in zip(schema, zip(*partition))
+                ]
+                writer.write_batch(pyarrow.record_batch(arrays, schema=schema))
+                if sink.size >= _FLUSH_BYTES:
+                    yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+def columnar_available() -> bool:
+    return pyarrow is not None
+
+
+def resolve_columns(columns: Sequence[str] | None) -> tuple[str, ...]:
+    """Validate a requested column list, defaulting to ``COLUMNAR_DEFAULT_COLUMNS``."""
+
+    if not columns:
+        return COLUMNAR_DEFAULT_COLUMNS
+    selected = tuple(dict.fromkeys(name.strip() for name in columns if name.strip()))
+    unknown = [name for name in selected if name not in COLUMNAR_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+    return selected or COLUMNAR_DEFAULT_COLUMNS
+
+
+def _arrow_types() -> dict[str, pyarrow.DataType]:
+    timestamp = pyarrow.timestamp("us", tz="UTC")
+    terms = pyarrow.list_(pyarrow.string())
+    types = {name: pyarrow.string() for name in COLUMNAR_COLUMNS}
+    types.update(
+        usage_tokens=pyarrow.int64(),
+        cost_usd=pyarrow.float64(),
+        post_edit_distance=pyarrow.int64(),
+        post_edit_ratio=pyarrow.float64(),
+        time_to_approval_seconds=pyarrow.float64(),
+        warnings=terms,
+        glossary_terms=terms,
+        created_at=timestamp,
+        updated_at=timestamp,
+        last_reviewed_at=timestamp,
+    )
+    return types
+
+
+def _csv_value(value: object) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return " | ".join(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _slug(title: str) -> str:
+    slug = re.sub(r"[^\w-]+", "-", title, flags=re.UNICODE).strip("-").lower()
+    return slug[:60] or "submission"
@@ -17,6 +17,24 @@ from ..schemas.glossary import (
 )
 
 
+def _match_entries(entries: list[GlossaryEntryRead], english_text: str) -> list[GlossaryEntryRead]:
+    lower_text = english_text.lower()
+    return [entry for entry in entries if entry.source_term.lower() in lower_text]
+
+
+class GlossarySnapshot:
+    """Glossary entries frozen in memory; safe to share between concurrent tasks."""
+
+    def __init__(self, entries: list[GlossaryEntryRead]) -> None:
+        self._entries = entries
+
+    async def matched_entries(self, english_text: str) -> list[GlossaryEntryRead]:
+        return _match_entries(self._entries, english_text)
+
+    async def snapshot(self) -> GlossarySnapshot:
+        return self
+
+
 class GlossaryService:
     """Encapsulate glossary persistence and querying logic."""
 
@@ -58,7 +76,6 @@ class GlossaryService:
         except IntegrityError as exc:  # pragma: no cover - defensive guard
             await self._session.rollback()
             raise ValueError("Duplicate source term") from exc
-        await self._session.refresh(entry)
         await self._invalidate_cache()
         return GlossaryEntryRead.model_validate(entry)
 
@@ -75,7 +92,6 @@ class GlossaryService:
         except IntegrityError as exc:  # pragma: no cover - defensive guard
             await self._session.rollback()
             raise ValueError("Duplicate source term") from exc
-        await self._session.refresh(entry)
         await self._invalidate_cache()
         return GlossaryEntryRead.model_validate(entry)
 
@@ -88,13 +104,12 @@ class GlossaryService:
         await self._invalidate_cache()
 
     async def matched_entries(self, english_text: str) -> list[GlossaryEntryRead]:
-        entries = await self._load_all_entries()
-        lower_text = english_text.lower()
-        matched: list[GlossaryEntryRead] = []
-        for entry in entries:
-            if entry.source_term.lower() in lower_text:
-                matched.append(entry)
-        return matched
+        return _match_entries(await self._load_all_entries(), english_text)
+
+    async def snapshot(self) -> GlossarySnapshot:
+        """Load the glossary once for batch work that must not share the session."""
+
+        return GlossarySnapshot(await self._load_all_entries())
 
     async def _load_all_entries(self) -> list[GlossaryEntryRead]:
         if self._cache:
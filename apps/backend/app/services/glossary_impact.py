@@ -0,0 +1,169 @@
+"""Reverse index from glossary terms to the submissions that used them."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..models import GlossaryEntry, Submission, SubmissionGlossaryTerm, SubmissionStatus
+from ..schemas.glossary import GlossaryEntryRead, GlossaryImpactItem, GlossaryImpactList
+
+logger = logging.getLogger(__name__)
+
+_BACKFILL_BATCH_SIZE = 1000
+_TERM_SEPARATOR = " → "
+
+
+def normalize_term(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def _parse_applied_terms(applied: Iterable[str]) -> dict[str, str]:
+    # ``Submission.glossary_terms`` stores "source → thai" strings.
+    pairs: dict[str, str] = {}
+    for item in applied:
+        source, separator, thai = item.partition(_TERM_SEPARATOR)
+        if separator:
+            pairs[normalize_term(source)] = thai.strip()
+    return pairs
+
+
+async def index_glossary_terms(
+    session: AsyncSession,
+    submission_id: str,
+    entries: Sequence[GlossaryEntryRead],
+    replace: bool = False,
+) -> None:
+    """Record which glossary terms a submission's draft was generated with.
+
+    The caller owns the transaction; rows are flushed with the submission itself.
+    """
+
+    if replace:
+        await session.execute(
+            delete(SubmissionGlossaryTerm).where(
+                SubmissionGlossaryTerm.submission_id == submission_id
+            )
+        )
+    by_term = {normalize_term(entry.source_term): entry for entry in entries}
+    if by_term:
+        await session.execute(
+            insert(SubmissionGlossaryTerm),
+            [
+                {
+                    "submission_id": submission_id,
+                    "source_term": source,
+                    "thai_term": entry.thai_term,
+                    "glossary_entry_id": entry.id,
+                }
+                for source, entry in by_term.items()
+            ],
+        )
+
+
+class GlossaryImpactService:
+    """Answer "which submissions used this term" without scanning JSON columns."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def affected_submissions(
+        self,
+        entry: GlossaryEntryRead,
+        include_approved: bool = False,
+        stale_only: bool = True,
+    ) -> GlossaryImpactList:
+        statement = (
+            select(
+                Submission.id,
+                Submission.title,
+                Submission.status,
+                Submission.updated_at,
+                SubmissionGlossaryTerm.thai_term,
+            )
+            .join(SubmissionGlossaryTerm, SubmissionGlossaryTerm.submission_id == Submission.id)
+            .where(
+                or_(
+                    SubmissionGlossaryTerm.glossary_entry_id == entry.id,
+                    # Rows indexed before entry ids were recorded only carry the term.
+                    and_(
+                        SubmissionGlossaryTerm.glossary_entry_id.is_(None),
+                        SubmissionGlossaryTerm.source_term == normalize_term(entry.source_term),
+                    ),
+                )
+            )
+            .order_by(Submission.updated_at.desc())
+        )
+        if stale_only:
+            statement = statement.where(SubmissionGlossaryTerm.thai_term != entry.thai_term)
+        if not include_approved:
+            statement = statement.where(Submission.status != SubmissionStatus.APPROVED.value)
+
+        rows = (await self._session.execute(statement)).all()
+        items = [
+            GlossaryImpactItem(
+                id=row.id,
+                title=row.title,
+                status=row.status,
+                thai_term_used=row.thai_term,
+                updated_at=row.updated_at,
+            )
+            for row in rows
+        ]
+        return GlossaryImpactList(items=items, total=len(items))
+
+    async def rebuild_index(self) -> int:
+        """Rebuild the index from ``Submission.glossary_terms``; returns rows written."""
+
+        await self._session.execute(delete(SubmissionGlossaryTerm))
+        entry_ids = {
+            normalize_term(source_term): entry_id
+            for entry_id, source_term in await self._session.execute(
+                select(GlossaryEntry.id, GlossaryEntry.source_term)
+            )
+        }
+        written = 0
+        result = await self._session.stream(select(Submission.id, Submission.glossary_terms))
+        async for rows in result.partitions(_BACKFILL_BATCH_SIZE):
+            params = [
+                {
+                    "submission_id": row.id,
+                    "source_term": source,
+                    "thai_term": thai,
+                    "glossary_entry_id": entry_ids.get(source),
+                }
+                for row in rows
+                for source, thai in _parse_applied_terms(row.glossary_terms or []).items()
+            ]
+            if params:
+                await self._session.execute(insert(SubmissionGlossaryTerm), params)
+                written += len(params)
+        await self._session.commit()
+        return written
+
+
+async def redraft_submissions(
+    submission_ids: Sequence[str],
+    session_factory: async_sessionmaker[AsyncSession],
+    redraft: Callable[[AsyncSession, str], Awaitable[object]],
+    concurrency: int,
+) -> None:
+    """Re-draft each submission in its own session, at most ``concurrency`` at a time."""
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(submission_id: str) -> None:
+        async with semaphore:
+            async with session_factory() as session:
+                await redraft(session, submission_id)
+
+    results = await asyncio.gather(
+        *(_run(submission_id) for submission_id in submission_ids),
+        return_exceptions=True,
+    )
+    for submission_id, outcome in zip(submission_ids, results):
+        if isinstance(outcome, Exception):
+            logger.error("Re-draft failed for submission %s", submission_id, exc_info=outcome)
@@ -3,11 +3,18 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, case, func, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import Submission, SubmissionStatus
-from ..schemas import MetricsOverview
+from ..core.edit_distance import post_edit_distance
+from ..models import Submission, SubmissionDailyRollup, SubmissionStatus
+from ..schemas import (
+    MetricsOverview,
+    MetricsTimeseries,
+    MetricsTimeseriesPoint,
+    TimeseriesGroup,
+)
+from .rollups import has_warnings
 
 
 class MetricsService:
@@ -17,35 +24,51 @@ class MetricsService:
         self._session = session
 
     async def overview(self, days: int | None = None) -> MetricsOverview:
-        window_clause = None
+        """Aggregate in the database: one grouped row per status, no ORM objects."""
+
+        columns = Submission.__table__.c
+        query = select(
+            columns.status,
+            func.count(),
+            func.coalesce(func.sum(columns.usage_tokens), 0),
+            func.coalesce(func.sum(columns.cost_usd), 0.0),
+            func.coalesce(
+                func.sum(case((has_warnings(self._session, columns.warnings), 1), else_=0)), 0
+            ),
+            func.sum(columns.post_edit_distance),
+            func.count(columns.post_edit_distance),
+            func.sum(columns.post_edit_ratio),
+            func.count(columns.post_edit_ratio),
+            func.sum(columns.time_to_approval_seconds),
+            func.count(columns.time_to_approval_seconds),
+        ).group_by(columns.status)
         if days:
             window_start = datetime.now(timezone.utc) - timedelta(days=days)
-            window_clause = Submission.created_at >= window_start
-
-        base_query = select(Submission)
-        if window_clause is not None:
-            base_query = base_query.where(window_clause)
-
-        submissions = (await self._session.execute(base_query)).scalars().all()
+            query = query.where(columns.created_at >= window_start)
 
-        total_submissions = len(submissions)
         by_status: dict[str, int] = {status.value: 0 for status in SubmissionStatus}
         total_tokens = 0
         total_cost = 0.0
         warnings_count = 0
-        approved = 0
-
-        for submission in submissions:
-            by_status[submission.status] = by_status.get(submission.status, 0) + 1
-            total_tokens += submission.usage_tokens or 0
-            total_cost += submission.cost_usd or 0.0
-            if submission.warnings:
-                warnings_count += 1
-            if submission.status == SubmissionStatus.APPROVED.value:
-                approved += 1
+        # Sum/count pairs, so averages can be combined across the status groups.
+        distance = _Average()
+        ratio = _Average()
+        approval_seconds = _Average()
+        for row in await self._session.execute(query):
+            status, count, tokens, cost, warned = row[:5]
+            by_status[status] = by_status.get(status, 0) + count
+            total_tokens += int(tokens)
+            total_cost += float(cost)
+            warnings_count += int(warned)
+            distance.add(*row[5:7])
+            ratio.add(*row[7:9])
+            approval_seconds.add(*row[9:11])
 
+        total_submissions = sum(by_status.values())
+        approved = by_status.get(SubmissionStatus.APPROVED.value, 0)
         average_tokens = (total_tokens / total_submissions) if total_submissions else None
         approval_rate = (approved / total_submissions) if total_submissions else 0.0
+        average_approval_seconds = approval_seconds.value
 
         return MetricsOverview(
             total_submissions=total_submissions,
@@ -55,4 +78,154 @@ class MetricsService:
             average_tokens=average_tokens,
             total_tokens=total_tokens,
             total_cost_usd=round(total_cost, 4),
+            average_post_edit_distance=_rounded(distance.value, 2),
+            average_post_edit_ratio=_rounded(ratio.value, 4),
+            average_time_to_approval_hours=_rounded(
+                average_approval_seconds / 3600 if average_approval_seconds is not None else None,
+                2,
+            ),
         )
+
+    async def timeseries(
+        self, days: int = 30, group_by: TimeseriesGroup | None = None
+    ) -> MetricsTimeseries:
+        """Per-day totals read from the rollup table only, so cost grows with ``days``."""
+
+        rollups = SubmissionDailyRollup.__table__.c
+        start = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        group = rollups[group_by] if group_by else literal(None).label("grp")
+        approved = rollups.status == SubmissionStatus.APPROVED.value
+        query = (
+            select(
+                rollups.day,
+                group,
+                func.sum(rollups.submissions),
+                func.sum(case((approved, rollups.submissions), else_=0)),
+                func.sum(rollups.usage_tokens),
+                func.sum(rollups.cost_usd),
+                func.sum(rollups.with_warnings),
+                func.sum(rollups.post_edit_ratio_sum),
+                func.sum(rollups.post_edit_ratio_count),
+                func.sum(rollups.approval_seconds_sum),
+                func.sum(rollups.approval_seconds_count),
+            )
+            .where(rollups.day >= start)
+            .group_by(rollups.day, *([group] if group_by else []))
+            # Status moves can leave zeroed rows behind.
+            .having(func.sum(rollups.submissions) > 0)
+            .order_by(rollups.day, *([group] if group_by else []))
+        )
+        points = []
+        for row in await self._session.execute(query):
+            day, key, submissions, approved_count, tokens, cost, warned = row[:7]
+            ratio, approval_seconds = _Average(), _Average()
+            ratio.add(*row[7:9])
+            approval_seconds.add(*row[9:11])
+            points.append(
+                MetricsTimeseriesPoint(
+                    day=day,
+                    group=key or None,
+                    submissions=submissions,
+                    approved=approved_count,
+                    usage_tokens=tokens,
+                    cost_usd=round(float(cost), 4),
+                    submissions_with_warnings=warned,
+                    average_post_edit_ratio=_rounded(ratio.value, 4),
+                    average_time_to_approval_hours=_rounded(
+                        approval_seconds.value / 3600
+                        if approval_seconds.value is not None
+                        else None,
+                        2,
+                    ),
+                )
+            )
+        return MetricsTimeseries(days=days, group_by=group_by, points=points)
+
+    async def backfill_edit_metrics(self, batch_size: int = 500) -> int:
+        """Compute post-edit and time-to-approval columns for rows written before them."""
+
+        table = Submission.__table__
+        approved = table.c.status == SubmissionStatus.APPROVED.value
+        pending = or_(
+            table.c.thai_final.is_not(None) & table.c.post_edit_distance.is_(None),
+            approved & table.c.time_to_approval_seconds.is_(None),
+        )
+        # Archived stubs have no text to measure.
+        pending = pending & table.c.archived_at.is_(None)
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            # Derived metrics are not an edit, so ``updated_at`` stays as it was.
+            .values(
+                post_edit_distance=bindparam("distance"),
+                post_edit_ratio=bindparam("ratio"),
+                time_to_approval_seconds=bindparam("approval_seconds"),
+                updated_at=table.c.updated_at,
+            )
+        )
+        last_id = ""
+        updated = 0
+        while True:
+            rows = (
+                await self._session.execute(
+                    select(
+                        table.c.id,
+                        table.c.thai_draft,
+                        table.c.thai_final,
+                        table.c.status,
+                        table.c.created_at,
+                        table.c.last_reviewed_at,
+                        table.c.time_to_approval_seconds,
+                    )
+                    .where(pending, table.c.id > last_id)
+                    .order_by(table.c.id)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                return updated
+            params = []
+            for row in rows:
+                distance, ratio = (
+                    post_edit_distance(row.thai_draft, row.thai_final)
+                    if row.thai_final is not None
+                    else (None, None)
+                )
+                approval_seconds = row.time_to_approval_seconds
+                if (
+                    approval_seconds is None
+                    and row.status == SubmissionStatus.APPROVED.value
+                    and row.last_reviewed_at is not None
+                ):
+                    approval_seconds = (row.last_reviewed_at - row.created_at).total_seconds()
+                params.append(
+                    {
+                        "row_id": row.id,
+                        "distance": distance,
+                        "ratio": ratio,
+                        "approval_seconds": approval_seconds,
+                    }
+                )
+            await self._session.execute(statement, params)
+            await self._session.commit()
+            updated += len(rows)
+            last_id = rows[-1].id
+
+
+class _Average:
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, total: float | None, count: int) -> None:
+        if count:
+            self.total += float(total)
+            self.count += count
+
+    @property
+    def value(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+
+def _rounded(value: float | None, digits: int) -> float | None:
+    return round(float(value), digits) if value is not None else None
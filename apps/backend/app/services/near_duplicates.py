@@ -0,0 +1,224 @@
+"""Near-duplicate detection over submission source text."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.simhash import BAND_COUNT, bands, hamming_distance, simhash, to_signed, to_unsigned
+from ..models import Submission, SubmissionStatus
+from ..models.submission import fingerprint_columns
+from ..schemas import NearDuplicateMatch
+from .archive import SubmissionArchiver
+
+_BACKFILL_BATCH_SIZE = 5000
+# Ids per status query when a lookup only wants approved rows.
+_FILTER_CHUNK = 500
+_NUMBER_PATTERN = re.compile(r"\d[\d.,:/-]*\d|\d")
+
+
+@dataclass
+class ApprovedReference:
+    match: NearDuplicateMatch
+    source_text: str
+
+
+def adapt_reused_copy(reference_source: str, new_source: str, reference_final: str) -> str:
+    """Swap numbers that changed between two near-identical sources into reused copy.
+
+    Only applied when both sources carry the same count of numeric tokens, which is the
+    common "same promo, new price/date" case. Anything else is left for the editor.
+    """
+
+    old_numbers = _NUMBER_PATTERN.findall(reference_source)
+    new_numbers = _NUMBER_PATTERN.findall(new_source)
+    if len(old_numbers) != len(new_numbers):
+        return reference_final
+
+    replacements = {old: new for old, new in zip(old_numbers, new_numbers) if old != new}
+    if not replacements:
+        return reference_final
+
+    alternatives = "|".join(map(re.escape, sorted(replacements, key=len, reverse=True)))
+    pattern = re.compile(r"(?<![\d.,])(" + alternatives + r")(?!\d)")
+    return pattern.sub(lambda match: replacements[match.group(1)], reference_final)
+
+
+class NearDuplicateService:
+    """Answer near-duplicate lookups from the stored fingerprints and their bands."""
+
+    def __init__(self, session: AsyncSession, max_distance: int = 3) -> None:
+        self._session = session
+        self._max_distance = max_distance
+
+    @staticmethod
+    def fingerprint(source_text: str) -> int:
+        return to_signed(simhash(source_text))
+
+    async def find(
+        self,
+        source_text: str,
+        max_distance: int | None = None,
+        limit: int = 5,
+        approved_only: bool = False,
+        exclude_id: str | None = None,
+    ) -> list[NearDuplicateMatch]:
+        references = await self._lookup(
+            source_text,
+            max_distance=max_distance,
+            limit=limit,
+            approved_only=approved_only,
+            exclude_id=exclude_id,
+        )
+        return [reference.match for reference in references]
+
+    async def nearest_approved(self, source_text: str) -> ApprovedReference | None:
+        references = await self._lookup(source_text, limit=1, approved_only=True)
+        return references[0] if references else None
+
+    async def _lookup(
+        self,
+        source_text: str,
+        max_distance: int | None = None,
+        limit: int = 5,
+        approved_only: bool = False,
+        exclude_id: str | None = None,
+    ) -> list[ApprovedReference]:
+        threshold = self._max_distance if max_distance is None else max_distance
+        matches = await self._matches(simhash(source_text), threshold, exclude_id)
+        if approved_only:
+            matches = await self._approved(matches)
+        # An archived approval can still turn out to have no final copy, so keep loading
+        # the next closest rows until ``limit`` references are found.
+        references: list[ApprovedReference] = []
+        for start in range(0, len(matches), limit):
+            references.extend(
+                await self._references(matches[start : start + limit], approved_only)
+            )
+            if len(references) >= limit:
+                break
+        return references[:limit]
+
+    async def _matches(
+        self, fingerprint: int, threshold: int, exclude_id: str | None
+    ) -> list[tuple[str, int]]:
+        """``(id, distance)`` of stored fingerprints within ``threshold``, closest first."""
+
+        statement = select(Submission.id, Submission.source_fingerprint)
+        if threshold < BAND_COUNT:
+            band_columns = (
+                Submission.source_band_0,
+                Submission.source_band_1,
+                Submission.source_band_2,
+                Submission.source_band_3,
+            )
+            statement = statement.where(
+                or_(*(column == value for column, value in zip(band_columns, bands(fingerprint))))
+            )
+        else:
+            # Beyond three bits a match need not share a band, so compare against all.
+            statement = statement.where(Submission.source_fingerprint.is_not(None))
+        if exclude_id is not None:
+            statement = statement.where(Submission.id != exclude_id)
+
+        matches = []
+        for row in await self._session.execute(statement):
+            distance = hamming_distance(fingerprint, to_unsigned(row.source_fingerprint))
+            if distance <= threshold:
+                matches.append((row.id, distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    async def _approved(self, matches: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        """The ``matches`` whose approved copy can be reused, in the same order."""
+
+        approved: set[str] = set()
+        for start in range(0, len(matches), _FILTER_CHUNK):
+            ids = [item_id for item_id, _ in matches[start : start + _FILTER_CHUNK]]
+            # Filtered here rather than in SQL, where the planner would rather walk every
+            # approved row through the status index than look these ids up.
+            result = await self._session.execute(
+                select(
+                    Submission.id,
+                    Submission.status,
+                    Submission.thai_final.is_not(None).label("has_final"),
+                    Submission.archived_at,
+                ).where(Submission.id.in_(ids))
+            )
+            approved.update(
+                row.id
+                for row in result
+                if row.status == SubmissionStatus.APPROVED.value
+                # Archived rows keep their final copy in the archive.
+                and (row.has_final or row.archived_at is not None)
+            )
+        return [match for match in matches if match[0] in approved]
+
+    async def _references(
+        self, matches: list[tuple[str, int]], approved_only: bool
+    ) -> list[ApprovedReference]:
+        distances = dict(matches)
+        statement = select(
+            Submission.id,
+            Submission.title,
+            Submission.status,
+            Submission.source_text,
+            Submission.thai_final,
+            Submission.archived_at,
+        ).where(Submission.id.in_(list(distances)))
+        rows = [dict(row._mapping) for row in await self._session.execute(statement)]
+        await SubmissionArchiver(self._session).hydrate_rows(rows)
+        if approved_only:
+            rows = [row for row in rows if row["thai_final"] is not None]
+        rows.sort(key=lambda row: (distances[row["id"]], row["id"]))
+        return [
+            ApprovedReference(
+                match=NearDuplicateMatch(
+                    id=row["id"],
+                    title=row["title"],
+                    status=row["status"],
+                    distance=distances[row["id"]],
+                    thai_final=row["thai_final"],
+                ),
+                source_text=row["source_text"],
+            )
+            for row in rows
+        ]
+
+
+async def backfill_fingerprints(session: AsyncSession) -> int:
+    """Fingerprint submissions created before near-duplicate lookups existed.
+
+    Commits after every batch; returns the number of rows fingerprinted.
+    """
+
+    table = Submission.__table__
+    updated = 0
+    while True:
+        rows = (
+            await session.execute(
+                select(table.c.id, table.c.source_text)
+                .where(table.c.source_fingerprint.is_(None))
+                .limit(_BACKFILL_BATCH_SIZE)
+            )
+        ).all()
+        if not rows:
+            return updated
+        await session.execute(
+            update(table)
+            .where(table.c.id == bindparam("row_id"))
+            # Keep ``updated_at`` untouched; this is derived data, not an edit. The
+            # fingerprint columns are SET from the matching parameter keys.
+            .values(updated_at=table.c.updated_at),
+            [
+                {
+                    "row_id": row.id,
+                    **fingerprint_columns(NearDuplicateService.fingerprint(row.source_text)),
+                }
+                for row in rows
+            ],
+        )
+        await session.commit()
+        updated += len(rows)
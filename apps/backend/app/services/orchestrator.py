@@ -20,11 +20,11 @@ class TranslationOrchestrator:
         self._settings = settings
         self._providers = providers
 
-    async def generate(self, prompt: str) -> ProviderOutput:
+    async def generate(self, prompt: str, locale: str = "th") -> ProviderOutput:
         errors: list[str] = []
         for provider in self._providers:
             try:
-                return await self._attempt(provider, prompt)
+                return await self._attempt(provider, prompt, locale)
             except Exception as exc:  # pragma: no cover - defensive fallback
                 errors.append(f"{provider.name}: {exc}")
                 continue
@@ -32,7 +32,9 @@ class TranslationOrchestrator:
             "All translation providers failed: " + "; ".join(errors)
         )
 
-    async def _attempt(self, provider: TranslationProvider, prompt: str) -> ProviderOutput:
+    async def _attempt(
+        self, provider: TranslationProvider, prompt: str, locale: str
+    ) -> ProviderOutput:
         async for attempt in AsyncRetrying(
             retry=retry_if_exception_type(Exception),
             stop=stop_after_attempt(3),
@@ -40,7 +42,7 @@ class TranslationOrchestrator:
             reraise=True,
         ):
             with attempt:
-                return await provider.generate(prompt)
+                return await provider.generate(prompt, locale)
         raise TranslationProviderError(f"Provider {provider.name} exhausted retries")
 
     @classmethod
@@ -3,39 +3,89 @@ from __future__ import annotations
 
 from typing import Iterable, Optional
 
+from ..core.locales import PRIMARY_LOCALE, language_name
 from ..schemas.glossary import GlossaryEntryRead
 
-PROMPT_HEADER = (
-    "You are a senior Thai copywriter. Translate and adapt English marketing content into Thai\n"
-    "so that it feels natively written. Preserve meaning while matching the requested tone,"
-    " audience, and channel."
+_PROMPT_HEADER_TEMPLATE = (
+    "You are a senior {language} copywriter. Translate and adapt English marketing content into"
+    " {language}\nso that it feels natively written. Preserve meaning while matching the requested"
+    " tone, audience, and channel."
 )
 
 
-def _format_glossary(entries: Iterable[GlossaryEntryRead]) -> str:
-    items = [f"- {entry.source_term} → {entry.thai_term}" for entry in entries]
+def prompt_header(locale: str = PRIMARY_LOCALE) -> str:
+    return _PROMPT_HEADER_TEMPLATE.format(language=language_name(locale))
+
+
+PROMPT_HEADER = prompt_header()
+
+
+def _format_glossary(entries: Iterable[GlossaryEntryRead], locale: str) -> str:
+    if locale == PRIMARY_LOCALE:
+        items = [f"- {entry.source_term} → {entry.thai_term}" for entry in entries]
+    else:
+        # The glossary only carries approved Thai terms; other locales get the term list
+        # so brand vocabulary is still handled consistently.
+        items = [f"- {entry.source_term} (approved Thai: {entry.thai_term})" for entry in entries]
     return "\n".join(items) if items else "- (no enforced terms)"
 
 
-def build_translation_prompt(
+PROMPT_SECTION_SEPARATOR = "\n\n"
+
+
+def source_section(english_text: str) -> str:
+    """The prompt section that carries the content being adapted."""
+
+    return "Content to adapt:\n" + english_text.strip()
+
+
+def build_translation_prompt_sections(
     english_text: str,
     thai_tone: str,
     audience: Optional[str],
     channel: Optional[str],
     glossary_entries: Iterable[GlossaryEntryRead],
-) -> str:
-    """Construct the base prompt supplied to the LLM orchestrator."""
+    locale: str = PRIMARY_LOCALE,
+) -> list[str]:
+    """Return the prompt as separate sections.
+
+    Most sections (header, tone, closing instructions, common glossary blocks) repeat
+    across submissions, so they are stored once each in the text blob store.
+    """
 
-    sections = [PROMPT_HEADER]
+    language = language_name(locale)
+    sections = [prompt_header(locale)]
     sections.append(f"Desired tone: {thai_tone}")
     if audience:
         sections.append(f"Target audience: {audience}")
     if channel:
         sections.append(f"Channel: {channel}")
-    sections.append("Glossary requirements:\n" + _format_glossary(glossary_entries))
-    sections.append("Content to adapt:\n" + english_text.strip())
+    sections.append("Glossary requirements:\n" + _format_glossary(glossary_entries, locale))
+    sections.append(source_section(english_text))
     sections.append(
-        "Output must be polished Thai copy. Avoid literal word-for-word translation and respect "
-        "cultural nuances. Highlight any ambiguous phrases in a reviewer note section."
+        f"Output must be polished {language} copy. Avoid literal word-for-word translation and "
+        "respect cultural nuances. Highlight any ambiguous phrases in a reviewer note section."
+    )
+    return sections
+
+
+def build_translation_prompt(
+    english_text: str,
+    thai_tone: str,
+    audience: Optional[str],
+    channel: Optional[str],
+    glossary_entries: Iterable[GlossaryEntryRead],
+    locale: str = PRIMARY_LOCALE,
+) -> str:
+    """Construct the base prompt supplied to the LLM orchestrator."""
+
+    return PROMPT_SECTION_SEPARATOR.join(
+        build_translation_prompt_sections(
+            english_text=english_text,
+            thai_tone=thai_tone,
+            audience=audience,
+            channel=channel,
+            glossary_entries=glossary_entries,
+            locale=locale,
+        )
     )
-    return "\n\n".join(sections)
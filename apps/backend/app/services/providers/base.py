@@ -7,6 +7,7 @@ from typing import Protocol
 
 @dataclass
 class ProviderOutput:
+    # Draft in the requested locale; the name predates non-Thai locales.
     thai_text: str
     provider_name: str
     raw_prompt: str
@@ -17,7 +18,7 @@ class ProviderOutput:
 class TranslationProvider(Protocol):
     name: str
 
-    async def generate(self, prompt: str) -> ProviderOutput:
-        """Produce a Thai adaptation for the supplied prompt."""
+    async def generate(self, prompt: str, locale: str = "th") -> ProviderOutput:
+        """Produce an adaptation in ``locale`` (Thai by default) for the supplied prompt."""
 
         raise NotImplementedError
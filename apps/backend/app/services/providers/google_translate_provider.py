@@ -19,12 +19,12 @@ class GoogleTranslateProvider(TranslationProvider):
         self._api_key = settings.google_translate_api_key
         self._endpoint = "https://translation.googleapis.com/language/translate/v2"
 
-    async def generate(self, prompt: str) -> ProviderOutput:
+    async def generate(self, prompt: str, locale: str = "th") -> ProviderOutput:
         # For fallback we translate literal text; the prompt format ends with the source content.
         english_text = prompt.split("Content to adapt:\n", 1)[-1].strip()
         payload = {
             "q": english_text,
-            "target": "th",
+            "target": locale,
             "format": "text",
         }
         async with httpx.AsyncClient(timeout=20) as client:
@@ -7,6 +7,7 @@ from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
 from ...core.config import Settings
+from ...core.locales import language_name
 from .base import ProviderOutput, TranslationProvider
 
 
@@ -20,12 +21,15 @@ class OpenAITranslationProvider(TranslationProvider):
         self._model = settings.openai_model
         self._temperature = settings.openai_temperature
 
-    async def generate(self, prompt: str) -> ProviderOutput:
+    async def generate(self, prompt: str, locale: str = "th") -> ProviderOutput:
         completion: ChatCompletion = await self._client.chat.completions.create(  # type: ignore[assignment]
             model=self._model,
             temperature=self._temperature,
             messages=[
-                {"role": "system", "content": "You are a Thai localization expert."},
+                {
+                    "role": "system",
+                    "content": f"You are a {language_name(locale)} localization expert.",
+                },
                 {"role": "user", "content": prompt},
             ],
         )
@@ -0,0 +1,210 @@
+"""Revision history for submission draft and final copy."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.delta import apply_delta, diff_segments, make_delta
+from ..models import Submission, SubmissionRevision
+from ..schemas import (
+    DiffSegment,
+    SubmissionRevisionDiff,
+    SubmissionRevisionList,
+    SubmissionRevisionRead,
+    SubmissionRevisionSummary,
+)
+
+
+@dataclass
+class RevisionState:
+    revision: int
+    reason: str
+    created_at: datetime
+    thai_draft: str
+    thai_final: str | None
+
+
+class RevisionService:
+    """Record and reconstruct delta-encoded revisions.
+
+    Reconstructing a revision reads at most ``snapshot_interval`` rows: the nearest
+    snapshot at or before it plus the deltas that follow.
+    """
+
+    def __init__(self, session: AsyncSession, snapshot_interval: int = 20) -> None:
+        self._session = session
+        self._snapshot_interval = max(1, snapshot_interval)
+
+    def record_new(self, submissions: Sequence[Submission], reason: str = "created") -> None:
+        """Add the first revision of freshly inserted submissions (no queries needed)."""
+
+        self._session.add_all(
+            [
+                self._snapshot(submission, revision=1, reason=reason)
+                for submission in submissions
+            ]
+        )
+
+    async def ensure_baseline(self, submission: Submission) -> None:
+        """Snapshot the current text of submissions created before revisions existed.
+
+        Call before mutating the submission so the pre-edit text is kept.
+        """
+
+        if await self._latest_revision(submission.id, lock=True) == 0:
+            self._session.add(self._snapshot(submission, revision=1, reason="baseline"))
+            await self._session.flush()
+
+    async def record(self, submission: Submission, reason: str) -> int:
+        """Store the submission's current text as a new revision unless it is unchanged."""
+
+        latest = await self._latest_revision(submission.id, lock=True)
+        if latest == 0:
+            self._session.add(self._snapshot(submission, revision=1, reason=reason))
+            return 1
+
+        previous = await self.reconstruct(submission.id, latest)
+        assert previous is not None
+        if (previous.thai_draft, previous.thai_final) == (
+            submission.thai_draft,
+            submission.thai_final,
+        ):
+            return latest
+
+        revision = latest + 1
+        if (revision - 1) % self._snapshot_interval == 0:
+            self._session.add(self._snapshot(submission, revision=revision, reason=reason))
+        else:
+            self._session.add(
+                SubmissionRevision(
+                    submission_id=submission.id,
+                    revision=revision,
+                    reason=reason,
+                    is_snapshot=False,
+                    draft_delta=make_delta(previous.thai_draft, submission.thai_draft),
+                    final_delta=make_delta(previous.thai_final or "", submission.thai_final or ""),
+                    has_final=submission.thai_final is not None,
+                )
+            )
+        return revision
+
+    async def list_revisions(self, submission_id: str) -> SubmissionRevisionList:
+        rows = (
+            await self._session.execute(
+                select(
+                    SubmissionRevision.revision,
+                    SubmissionRevision.reason,
+                    SubmissionRevision.is_snapshot,
+                    SubmissionRevision.created_at,
+                )
+                .where(SubmissionRevision.submission_id == submission_id)
+                .order_by(SubmissionRevision.revision.desc())
+            )
+        ).all()
+        items = [SubmissionRevisionSummary.model_validate(row) for row in rows]
+        return SubmissionRevisionList(items=items, total=len(items))
+
+    async def get_revision(
+        self, submission_id: str, revision: int
+    ) -> SubmissionRevisionRead | None:
+        state = await self.reconstruct(submission_id, revision)
+        if state is None:
+            return None
+        return SubmissionRevisionRead(
+            revision=state.revision,
+            reason=state.reason,
+            created_at=state.created_at,
+            thai_draft=state.thai_draft,
+            thai_final=state.thai_final,
+        )
+
+    async def diff(
+        self, submission_id: str, from_revision: int, to_revision: int
+    ) -> SubmissionRevisionDiff | None:
+        old = await self.reconstruct(submission_id, from_revision)
+        new = await self.reconstruct(submission_id, to_revision)
+        if old is None or new is None:
+            return None
+        return SubmissionRevisionDiff(
+            from_revision=from_revision,
+            to_revision=to_revision,
+            thai_draft=[
+                DiffSegment(op=op, text=text)
+                for op, text in diff_segments(old.thai_draft, new.thai_draft)
+            ],
+            thai_final=[
+                DiffSegment(op=op, text=text)
+                for op, text in diff_segments(old.thai_final or "", new.thai_final or "")
+            ],
+        )
+
+    async def reconstruct(self, submission_id: str, revision: int) -> RevisionState | None:
+        """Rebuild ``revision`` from its nearest snapshot and the deltas after it."""
+
+        snapshot = (
+            select(func.max(SubmissionRevision.revision))
+            .where(
+                SubmissionRevision.submission_id == submission_id,
+                SubmissionRevision.is_snapshot.is_(True),
+                SubmissionRevision.revision <= revision,
+            )
+            .scalar_subquery()
+        )
+        rows = (
+            await self._session.scalars(
+                select(SubmissionRevision)
+                .where(
+                    SubmissionRevision.submission_id == submission_id,
+                    SubmissionRevision.revision >= snapshot,
+                    SubmissionRevision.revision <= revision,
+                )
+                .order_by(SubmissionRevision.revision)
+            )
+        ).all()
+        if not rows or rows[-1].revision != revision:
+            return None
+
+        draft, final = rows[0].thai_draft or "", rows[0].thai_final
+        for row in rows[1:]:
+            draft = apply_delta(draft, row.draft_delta or [])
+            final_text = apply_delta(final or "", row.final_delta or [])
+            final = final_text if row.has_final else None
+        last = rows[-1]
+        return RevisionState(
+            revision=last.revision,
+            reason=last.reason,
+            created_at=last.created_at,
+            thai_draft=draft,
+            thai_final=final,
+        )
+
+    async def _latest_revision(self, submission_id: str, lock: bool = False) -> int:
+        if lock:
+            # Concurrent edits would both allocate ``latest + 1``. Locking the submission
+            # row serializes them on PostgreSQL until commit; SQLite already allows only
+            # one writer at a time and ignores FOR UPDATE.
+            await self._session.execute(
+                select(Submission.id).where(Submission.id == submission_id).with_for_update()
+            )
+        latest = await self._session.scalar(
+            select(func.max(SubmissionRevision.revision)).where(
+                SubmissionRevision.submission_id == submission_id
+            )
+        )
+        return latest or 0
+
+    @staticmethod
+    def _snapshot(submission: Submission, revision: int, reason: str) -> SubmissionRevision:
+        return SubmissionRevision(
+            submission_id=submission.id,
+            revision=revision,
+            reason=reason,
+            is_snapshot=True,
+            thai_draft=submission.thai_draft,
+            thai_final=submission.thai_final,
+            has_final=submission.thai_final is not None,
+        )
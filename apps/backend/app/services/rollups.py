@@ -0,0 +1,257 @@
+"""Daily submission rollups maintained alongside every submission write."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+
+from sqlalchemy import ColumnElement, Select, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.upsert import dialect_insert
+from ..models import Submission, SubmissionDailyRollup
+
+MEASURES = (
+    "submissions",
+    "usage_tokens",
+    "cost_usd",
+    "with_warnings",
+    "post_edit_ratio_sum",
+    "post_edit_ratio_count",
+    "approval_seconds_sum",
+    "approval_seconds_count",
+)
+
+_COUNT_MEASURES = frozenset(
+    (
+        "submissions",
+        "usage_tokens",
+        "with_warnings",
+        "post_edit_ratio_count",
+        "approval_seconds_count",
+    )
+)
+
+RollupKey = tuple[date, str, str, str]
+
+
+def has_warnings(session: AsyncSession, warnings: ColumnElement) -> ColumnElement[bool]:
+    """SQL predicate for a non-empty ``warnings`` JSON array."""
+
+    if session.get_bind().dialect.name == "postgresql":
+        # ``json_array_length`` raises on JSON ``null``, so check the type first.
+        return (
+            case(
+                (func.json_typeof(warnings) == "array", func.json_array_length(warnings)),
+                else_=0,
+            )
+            > 0
+        )
+    # SQLite returns 0 for non-array JSON and NULL for SQL NULL.
+    return func.json_array_length(warnings) > 0
+
+
+def utc_day(session: AsyncSession, timestamp: ColumnElement) -> ColumnElement:
+    if session.get_bind().dialect.name == "postgresql":
+        return func.date(func.timezone("UTC", timestamp))
+    # SQLite stores naive UTC text timestamps.
+    return func.date(timestamp)
+
+
+class RollupDelta:
+    """Accumulate signed per-key changes to the rollup measures.
+
+    Subtract a submission before mutating it and add it back afterwards; measures that
+    did not change cancel out and are never written.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: dict[RollupKey, list[float]] = {}
+
+    def add(self, submission: Submission, sign: int = 1) -> None:
+        key, values = self.contribution(submission)
+        self.add_values(key, values, sign)
+
+    def subtract(self, submission: Submission) -> None:
+        self.add(submission, sign=-1)
+
+    def add_values(self, key: RollupKey, values: Sequence[float], sign: int = 1) -> None:
+        totals = self._deltas.setdefault(key, [0] * len(MEASURES))
+        for index, value in enumerate(values):
+            totals[index] += sign * value
+
+    def rows(self) -> list[dict[str, object]]:
+        return [
+            {
+                "day": key[0],
+                "status": key[1],
+                "provider": key[2],
+                "channel": key[3],
+                **_measure_values(totals),
+            }
+            for key, totals in self._deltas.items()
+            if any(totals)
+        ]
+
+    @staticmethod
+    def contribution(submission: Submission) -> tuple[RollupKey, tuple[float, ...]]:
+        created_at = submission.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        key = (
+            created_at.astimezone(timezone.utc).date(),
+            submission.status,
+            submission.provider_name or "",
+            submission.channel or "",
+        )
+        ratio = submission.post_edit_ratio
+        approval = submission.time_to_approval_seconds
+        return key, (
+            1,
+            submission.usage_tokens or 0,
+            submission.cost_usd or 0.0,
+            1 if submission.warnings else 0,
+            ratio or 0.0,
+            0 if ratio is None else 1,
+            approval or 0.0,
+            0 if approval is None else 1,
+        )
+
+
+class DailyRollups:
+    """Apply ``RollupDelta`` changes to ``submission_daily_rollups``.
+
+    Like the status counters, callers apply deltas inside the transaction that changes
+    the submissions, so dashboards read O(days) rollup rows instead of every submission.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def apply(self, delta: RollupDelta) -> None:
+        rows = delta.rows()
+        if not rows:
+            return
+        table = SubmissionDailyRollup.__table__
+        statement = dialect_insert(self._session, table)
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.day, table.c.status, table.c.provider, table.c.channel],
+                set_={name: table.c[name] + statement.excluded[name] for name in MEASURES},
+            ),
+            rows,
+        )
+
+    def grouped_measures(
+        self, *criteria: ColumnElement[bool], approval_seconds: ColumnElement | None = None
+    ) -> Select:
+        """Aggregate matching submissions per (day, provider, channel) in SQL.
+
+        ``approval_seconds`` replaces the stored time to approval, which lets a bulk
+        transition compute the rollup it is about to write without reading rows.
+        """
+
+        columns = Submission.__table__.c
+        approval = (
+            columns.time_to_approval_seconds if approval_seconds is None else approval_seconds
+        )
+        return (
+            select(
+                utc_day(self._session, columns.created_at).label("day"),
+                func.coalesce(columns.provider_name, "").label("provider"),
+                func.coalesce(columns.channel, "").label("channel"),
+                func.count(),
+                func.coalesce(func.sum(columns.usage_tokens), 0),
+                func.coalesce(func.sum(columns.cost_usd), 0.0),
+                func.coalesce(
+                    func.sum(case((has_warnings(self._session, columns.warnings), 1), else_=0)),
+                    0,
+                ),
+                func.coalesce(func.sum(columns.post_edit_ratio), 0.0),
+                func.count(columns.post_edit_ratio),
+                func.coalesce(func.sum(approval), 0.0),
+                func.count(approval),
+            )
+            .where(*criteria)
+            .group_by("day", "provider", "channel")
+        )
+
+    async def add_grouped(
+        self,
+        delta: RollupDelta,
+        status: str,
+        *criteria: ColumnElement[bool],
+        sign: int = 1,
+        approval_seconds: ColumnElement | None = None,
+    ) -> None:
+        """Fold the SQL aggregate of matching submissions into ``delta`` under ``status``."""
+
+        result = await self._session.execute(
+            self.grouped_measures(*criteria, approval_seconds=approval_seconds)
+        )
+        for day, provider, channel, *values in result:
+            # PostgreSQL sums integers as NUMERIC; keep the accumulators plain floats.
+            delta.add_values(
+                (_as_date(day), status, provider, channel), [float(value) for value in values], sign
+            )
+
+    async def ensure_initialized(self) -> None:
+        """Backfill the rollups for databases that predate them.
+
+        Workers start concurrently; rows another worker has already backfilled are left
+        as they are, so no startup ever replaces or duplicates a row.
+        """
+
+        existing = await self._session.execute(select(SubmissionDailyRollup.day).limit(1))
+        if existing.first() is not None:
+            return
+        rows = await self._recompute()
+        if rows:
+            table = SubmissionDailyRollup.__table__
+            await self._session.execute(
+                dialect_insert(self._session, table).on_conflict_do_nothing(
+                    index_elements=[table.c.day, table.c.status, table.c.provider, table.c.channel]
+                ),
+                rows,
+            )
+            await self._session.commit()
+
+    async def rebuild(self) -> int:
+        """Recompute every rollup row from the submissions table."""
+
+        rows = await self._recompute()
+        await self._session.execute(delete(SubmissionDailyRollup))
+        if rows:
+            await self._session.execute(insert(SubmissionDailyRollup), rows)
+        await self._session.commit()
+        return len(rows)
+
+    async def _recompute(self) -> list[dict[str, object]]:
+        columns = Submission.__table__.c
+        statement = self.grouped_measures().add_columns(columns.status).group_by(columns.status)
+        return [
+            {
+                "day": _as_date(day),
+                "provider": provider,
+                "channel": channel,
+                **_measure_values(values),
+                "status": status,
+            }
+            for day, provider, channel, *values, status in await self._session.execute(
+                statement
+            )
+        ]
+
+
+def _as_date(value: date | datetime | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def _measure_values(values: Sequence[float]) -> dict[str, float]:
+    return {
+        name: int(value) if name in _COUNT_MEASURES else float(value)
+        for name, value in zip(MEASURES, values)
+    }
@@ -0,0 +1,157 @@
+"""Full-text search over submission content."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from sqlalchemy import column, delete, func, literal_column, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+from ..core.segmentation import search_phrases, segment_for_search
+from ..db.fts import POSTGRES_SEARCH_TABLE, SQLITE_FTS_TABLE
+from ..db.upsert import dialect_insert
+from ..models import Submission, SubmissionStatus
+from ..schemas import SubmissionSearchHit, SubmissionSearchResults
+from .archive import SubmissionArchiver
+
+INDEXED_FIELDS = ("title", "source_text", "thai_draft", "thai_final")
+# bm25 column weights, in INDEXED_FIELDS order: titles and approved copy rank highest.
+_SQLITE_WEIGHTS = (4.0, 1.0, 1.0, 2.0)
+_REBUILD_BATCH_SIZE = 500
+
+_sqlite_fts = table(SQLITE_FTS_TABLE, column("rowid"), *(column(name) for name in INDEXED_FIELDS))
+_postgres_search = table(POSTGRES_SEARCH_TABLE, column("submission_id"), column("document"))
+
+
+class SearchService:
+    """Keep the submission full-text index in sync and query it.
+
+    SQLite uses an FTS5 table keyed by the submission ``rowid``; PostgreSQL keeps a
+    weighted ``tsvector`` per submission behind a GIN index. Both index the output of
+    :func:`segment_for_search`, so Thai text is matched by character bigrams.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @property
+    def _dialect(self) -> str:
+        return self._session.get_bind().dialect.name
+
+    async def index(self, submission: Submission) -> None:
+        """Write (or replace) the index entry for ``submission`` in the current transaction."""
+
+        documents = {
+            name: segment_for_search(getattr(submission, name) or "") for name in INDEXED_FIELDS
+        }
+        if self._dialect == "sqlite":
+            await self._session.execute(
+                text(
+                    f"INSERT OR REPLACE INTO {SQLITE_FTS_TABLE} "
+                    f"(rowid, {', '.join(INDEXED_FIELDS)}) "
+                    f"SELECT rowid, {', '.join(':' + name for name in INDEXED_FIELDS)} "
+                    "FROM submissions WHERE id = :submission_id"
+                ),
+                {"submission_id": submission.id, **documents},
+            )
+        elif self._dialect == "postgresql":
+            body = " ".join((documents["source_text"], documents["thai_draft"]))
+            document = (
+                func.setweight(func.to_tsvector("simple", documents["title"]), "A")
+                .op("||")(func.setweight(func.to_tsvector("simple", documents["thai_final"]), "B"))
+                .op("||")(func.setweight(func.to_tsvector("simple", body), "C"))
+            )
+            statement = dialect_insert(self._session, _postgres_search).values(
+                submission_id=submission.id, document=document
+            )
+            await self._session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[_postgres_search.c.submission_id],
+                    set_={"document": statement.excluded.document},
+                )
+            )
+
+    async def search(
+        self,
+        query: str,
+        status: SubmissionStatus | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SubmissionSearchResults:
+        """Return ranked matches for ``query``; every query word must match."""
+
+        phrases = search_phrases(query)
+        if not phrases:
+            return SubmissionSearchResults(items=[], total=0)
+
+        statement, rank = self._match(phrases)
+        if status:
+            statement = statement.where(Submission.status == status.value)
+
+        total = await self._session.scalar(
+            statement.with_only_columns(func.count()).order_by(None)
+        )
+        rows = await self._session.execute(
+            statement.add_columns(rank.label("rank"))
+            .order_by(rank.desc(), Submission.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        items = [SubmissionSearchHit.model_validate(row._mapping) for row in rows]
+        return SubmissionSearchResults(items=items, total=total or 0)
+
+    async def rebuild(self) -> int:
+        """Re-index every submission; returns how many were indexed."""
+
+        if self._dialect == "sqlite":
+            await self._session.execute(text(f"DELETE FROM {SQLITE_FTS_TABLE}"))
+        else:
+            await self._session.execute(delete(_postgres_search))
+
+        indexed = 0
+        statement = select(
+            *(getattr(Submission, name) for name in ("id", *INDEXED_FIELDS, "archived_at"))
+        )
+        result = await self._session.stream(
+            statement.execution_options(yield_per=_REBUILD_BATCH_SIZE)
+        )
+        archiver = SubmissionArchiver(self._session)
+        async for partition in result.partitions():
+            rows = [dict(row._mapping) for row in partition]
+            await archiver.hydrate_rows(rows)
+            for row in rows:
+                await self.index(SimpleNamespace(**row))  # type: ignore[arg-type]
+                indexed += 1
+        await self._session.commit()
+        return indexed
+
+    def _match(self, phrases: list[list[str]]) -> tuple[Select, ColumnElement[float]]:
+        columns = (
+            Submission.id,
+            Submission.title,
+            Submission.status,
+            Submission.channel,
+            Submission.created_at,
+        )
+        if self._dialect == "postgresql":
+            tsquery = func.to_tsquery(
+                "simple",
+                " & ".join("(" + " <-> ".join(phrase) + ")" for phrase in phrases),
+            )
+            statement = (
+                select(*columns)
+                .join(_postgres_search, _postgres_search.c.submission_id == Submission.id)
+                .where(_postgres_search.c.document.op("@@")(tsquery))
+            )
+            return statement, func.ts_rank_cd(_postgres_search.c.document, tsquery)
+
+        match = " ".join('"' + " ".join(phrase) + '"' for phrase in phrases)
+        fts = literal_column(SQLITE_FTS_TABLE)
+        statement = (
+            select(*columns)
+            .select_from(_sqlite_fts)
+            .join(Submission, literal_column("submissions.rowid") == _sqlite_fts.c.rowid)
+            .where(fts.op("MATCH")(match))
+        )
+        # bm25() is lower-is-better; negate it so both backends rank descending.
+        return statement, -func.bm25(fts, *_SQLITE_WEIGHTS)
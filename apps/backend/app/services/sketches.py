@@ -0,0 +1,213 @@
+"""In-memory quantile sketches of translation metrics, flushed to ``metric_sketches``."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import get_settings
+from ..core.sketch import DDSketch
+from ..db.session import get_sessionmaker
+from ..db.upsert import dialect_insert
+from ..models import MetricSketch
+from ..schemas import MetricDistribution, MetricPercentiles, SketchMetric
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process's rows; workers never write each other's sketches.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+SketchKey = tuple[datetime, str, str]
+
+
+def bucket_start(moment: datetime) -> datetime:
+    """Hour bucket a value recorded at ``moment`` belongs to."""
+
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class SketchRecorder:
+    """Per-process sketches keyed by (hour bucket, metric, provider).
+
+    Recording is a dictionary lookup and a bin increment, cheap enough for every
+    translation; ``MetricSketchService.flush`` drains the pending sketches.
+    """
+
+    def __init__(self, relative_accuracy: float) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._pending: dict[SketchKey, DDSketch] = {}
+
+    def record(
+        self,
+        metric: SketchMetric,
+        value: float | None,
+        provider: str | None = None,
+        at: datetime | None = None,
+    ) -> None:
+        if value is None or value < 0:
+            return
+        key = (bucket_start(at or datetime.now(timezone.utc)), metric, provider or "")
+        sketch = self._pending.get(key)
+        if sketch is None:
+            sketch = self._pending[key] = DDSketch(self.relative_accuracy)
+        sketch.add(value)
+
+    def drain(self) -> dict[SketchKey, DDSketch]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, pending: dict[SketchKey, DDSketch]) -> None:
+        """Put back sketches whose flush failed so they are retried next time."""
+
+        for key, sketch in pending.items():
+            current = self._pending.get(key)
+            if current is None:
+                self._pending[key] = sketch
+            else:
+                current.merge(sketch)
+
+    def pending(self) -> dict[SketchKey, DDSketch]:
+        return dict(self._pending)
+
+
+_recorder: SketchRecorder | None = None
+
+
+def get_sketch_recorder() -> SketchRecorder:
+    global _recorder
+    if _recorder is None:
+        _recorder = SketchRecorder(get_settings().metric_sketch_relative_accuracy)
+    return _recorder
+
+
+class MetricSketchService:
+    """Persist and query the quantile sketches."""
+
+    def __init__(self, session: AsyncSession, recorder: SketchRecorder | None = None) -> None:
+        self._session = session
+        self._recorder = recorder or get_sketch_recorder()
+
+    async def flush(self) -> int:
+        """Merge pending sketches into this worker's rows; returns rows written."""
+
+        pending = self._recorder.drain()
+        if not pending:
+            return 0
+        table = MetricSketch.__table__
+        try:
+            rows = []
+            for (bucket, metric, provider), sketch in pending.items():
+                existing = await self._session.scalar(
+                    select(MetricSketch.sketch).where(
+                        MetricSketch.bucket_start == bucket,
+                        MetricSketch.metric == metric,
+                        MetricSketch.provider == provider,
+                        MetricSketch.worker == WORKER_ID,
+                    )
+                )
+                if existing:
+                    merged = DDSketch.from_dict(existing)
+                    merged.merge(sketch)
+                else:
+                    merged = sketch
+                rows.append(
+                    {
+                        "bucket_start": bucket,
+                        "metric": metric,
+                        "provider": provider,
+                        "worker": WORKER_ID,
+                        "sketch": merged.to_dict(),
+                        "count": merged.count,
+                        "updated_at": datetime.now(timezone.utc),
+                    }
+                )
+            statement = dialect_insert(self._session, table)
+            await self._session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        table.c.bucket_start,
+                        table.c.metric,
+                        table.c.provider,
+                        table.c.worker,
+                    ],
+                    set_={
+                        "sketch": statement.excluded.sketch,
+                        "count": statement.excluded.count,
+                        "updated_at": statement.excluded.updated_at,
+                    },
+                ),
+                rows,
+            )
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            self._recorder.restore(pending)
+            raise
+        return len(rows)
+
+    async def percentiles(
+        self,
+        hours: int = 24,
+        metric: SketchMetric | None = None,
+        by_provider: bool = False,
+    ) -> MetricPercentiles:
+        """Merge every worker's sketches for the window, plus this worker's unflushed ones."""
+
+        since = bucket_start(datetime.now(timezone.utc) - timedelta(hours=hours - 1))
+        query = select(MetricSketch.metric, MetricSketch.provider, MetricSketch.sketch).where(
+            MetricSketch.bucket_start >= since
+        )
+        if metric is not None:
+            query = query.where(MetricSketch.metric == metric)
+
+        merged: dict[tuple[str, str], DDSketch] = {}
+
+        def fold(name: str, provider: str, sketch: DDSketch) -> None:
+            key = (name, provider if by_provider else "")
+            current = merged.get(key)
+            if current is None:
+                merged[key] = current = DDSketch(sketch.relative_accuracy)
+            current.merge(sketch)
+
+        for name, provider, data in await self._session.execute(query):
+            fold(name, provider, DDSketch.from_dict(data))
+        for (bucket, name, provider), sketch in self._recorder.pending().items():
+            if bucket >= since and (metric is None or name == metric):
+                fold(name, provider, sketch)
+
+        items = [
+            MetricDistribution(
+                metric=name,
+                provider=(provider or None) if by_provider else None,
+                count=sketch.count,
+                p50=sketch.quantile(0.5),
+                p95=sketch.quantile(0.95),
+                p99=sketch.quantile(0.99),
+                min=sketch.min,
+                max=sketch.max,
+                average=sketch.average,
+            )
+            for (name, provider), sketch in sorted(merged.items())
+        ]
+        return MetricPercentiles(hours=hours, items=items)
+
+
+async def flush_sketches() -> int:
+    async with get_sessionmaker()() as session:
+        return await MetricSketchService(session).flush()
+
+
+async def run_periodic_flush(interval: float) -> None:
+    """Flush the recorder every ``interval`` seconds until cancelled."""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_sketches()
+        except Exception:  # pragma: no cover - keep the loop alive across DB hiccups
+            logger.exception("Failed to flush metric sketches")
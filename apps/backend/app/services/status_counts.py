@@ -0,0 +1,89 @@
+"""Per-status submission counters maintained alongside status transitions."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.upsert import dialect_insert
+from ..models import Submission, SubmissionStatus, SubmissionStatusCount
+
+
+class StatusCounter:
+    """Serve status totals from ``submission_status_counts`` instead of ``COUNT(*)``.
+
+    Callers adjust the counters inside the same transaction that changes a status, so
+    the totals stay exact across workers without any cache invalidation.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def adjust(self, deltas: Mapping[str, int]) -> None:
+        table = SubmissionStatusCount.__table__
+        for status, delta in deltas.items():
+            if not delta:
+                continue
+            statement = dialect_insert(self._session, table).values(status=status, count=delta)
+            await self._session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.status],
+                    set_={"count": table.c.count + delta},
+                )
+            )
+
+    async def transition(self, old_status: str | None, new_status: str | None) -> None:
+        if old_status == new_status:
+            return
+        deltas: dict[str, int] = {}
+        if old_status is not None:
+            deltas[old_status] = deltas.get(old_status, 0) - 1
+        if new_status is not None:
+            deltas[new_status] = deltas.get(new_status, 0) + 1
+        await self.adjust(deltas)
+
+    async def counts(self) -> dict[str, int]:
+        result = await self._session.execute(
+            select(SubmissionStatusCount.status, SubmissionStatusCount.count)
+        )
+        counts = {status.value: 0 for status in SubmissionStatus}
+        counts.update({row.status: row.count for row in result})
+        return counts
+
+    async def ensure_initialized(self) -> None:
+        """Seed the counters from the submissions table the first time they are used.
+
+        Workers start concurrently; counters another worker has already seeded are left
+        as they are, so no startup ever replaces or duplicates a row.
+        """
+
+        existing = await self._session.execute(select(SubmissionStatusCount.status).limit(1))
+        if existing.first() is None:
+            table = SubmissionStatusCount.__table__
+            await self._session.execute(
+                dialect_insert(self._session, table).on_conflict_do_nothing(
+                    index_elements=[table.c.status]
+                ),
+                self._rows(await self._recount()),
+            )
+            await self._session.commit()
+
+    async def rebuild(self) -> dict[str, int]:
+        counts = await self._recount()
+        await self._session.execute(delete(SubmissionStatusCount))
+        await self._session.execute(insert(SubmissionStatusCount), self._rows(counts))
+        await self._session.commit()
+        return counts
+
+    async def _recount(self) -> dict[str, int]:
+        grouped = await self._session.execute(
+            select(Submission.status, func.count()).group_by(Submission.status)
+        )
+        counts = {status.value: 0 for status in SubmissionStatus}
+        counts.update({status: total for status, total in grouped})
+        return counts
+
+    @staticmethod
+    def _rows(counts: Mapping[str, int]) -> list[dict[str, object]]:
+        return [{"status": status, "count": total} for status, total in counts.items()]
@@ -1,87 +1,602 @@
 """Submission workflow service."""
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+from collections import Counter
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Float,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
-from ..models import Submission, SubmissionStatus
-from ..schemas import SubmissionCreate, SubmissionList, SubmissionRead, SubmissionUpdate
-from .translation import TranslationService
+from ..core.edit_distance import post_edit_distance
+from ..core.locales import PRIMARY_LOCALE, normalize_locales
+from ..db.group_commit import GroupCommitter
+from ..models import Submission, SubmissionStatus, SubmissionTranslation
+from ..models.submission import fingerprint_columns
+from ..schemas import (
+    SubmissionBulkTransition,
+    SubmissionBulkTransitionResult,
+    SubmissionCreate,
+    SubmissionFilter,
+    SubmissionList,
+    SubmissionRead,
+    SubmissionStatusCounts,
+    SubmissionSummary,
+    SubmissionTransitionOutcome,
+    SubmissionUpdate,
+)
+from .archive import ARCHIVED_FIELDS, SubmissionArchiver
+from .glossary_impact import index_glossary_terms
+from .near_duplicates import NearDuplicateService, adapt_reused_copy
+from .revisions import RevisionService
+from .rollups import DailyRollups, RollupDelta
+from .search import SearchService
+from .status_counts import StatusCounter
+from .text_blobs import TextBlobStore
+from .translation import ReusedDraft, TranslationResult, TranslationService
+from .usage_analytics import index_warnings
+
+# A new submission (not yet added to a session) and its per-locale translation results.
+SubmissionDraft = tuple[Submission, dict[str, TranslationResult]]
+
+LIST_SUMMARY_FIELDS = (
+    "title",
+    "status",
+    "tone",
+    "audience",
+    "channel",
+    "provider_name",
+    "usage_tokens",
+    "cost_usd",
+    "last_reviewed_at",
+    "created_at",
+    "updated_at",
+)
+LIST_SELECTABLE_FIELDS = frozenset(
+    (
+        *LIST_SUMMARY_FIELDS,
+        "source_text",
+        "thai_draft",
+        "thai_final",
+        "translation_prompt",
+        "notes",
+        "reviewer_notes",
+        "glossary_terms",
+        "warnings",
+    )
+)
+
+
+def _resolve_list_fields(fields: Sequence[str] | None) -> tuple[str, ...]:
+    if not fields:
+        return LIST_SUMMARY_FIELDS
+    requested = tuple(dict.fromkeys(name.strip() for name in fields if name.strip()))
+    unknown = [name for name in requested if name not in LIST_SELECTABLE_FIELDS and name != "id"]
+    if unknown:
+        raise ValueError(f"Unknown submission fields: {', '.join(unknown)}")
+    return tuple(name for name in requested if name != "id")
+
+
+def _encode_cursor(submission: Submission) -> str:
+    raw = json.dumps([submission.created_at.isoformat(), submission.id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        created_at, submission_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(submission_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes for timezone-aware columns.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def filter_criteria(criteria: SubmissionFilter) -> list[ColumnElement[bool]]:
+    table = Submission.__table__
+    clauses = []
+    if criteria.status is not None:
+        clauses.append(table.c.status == criteria.status.value)
+    if criteria.channel is not None:
+        clauses.append(table.c.channel == criteria.channel)
+    if criteria.created_after is not None:
+        clauses.append(table.c.created_at >= criteria.created_after)
+    if criteria.created_before is not None:
+        clauses.append(table.c.created_at < criteria.created_before)
+    return clauses
 
 
 class SubmissionService:
     """Handle submission creation, edits, and review transitions."""
 
-    def __init__(self, session: AsyncSession, translation_service: TranslationService) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        translation_service: TranslationService,
+        near_duplicates: NearDuplicateService | None = None,
+        revisions: RevisionService | None = None,
+        group_commit: GroupCommitter[SubmissionDraft] | None = None,
+    ) -> None:
         self._session = session
         self._translation_service = translation_service
+        self._near_duplicates = near_duplicates
+        self._revisions = revisions or RevisionService(session)
+        self._blobs = TextBlobStore(session)
+        self._archive = SubmissionArchiver(session)
+        self._group_commit = group_commit
 
     async def create_submission(self, payload: SubmissionCreate) -> SubmissionRead:
-        translation = await self._translation_service.translate(
+        reused_draft = await self._find_reusable_draft(payload)
+        draft = await self._draft(payload, self._translation_service, reused_draft)
+        if self._group_commit is not None:
+            # Inserted alongside concurrent creates, in the committer's own session.
+            await self._group_commit.submit(draft)
+        else:
+            await self._persist_new([draft])
+        submission = draft[0]
+        return await self._to_read(submission)
+
+    async def create_many(
+        self, payloads: Sequence[SubmissionCreate], concurrency: int
+    ) -> list[Submission | Exception]:
+        """Draft ``payloads`` concurrently and insert them in one transaction.
+
+        Results line up with ``payloads``; a payload whose drafting failed yields the
+        exception instead of a submission. At most ``concurrency`` drafts are in flight.
+        """
+
+        # Database work stays sequential on this session; only provider calls overlap.
+        reused = [await self._find_reusable_draft(payload) for payload in payloads]
+        translation_service = await self._translation_service.detached()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def draft(
+            payload: SubmissionCreate, reused_draft: ReusedDraft | None
+        ) -> SubmissionDraft:
+            async with semaphore:
+                return await self._draft(payload, translation_service, reused_draft)
+
+        outcomes = await asyncio.gather(
+            *(draft(payload, reused_draft) for payload, reused_draft in zip(payloads, reused)),
+            return_exceptions=True,
+        )
+        drafts = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+        if drafts:
+            await self.persist_drafts(drafts)
+        return [
+            outcome if isinstance(outcome, Exception) else outcome[0]  # type: ignore[misc]
+            for outcome in outcomes
+        ]
+
+    async def persist_drafts(self, drafts: Sequence[SubmissionDraft]) -> None:
+        """Insert already drafted submissions in one transaction, rolling back on error."""
+
+        try:
+            await self._persist_new(drafts)
+        except Exception:
+            await self._session.rollback()
+            raise
+
+    async def _find_reusable_draft(self, payload: SubmissionCreate) -> ReusedDraft | None:
+        if not payload.reuse_near_duplicate or self._near_duplicates is None:
+            return None
+        source_text = payload.source_text.strip()
+        reference = await self._near_duplicates.nearest_approved(source_text)
+        if reference is None or not reference.match.thai_final:
+            return None
+        return ReusedDraft(
+            submission_id=reference.match.id,
+            text=adapt_reused_copy(reference.source_text, source_text, reference.match.thai_final),
+            distance=reference.match.distance,
+        )
+
+    @staticmethod
+    async def _draft(
+        payload: SubmissionCreate,
+        translation_service: TranslationService,
+        reused_draft: ReusedDraft | None,
+    ) -> SubmissionDraft:
+        source_text = payload.source_text.strip()
+        results = await translation_service.translate_many(
             english_text=payload.source_text,
+            locales=normalize_locales(payload.target_locales),
             tone=payload.tone,
             audience=payload.audience,
             channel=payload.channel,
+            reused_draft=reused_draft,
         )
-
         submission = Submission(
             title=payload.title.strip(),
-            source_text=payload.source_text.strip(),
+            source_text=source_text,
+            **fingerprint_columns(NearDuplicateService.fingerprint(source_text)),
             tone=payload.tone,
             audience=payload.audience,
             channel=payload.channel,
-            thai_draft=translation.thai_text,
-            translation_prompt=translation.prompt,
-            provider_name=translation.provider_name,
-            usage_tokens=translation.usage_tokens,
-            cost_usd=translation.cost_usd,
-            glossary_terms=translation.glossary_terms_applied,
-            warnings=translation.warnings,
-            notes=translation.notes,
+            # Loaded (if empty) up front, so the response never lazy-loads it after flush.
+            translations=[],
+        )
+        return submission, results
+
+    async def _persist_new(self, drafts: Sequence[SubmissionDraft]) -> None:
+        """Insert new submissions with their index, search, counter and rollup bookkeeping."""
+
+        await self._apply_translations_many(drafts)
+        self._session.add_all([submission for submission, _ in drafts])
+        await self._session.flush()
+        search = SearchService(self._session)
+        for submission, results in drafts:
+            await index_glossary_terms(
+                self._session, submission.id, results[PRIMARY_LOCALE].glossary_matches
+            )
+            await index_warnings(
+                self._session, submission.id, results[PRIMARY_LOCALE].warning_codes
+            )
+            await search.index(submission)
+        self._revisions.record_new([submission for submission, _ in drafts])
+        await StatusCounter(self._session).adjust(
+            Counter(submission.status for submission, _ in drafts)
         )
-        self._session.add(submission)
+        rollup = RollupDelta()
+        for submission, _ in drafts:
+            rollup.add(submission)
+        await DailyRollups(self._session).apply(rollup)
         await self._session.commit()
-        await self._session.refresh(submission)
-        return SubmissionRead.model_validate(submission)
 
-    async def list_submissions(self, status: SubmissionStatus | None = None) -> SubmissionList:
-        statement = select(Submission).order_by(Submission.created_at.desc())
+    async def list_submissions(
+        self,
+        status: SubmissionStatus | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> SubmissionList:
+        """Return one page ordered by ``(created_at, id)`` descending.
+
+        Only the summary columns (or the requested ``fields``) are fetched, and paging
+        uses a keyset cursor so deep pages cost the same as the first one.
+        """
+
+        selected = _resolve_list_fields(fields)
+        loaded = dict.fromkeys(("id", "created_at", *selected))
+        if "translation_prompt" in loaded:
+            # The source text section of a prompt is rebuilt from ``source_text``.
+            loaded["prompt_sections"] = loaded["source_text"] = None
+        archived_fields = [name for name in loaded if name in ARCHIVED_FIELDS]
+        if archived_fields:
+            loaded["archived_at"] = None
+        statement = (
+            select(Submission)
+            .options(load_only(*(getattr(Submission, name) for name in loaded)), raiseload("*"))
+            .order_by(Submission.created_at.desc(), Submission.id.desc())
+            .limit(limit + 1)
+        )
         if status:
             statement = statement.where(Submission.status == status.value)
+        if cursor:
+            created_at, last_id = _decode_cursor(cursor)
+            statement = statement.where(
+                tuple_(Submission.created_at, Submission.id) < tuple_(created_at, last_id)
+            )
 
-        result = await self._session.execute(statement)
-        items = [SubmissionRead.model_validate(row) for row in result.scalars().all()]
+        rows = (await self._session.execute(statement)).scalars().all()
+        page = rows[:limit]
+        if archived_fields:
+            await self._archive.hydrate(page, archived_fields, translations=False)
+        if "translation_prompt" in loaded:
+            await self._blobs.hydrate_prompts(page, translations=False)
+        items = [
+            SubmissionSummary(**{name: getattr(row, name) for name in ("id", *selected)})
+            for row in page
+        ]
+        next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
 
-        count_stmt = select(func.count()).select_from(Submission)
-        if status:
-            count_stmt = count_stmt.where(Submission.status == status.value)
-        total = (await self._session.execute(count_stmt)).scalar_one()
+        counts = await StatusCounter(self._session).counts()
+        total = counts.get(status.value, 0) if status else sum(counts.values())
 
-        return SubmissionList(items=items, total=total)
+        return SubmissionList(items=items, total=total, next_cursor=next_cursor)
+
+    async def status_counts(self) -> SubmissionStatusCounts:
+        counts = await StatusCounter(self._session).counts()
+        return SubmissionStatusCounts(counts=counts, total=sum(counts.values()))
 
     async def get_submission(self, submission_id: str) -> Submission | None:
+        """Load a submission for reading; archived text is filled in transparently."""
+
         result = await self._session.execute(
             select(Submission).where(Submission.id == submission_id)
         )
-        return result.scalar_one_or_none()
+        submission = result.scalar_one_or_none()
+        if submission is not None:
+            await self._archive.hydrate([submission])
+        return submission
+
+    async def _get_for_update(self, submission_id: str) -> Submission | None:
+        statement = select(Submission).where(Submission.id == submission_id)
+        submission = (await self._session.execute(statement)).scalar_one_or_none()
+        if submission is not None and submission.archived_at is not None:
+            # Edits are written to the hot tables, so the archived text moves back first.
+            await self._archive.restore(submission_id)
+            result = await self._session.execute(
+                statement.execution_options(populate_existing=True)
+            )
+            submission = result.scalar_one()
+        return submission
+
+    async def get_submission_detail(self, submission_id: str) -> SubmissionRead | None:
+        """Return the full submission, resolving its stored prompt sections."""
 
-    async def update_submission(self, submission_id: str, payload: SubmissionUpdate) -> SubmissionRead:
         submission = await self.get_submission(submission_id)
+        if submission is None:
+            return None
+        return await self._to_read(submission)
+
+    async def update_submission(self, submission_id: str, payload: SubmissionUpdate) -> SubmissionRead:
+        submission = await self._get_for_update(submission_id)
         if submission is None:
             raise LookupError("Submission not found")
+        rollup = RollupDelta()
+        rollup.subtract(submission)
 
         if payload.thai_final is not None:
+            await self._revisions.ensure_baseline(submission)
             submission.thai_final = payload.thai_final.strip()
+            self._record_post_edit(submission)
 
         if payload.status is not None:
+            await StatusCounter(self._session).transition(submission.status, payload.status.value)
+            previous_status = submission.status
             submission.status = payload.status.value
             submission.last_reviewed_at = datetime.now(timezone.utc)
+            self._record_turnaround(submission, previous_status)
 
         if payload.reviewer_notes is not None:
             submission.reviewer_notes = payload.reviewer_notes.strip()
 
+        if payload.locale_finals:
+            by_locale = {translation.locale: translation for translation in submission.translations}
+            for locale, final_text in payload.locale_finals.items():
+                translation = by_locale.get(locale.strip().lower())
+                if translation is None:
+                    raise ValueError(f"Submission has no draft for locale '{locale}'")
+                translation.final_text = final_text.strip()
+
+        if payload.thai_final is not None:
+            await SearchService(self._session).index(submission)
+            await self._revisions.record(submission, "edited")
+        rollup.add(submission)
+        await DailyRollups(self._session).apply(rollup)
+        await self._session.commit()
+        return await self._to_read(submission)
+
+    async def bulk_transition(
+        self, payload: SubmissionBulkTransition
+    ) -> SubmissionBulkTransitionResult:
+        """Move many submissions to ``payload.status`` with set-based updates.
+
+        One ``UPDATE ... RETURNING`` runs per previous status (at most three), so the
+        status counters can be adjusted exactly without reading the rows first, and the
+        statement count does not grow with the number of submissions. The daily rollups
+        are moved with one grouped aggregate over the same rows before each update.
+        """
+
+        table = Submission.__table__
+        target = payload.status.value
+        if payload.ids is not None:
+            ids = list(dict.fromkeys(payload.ids))
+            criteria = [table.c.id.in_(ids)]
+        else:
+            ids = []
+            criteria = filter_criteria(payload.filter)  # type: ignore[arg-type]
+
+        now = datetime.now(timezone.utc)
+        values: dict[str, object] = {"status": target, "last_reviewed_at": now}
+        if payload.reviewer_notes is not None:
+            values["reviewer_notes"] = payload.reviewer_notes.strip()
+        approval_seconds: ColumnElement[float] | None = None
+        if target == SubmissionStatus.APPROVED.value:
+            approval_seconds = self._seconds_since_created(now)
+            values["time_to_approval_seconds"] = approval_seconds
+
+        items: dict[str, SubmissionTransitionOutcome] = {}
+        deltas: Counter[str] = Counter()
+        rollups = DailyRollups(self._session)
+        rollup = RollupDelta()
+        for previous in SubmissionStatus:
+            if previous.value == target:
+                continue
+            leaving_approval = (
+                {"time_to_approval_seconds": None}
+                if previous is SubmissionStatus.APPROVED
+                else {}
+            )
+            moving = (*criteria, table.c.status == previous.value)
+            await rollups.add_grouped(rollup, previous.value, *moving, sign=-1)
+            await rollups.add_grouped(
+                rollup,
+                target,
+                *moving,
+                approval_seconds=cast(null(), Float) if leaving_approval else approval_seconds,
+            )
+            updated = await self._session.execute(
+                update(table)
+                .where(*criteria, table.c.status == previous.value)
+                .values(**values, **leaving_approval)
+                .returning(table.c.id)
+            )
+            for (submission_id,) in updated:
+                items[submission_id] = SubmissionTransitionOutcome(
+                    id=submission_id, outcome="updated", previous_status=previous
+                )
+                deltas[previous.value] -= 1
+                deltas[target] += 1
+        await StatusCounter(self._session).adjust(deltas)
+        await rollups.apply(rollup)
+
+        unchanged = 0
+        if ids:
+            # Rows updated above also match now; only the rest were already in place.
+            unchanged_ids = set(
+                await self._session.scalars(
+                    select(table.c.id).where(*criteria, table.c.status == target)
+                )
+            ).difference(items)
+            unchanged = len(unchanged_ids)
+            for submission_id in ids:
+                if submission_id in items:
+                    continue
+                items[submission_id] = SubmissionTransitionOutcome(
+                    id=submission_id,
+                    outcome="unchanged" if submission_id in unchanged_ids else "not_found",
+                    previous_status=payload.status if submission_id in unchanged_ids else None,
+                )
         await self._session.commit()
-        await self._session.refresh(submission)
+
+        ordered = [items[submission_id] for submission_id in ids] if ids else list(items.values())
+        updated_count = sum(1 for item in ordered if item.outcome == "updated")
+        return SubmissionBulkTransitionResult(
+            items=ordered,
+            updated=updated_count,
+            unchanged=unchanged,
+            not_found=len(ordered) - updated_count - unchanged if ids else 0,
+        )
+
+    @staticmethod
+    def _record_post_edit(submission: Submission) -> None:
+        if submission.thai_final is None:
+            submission.post_edit_distance = submission.post_edit_ratio = None
+            return
+        distance, ratio = post_edit_distance(submission.thai_draft, submission.thai_final)
+        submission.post_edit_distance = distance
+        submission.post_edit_ratio = ratio
+
+    @staticmethod
+    def _record_turnaround(submission: Submission, previous_status: str) -> None:
+        if submission.status == SubmissionStatus.APPROVED.value:
+            created_at = _as_utc(submission.created_at)
+            reviewed_at = _as_utc(submission.last_reviewed_at)
+            submission.time_to_approval_seconds = (reviewed_at - created_at).total_seconds()
+        elif previous_status == SubmissionStatus.APPROVED.value:
+            submission.time_to_approval_seconds = None
+
+    def _seconds_since_created(self, now: datetime) -> ColumnElement[float]:
+        created_at = Submission.__table__.c.created_at
+        if self._session.get_bind().dialect.name == "sqlite":
+            # SQLite stores naive UTC text timestamps; julianday() parses them.
+            stamp = now.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+            return (func.julianday(stamp) - func.julianday(created_at)) * 86400.0
+        return func.extract("epoch", literal(now, DateTime(timezone=True)) - created_at)
+
+    async def redraft_submission(self, submission_id: str) -> SubmissionRead | None:
+        """Regenerate the draft with the current glossary; approved copy is left alone."""
+
+        submission = await self._get_for_update(submission_id)
+        if submission is None or submission.status == SubmissionStatus.APPROVED.value:
+            return None
+
+        results = await self._translation_service.translate_many(
+            english_text=submission.source_text,
+            locales=normalize_locales([item.locale for item in submission.translations]),
+            tone=submission.tone,
+            audience=submission.audience,
+            channel=submission.channel,
+        )
+        translation = results[PRIMARY_LOCALE]
+        rollup = RollupDelta()
+        rollup.subtract(submission)
+        await self._revisions.ensure_baseline(submission)
+        await self._apply_translations(submission, results)
+        self._record_post_edit(submission)
+
+        await index_glossary_terms(
+            self._session, submission.id, translation.glossary_matches, replace=True
+        )
+        await index_warnings(self._session, submission.id, translation.warning_codes, replace=True)
+        await SearchService(self._session).index(submission)
+        await self._revisions.record(submission, "redrafted")
+        rollup.add(submission)
+        await DailyRollups(self._session).apply(rollup)
+        await self._session.commit()
+        return await self._to_read(submission)
+
+    async def _to_read(self, submission: Submission) -> SubmissionRead:
+        await self._blobs.hydrate_prompts([submission])
         return SubmissionRead.model_validate(submission)
+
+    async def _apply_translations(
+        self, submission: Submission, results: dict[str, TranslationResult]
+    ) -> None:
+        await self._apply_translations_many([(submission, results)])
+
+    async def _apply_translations_many(self, drafts: Sequence[SubmissionDraft]) -> None:
+        """Write Thai output to the ``thai_*`` columns and other locales to their rows.
+
+        Prompts are stored as section digests in the blob store rather than inline; the
+        sections of every draft are written with a single ``put_prompts``.
+        """
+
+        stored = iter(
+            await self._blobs.put_prompts(
+                [
+                    (result.prompt_sections, submission.source_text)
+                    for submission, results in drafts
+                    for result in results.values()
+                ]
+            )
+        )
+        for submission, results in drafts:
+            for locale, result in results.items():
+                prompt_sections = next(stored)
+                if locale == PRIMARY_LOCALE:
+                    self._assign_primary(submission, result, prompt_sections)
+                else:
+                    self._assign_locale(submission, result, prompt_sections)
+
+    @staticmethod
+    def _assign_primary(
+        submission: Submission, result: TranslationResult, prompt_sections: list[str]
+    ) -> None:
+        submission.thai_draft = result.thai_text
+        submission.translation_prompt = None
+        submission.prompt_sections = prompt_sections
+        submission.provider_name = result.provider_name
+        submission.usage_tokens = result.usage_tokens
+        submission.cost_usd = result.cost_usd
+        submission.glossary_terms = result.glossary_terms_applied
+        submission.warnings = result.warnings
+        submission.notes = result.notes
+
+    @staticmethod
+    def _assign_locale(
+        submission: Submission, result: TranslationResult, prompt_sections: list[str]
+    ) -> None:
+        row = next(
+            (item for item in submission.translations if item.locale == result.locale), None
+        )
+        if row is None:
+            row = SubmissionTranslation(locale=result.locale)
+            submission.translations.append(row)
+        row.draft_text = result.thai_text
+        row.translation_prompt = None
+        row.prompt_sections = prompt_sections
+        row.provider_name = result.provider_name
+        row.usage_tokens = result.usage_tokens
+        row.cost_usd = result.cost_usd
+        row.warnings = result.warnings
+        row.notes = result.notes
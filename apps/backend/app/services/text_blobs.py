@@ -0,0 +1,246 @@
+"""Content-addressed storage for large, frequently repeated text."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import Protocol
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..core.compression import compress_text, decompress_text, text_digest
+from ..db.upsert import dialect_insert
+from ..models import Submission, SubmissionTranslation, TextBlob
+from .prompting import PROMPT_SECTION_SEPARATOR, source_section
+
+# Decompressed blobs keyed by digest, filled on reads only so that nothing from an
+# uncommitted transaction is cached. Content addressing makes entries valid for any
+# database, and the shared prompt sections make the hit rate very high.
+_CACHE_SIZE = 2048
+_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _remember(digest: str, text: str) -> None:
+    _cache[digest] = text
+    _cache.move_to_end(digest)
+    while len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+# Stands in for the "Content to adapt" section in ``prompt_sections``. That section is
+# the submission's own source text, so it is rebuilt from the row instead of being
+# stored twice. Digests are hex, so the marker never collides with one.
+SOURCE_SECTION_REF = "source_text"
+
+
+class PromptRecord(Protocol):
+    translation_prompt: str | None
+    prompt_sections: list[str] | None
+
+
+class TextBlobStore:
+    """Store each distinct text once, compressed, and resolve it by digest."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def put_many(self, texts: Sequence[str]) -> list[str]:
+        """Persist ``texts`` (skipping ones already stored) and return their digests."""
+
+        digests = [text_digest(text) for text in texts]
+        unique = dict(zip(digests, texts))
+        if not unique:
+            return digests
+
+        existing = set(
+            await self._session.scalars(select(TextBlob.digest).where(TextBlob.digest.in_(unique)))
+        )
+        missing = [
+            {"digest": digest, "data": compress_text(text), "size": len(text.encode("utf-8"))}
+            for digest, text in unique.items()
+            if digest not in existing
+        ]
+        if missing:
+            table = TextBlob.__table__
+            statement = dialect_insert(self._session, table).values(missing)
+            # A concurrent writer may have stored the same content in the meantime.
+            await self._session.execute(
+                statement.on_conflict_do_nothing(index_elements=[table.c.digest])
+            )
+        return digests
+
+    async def put_prompts(self, prompts: Sequence[tuple[Sequence[str], str]]) -> list[list[str]]:
+        """Store ``(sections, source text)`` prompts and return each one's section refs.
+
+        The section holding the source text becomes ``SOURCE_SECTION_REF``; every other
+        section is stored with a single ``put_many``.
+        """
+
+        sources = [source_section(source_text) for _, source_text in prompts]
+        digests = iter(
+            await self.put_many(
+                [
+                    section
+                    for (sections, _), source in zip(prompts, sources)
+                    for section in sections
+                    if section != source
+                ]
+            )
+        )
+        return [
+            [SOURCE_SECTION_REF if section == source else next(digests) for section in sections]
+            for (sections, _), source in zip(prompts, sources)
+        ]
+
+    async def get_many(self, digests: Iterable[str]) -> dict[str, str]:
+        """Return the text for each known digest, decompressing only cache misses."""
+
+        found: dict[str, str] = {}
+        missing = set()
+        for digest in digests:
+            if digest in _cache:
+                _cache.move_to_end(digest)
+                found[digest] = _cache[digest]
+            else:
+                missing.add(digest)
+        if missing:
+            rows = await self._session.execute(
+                select(TextBlob.digest, TextBlob.data).where(TextBlob.digest.in_(missing))
+            )
+            for digest, data in rows:
+                found[digest] = decompress_text(data)
+                _remember(digest, found[digest])
+        return found
+
+    async def hydrate_prompts(
+        self, submissions: Iterable[Submission], translations: bool = True
+    ) -> None:
+        """Fill ``translation_prompt`` on records that only reference prompt sections.
+
+        Covers each submission and, with ``translations``, its locale rows; the source
+        text section is rebuilt from ``Submission.source_text``. The value is set as
+        already-committed state, so hydrating never causes the prompt to be written
+        back inline.
+        """
+
+        pending: list[tuple[PromptRecord, str]] = [
+            (record, submission.source_text)
+            for submission in submissions
+            for record in (submission, *(submission.translations if translations else ()))
+            if record.translation_prompt is None and record.prompt_sections
+        ]
+        if not pending:
+            return
+        texts = await self.get_many(
+            {
+                digest
+                for record, _ in pending
+                for digest in record.prompt_sections or ()
+                if digest != SOURCE_SECTION_REF
+            }
+        )
+        for record, source_text in pending:
+            sections = record.prompt_sections or []
+            if all(digest == SOURCE_SECTION_REF or digest in texts for digest in sections):
+                set_committed_value(
+                    record,
+                    "translation_prompt",
+                    PROMPT_SECTION_SEPARATOR.join(
+                        source_section(source_text) if digest == SOURCE_SECTION_REF
+                        else texts[digest]
+                        for digest in sections
+                    ),
+                )
+
+
+_COMPACT_BATCH_SIZE = 200
+
+
+async def compact_text_storage(
+    session: AsyncSession, batch_size: int = _COMPACT_BATCH_SIZE
+) -> int:
+    """Move inline prompts into the blob store and compress legacy SQLite text.
+
+    Returns the number of rows rewritten. ``updated_at`` is preserved because the
+    content itself does not change. SQLite only returns the freed pages to the
+    filesystem after a ``VACUUM``.
+    """
+
+    store = TextBlobStore(session)
+    sqlite = session.get_bind().dialect.name == "sqlite"
+    rewritten = 0
+    for model, text_columns in (
+        (Submission, ("source_text", "thai_draft", "thai_final")),
+        (SubmissionTranslation, ("draft_text", "final_text")),
+    ):
+        table = model.__table__
+        keys = [column.name for column in table.primary_key.columns]
+        if model is Submission:
+            source_text = table.c.source_text
+        else:
+            source_text = (
+                select(Submission.source_text)
+                .where(Submission.id == table.c.submission_id)
+                .scalar_subquery()
+            )
+        pending = table.c.translation_prompt.is_not(None)
+        if sqlite:
+            # Rows written before compression still hold plain TEXT values.
+            pending = or_(
+                pending, *(func.typeof(table.c[name]) == "text" for name in text_columns)
+            )
+        statement = (
+            update(table)
+            .where(*(table.c[key] == bindparam(f"key_{key}") for key in keys))
+            .values(
+                translation_prompt=None,
+                prompt_sections=bindparam(
+                    "new_prompt_sections", type_=table.c.prompt_sections.type
+                ),
+                updated_at=table.c.updated_at,
+                **{
+                    name: bindparam(f"new_{name}", type_=table.c[name].type)
+                    for name in text_columns
+                },
+            )
+        )
+        while True:
+            rows = (
+                await session.execute(
+                    select(
+                        *(table.c[key] for key in keys),
+                        table.c.translation_prompt,
+                        table.c.prompt_sections,
+                        source_text.label("prompt_source_text"),
+                        *(table.c[name] for name in text_columns),
+                    )
+                    .where(pending)
+                    .limit(batch_size)
+                )
+            ).all()
+            if not rows:
+                break
+            params = []
+            for row in rows:
+                sections = row.prompt_sections
+                if row.translation_prompt is not None:
+                    [sections] = await store.put_prompts(
+                        [
+                            (
+                                row.translation_prompt.split(PROMPT_SECTION_SEPARATOR),
+                                row.prompt_source_text,
+                            )
+                        ]
+                    )
+                params.append(
+                    {
+                        **{f"key_{key}": row._mapping[key] for key in keys},
+                        "new_prompt_sections": sections,
+                        **{f"new_{name}": row._mapping[name] for name in text_columns},
+                    }
+                )
+            await session.execute(statement, params)
+            await session.commit()
+            rewritten += len(rows)
+    return rewritten
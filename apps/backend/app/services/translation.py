@@ -1,12 +1,19 @@
 """Domain services for translation and localization workflows."""
+import asyncio
+import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..core.config import Settings
+from ..core.locales import PRIMARY_LOCALE, language_name
 from ..schemas.glossary import GlossaryEntryRead
-from .glossary import GlossaryService
+from .glossary import GlossaryService, GlossarySnapshot
+from .glossary_impact import normalize_term
 from .orchestrator import TranslationOrchestrator, TranslationProviderError
-from .prompting import build_translation_prompt
+from .prompting import PROMPT_SECTION_SEPARATOR, build_translation_prompt_sections
+from .providers.base import ProviderOutput
+from .sketches import get_sketch_recorder
+from .usage_analytics import WARNING_BLOCKED_TERM, WARNING_SENSITIVE_TERM
 
 
 @dataclass
@@ -15,10 +22,26 @@ class TranslationResult:
     glossary_terms_applied: List[str]
     notes: Optional[str] = None
     prompt: Optional[str] = None
+    # ``prompt`` split into the sections it was joined from, for deduplicated storage.
+    prompt_sections: List[str] = field(default_factory=list)
     provider_name: Optional[str] = None
     usage_tokens: Optional[int] = None
     cost_usd: Optional[float] = None
     warnings: List[str] = field(default_factory=list)
+    # ``(code, term)`` pairs behind ``warnings``, indexed in ``submission_warnings``.
+    warning_codes: List[Tuple[str, str]] = field(default_factory=list)
+    glossary_matches: List[GlossaryEntryRead] = field(default_factory=list)
+    # ``thai_text`` holds the draft for this locale; the name predates non-Thai locales.
+    locale: str = PRIMARY_LOCALE
+
+
+@dataclass
+class ReusedDraft:
+    """Approved copy from a near-duplicate submission used in place of a fresh draft."""
+
+    submission_id: str
+    text: str
+    distance: int
 
 
 class TranslationService:
@@ -27,22 +50,59 @@ class TranslationService:
     def __init__(
         self,
         settings: Settings,
-        glossary_service: GlossaryService | None,
+        glossary_service: GlossaryService | GlossarySnapshot | None,
         orchestrator: TranslationOrchestrator | None,
     ) -> None:
         self._settings = settings
         self._glossary_service = glossary_service
         self._orchestrator = orchestrator
 
+    async def detached(self) -> "TranslationService":
+        """Return a copy that matches against a glossary snapshot instead of the session.
+
+        The copy never touches the database, so many drafts can run concurrently.
+        """
+
+        glossary = await self._glossary_service.snapshot() if self._glossary_service else None
+        return TranslationService(
+            settings=self._settings, glossary_service=glossary, orchestrator=self._orchestrator
+        )
+
     async def translate(
         self,
         english_text: str,
         tone: Optional[str] = None,
         audience: Optional[str] = None,
         channel: Optional[str] = None,
+        reused_draft: Optional[ReusedDraft] = None,
     ) -> TranslationResult:
         """Generate a Thai draft using configured providers with graceful fallback."""
 
+        results = await self.translate_many(
+            english_text=english_text,
+            locales=[PRIMARY_LOCALE],
+            tone=tone,
+            audience=audience,
+            channel=channel,
+            reused_draft=reused_draft,
+        )
+        return results[PRIMARY_LOCALE]
+
+    async def translate_many(
+        self,
+        english_text: str,
+        locales: List[str],
+        tone: Optional[str] = None,
+        audience: Optional[str] = None,
+        channel: Optional[str] = None,
+        reused_draft: Optional[ReusedDraft] = None,
+    ) -> Dict[str, TranslationResult]:
+        """Draft ``english_text`` into every locale with one shared glossary pass.
+
+        Glossary matching and the sensitive-term checks run once; provider calls for the
+        individual locales run concurrently. ``reused_draft`` only applies to Thai.
+        """
+
         normalized_tone = tone or self._settings.default_tone
         glossary_entries: List[GlossaryEntryRead] = (
             await self._glossary_service.matched_entries(english_text)
@@ -50,37 +110,87 @@ class TranslationService:
             else []
         )
         sensitive_entries = [entry for entry in glossary_entries if entry.is_sensitive]
-        warnings: List[str] = []
+        shared_warnings: List[str] = []
         if sensitive_entries:
             mapped = ", ".join(f"{entry.source_term} → {entry.thai_term}" for entry in sensitive_entries)
-            warnings.append(
+            shared_warnings.append(
                 "Sensitive glossary terms present: "
                 f"{mapped}. Ensure reviewer double-checks cultural nuances."
             )
 
-        prompt = build_translation_prompt(
+        results = await asyncio.gather(
+            *(
+                self._translate_locale(
+                    locale=locale,
+                    english_text=english_text,
+                    tone=normalized_tone,
+                    audience=audience,
+                    channel=channel,
+                    glossary_entries=glossary_entries,
+                    shared_warnings=shared_warnings,
+                    reused_draft=reused_draft if locale == PRIMARY_LOCALE else None,
+                )
+                for locale in locales
+            )
+        )
+        return dict(zip(locales, results))
+
+    async def _translate_locale(
+        self,
+        locale: str,
+        english_text: str,
+        tone: str,
+        audience: Optional[str],
+        channel: Optional[str],
+        glossary_entries: List[GlossaryEntryRead],
+        shared_warnings: List[str],
+        reused_draft: Optional[ReusedDraft],
+    ) -> TranslationResult:
+        prompt_sections = build_translation_prompt_sections(
             english_text=english_text,
-            thai_tone=normalized_tone,
+            thai_tone=tone,
             audience=audience,
             channel=channel,
             glossary_entries=glossary_entries,
+            locale=locale,
         )
+        prompt = PROMPT_SECTION_SEPARATOR.join(prompt_sections)
         provider_output = None
         notes = None
 
-        if self._orchestrator:
+        if reused_draft is not None:
+            provider_output = ProviderOutput(
+                thai_text=reused_draft.text,
+                provider_name="near_duplicate",
+                raw_prompt=prompt,
+            )
+            notes = (
+                f"Adapted approved copy from submission {reused_draft.submission_id} "
+                f"(SimHash distance {reused_draft.distance}); verify changed details."
+            )
+        elif self._orchestrator:
+            started = time.perf_counter()
             try:
-                provider_output = await self._orchestrator.generate(prompt)
+                provider_output = await self._orchestrator.generate(prompt, locale)
             except TranslationProviderError as exc:
                 notes = f"Primary providers failed: {exc}. Using placeholder output."
+            else:
+                recorder = get_sketch_recorder()
+                provider = provider_output.provider_name
+                recorder.record(
+                    "provider_latency_ms", (time.perf_counter() - started) * 1000, provider
+                )
+                recorder.record("usage_tokens", provider_output.usage_tokens, provider)
+                recorder.record("cost_usd", provider_output.cost_usd, provider)
 
         if provider_output is None:
             draft = self._draft_placeholder(
                 english_text=english_text,
-                tone=normalized_tone,
+                tone=tone,
                 audience=audience,
                 channel=channel,
                 glossary_entries=glossary_entries,
+                locale=locale,
             )
             provider_name = "placeholder"
             usage_tokens = None
@@ -94,10 +204,17 @@ class TranslationService:
             usage_tokens = provider_output.usage_tokens
             cost_usd = provider_output.cost_usd
 
+        warnings = list(shared_warnings)
+        warning_codes = [
+            (WARNING_SENSITIVE_TERM, normalize_term(entry.source_term))
+            for entry in glossary_entries
+            if entry.is_sensitive
+        ]
         for blocked in self._settings.blocked_terms:
             lowered = blocked.lower()
             if lowered in english_text.lower() or lowered in thai_text.lower():
                 warnings.append(f"Blocked term detected: '{blocked}'." )
+                warning_codes.append((WARNING_BLOCKED_TERM, normalize_term(blocked)))
 
         # De-duplicate warnings while preserving order.
         deduped_warnings: List[str] = []
@@ -112,10 +229,14 @@ class TranslationService:
             ],
             notes=notes,
             prompt=prompt,
+            prompt_sections=prompt_sections,
             provider_name=provider_name,
             usage_tokens=usage_tokens,
             cost_usd=cost_usd,
             warnings=deduped_warnings,
+            warning_codes=list(dict.fromkeys(warning_codes)),
+            glossary_matches=glossary_entries,
+            locale=locale,
         )
 
     def _draft_placeholder(
@@ -125,11 +246,12 @@ class TranslationService:
         audience: Optional[str],
         channel: Optional[str],
         glossary_entries: List[GlossaryEntryRead],
+        locale: str = PRIMARY_LOCALE,
     ) -> str:
         """Fallback draft generation until LLM orchestration is wired up."""
 
         components = [
-            "[THAI DRAFT PLACEHOLDER]",
+            f"[{language_name(locale).upper()} DRAFT PLACEHOLDER]",
             f"Tone: {tone}",
         ]
         if audience:
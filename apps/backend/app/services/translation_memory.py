@@ -0,0 +1,528 @@
+"""Streaming TMX/XLIFF import into ``tm_units`` and TMX/XLIFF export of approved copy."""
+from __future__ import annotations
+
+import hashlib
+import io
+import re
+import unicodedata
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+from xml.sax.saxutils import escape, quoteattr
+
+from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.locales import PRIMARY_LOCALE
+from ..db.upsert import dialect_insert
+from ..models import (
+    GlossaryEntry,
+    Submission,
+    SubmissionStatus,
+    SubmissionTranslation,
+    TranslationMemoryImport,
+    TranslationMemoryUnit,
+)
+from ..schemas import (
+    TranslationMemoryExportScope,
+    TranslationMemoryFormat,
+    TranslationMemoryLookup,
+    TranslationMemoryMatch,
+)
+from .archive import SubmissionArchiver
+
+TM_FORMATS = ("tmx", "xliff")
+TM_MEDIA_TYPES = {"tmx": "application/x-tmx+xml", "xliff": "application/xliff+xml"}
+# Source language of everything Leo exports.
+SOURCE_LOCALE = "en"
+
+_HEAD_BYTES = 64 * 1024
+_EXPORT_BATCH_SIZE = 500
+_FLUSH_BYTES = 64 * 1024
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+# Elements that carry one translation unit, and the ones detached after reading.
+_UNIT_ELEMENTS = {"tmx": {"tu"}, "xliff": {"trans-unit", "segment"}}
+_DETACHED_ELEMENTS = {"tmx": {"tu"}, "xliff": {"trans-unit", "segment", "unit"}}
+# Inline codes whose content is native markup (e.g. ``<b>``), not translatable text.
+_CODE_ELEMENTS = frozenset(
+    {"bpt", "ept", "it", "ph", "ut", "x", "bx", "ex", "sc", "ec", "sm", "em", "cp"}
+)
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+@dataclass(frozen=True)
+class ParsedUnit:
+    source_locale: str
+    target_locale: str
+    source_text: str
+    target_text: str
+
+
+def normalize_locale(tag: str | None) -> str | None:
+    """``en_US`` and ``EN-us`` both become ``en-us``."""
+
+    if not tag:
+        return None
+    return tag.strip().replace("_", "-").lower()[:16] or None
+
+
+def normalize_segment(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+
+
+def _unit_hash(unit: ParsedUnit) -> str:
+    key = "\0".join(
+        (unit.source_locale, unit.target_locale, unit.source_text, unit.target_text)
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def segment_text(element: Element) -> str:
+    """Translatable text of a segment, skipping the content of inline codes."""
+
+    parts = [element.text or ""]
+    for child in element:
+        if _local(child.tag) not in _CODE_ELEMENTS:
+            parts.append(segment_text(child))
+        parts.append(child.tail or "")
+    return normalize_segment("".join(parts))
+
+
+class TranslationMemoryParser:
+    """Incremental parser for TMX 1.4 and XLIFF 1.2/2.x documents.
+
+    ``feed`` takes arbitrary byte chunks and returns the units completed so far. Each
+    unit's elements are detached from the tree once read, so memory holds the unit
+    being parsed rather than the document. Every source/target pair is one unit, in
+    document order; units without usable text or languages are counted in ``skipped``.
+    """
+
+    def __init__(self) -> None:
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: list[Element] = []
+        self.format: TranslationMemoryFormat | None = None
+        self.skipped = 0
+        self._source_locale: str | None = None
+        self._target_locale: str | None = None
+
+    def feed(self, data: bytes) -> list[ParsedUnit]:
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[ParsedUnit]:
+        self._parser.close()
+        units = self._drain()
+        if self.format is None:
+            raise ValueError("The upload is not a TMX or XLIFF document")
+        return units
+
+    def _drain(self) -> list[ParsedUnit]:
+        units: list[ParsedUnit] = []
+        for event, element in self._parser.read_events():
+            name = _local(element.tag)
+            if event == "start":
+                self._start(name, element)
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            assert self.format is not None
+            if name in _UNIT_ELEMENTS[self.format]:
+                units.extend(self._units(name, element))
+            if name in _DETACHED_ELEMENTS[self.format] and self._stack:
+                self._stack[-1].remove(element)
+        return units
+
+    def _start(self, name: str, element: Element) -> None:
+        if not self._stack:
+            if name not in TM_FORMATS:
+                raise ValueError(f"Unsupported root element <{name}>; expected TMX or XLIFF")
+            self.format = name  # type: ignore[assignment]
+            # XLIFF 2.x declares the languages on the root element.
+            self._source_locale = normalize_locale(element.get("srcLang"))
+            self._target_locale = normalize_locale(element.get("trgLang"))
+        elif name == "header" and self.format == "tmx":
+            srclang = element.get("srclang")
+            self._source_locale = None if srclang == "*all*" else normalize_locale(srclang)
+        elif name == "file" and self.format == "xliff" and element.get("source-language"):
+            self._source_locale = normalize_locale(element.get("source-language"))
+            self._target_locale = normalize_locale(element.get("target-language"))
+
+    def _units(self, name: str, element: Element) -> list[ParsedUnit]:
+        pairs = self._tmx_pairs(element) if name == "tu" else self._xliff_pairs(element)
+        units = [
+            ParsedUnit(source_locale, target_locale, source, target)
+            for source_locale, target_locale, source, target in pairs
+            if source_locale and target_locale and source and target
+        ]
+        if not units:
+            self.skipped += 1
+        return units
+
+    def _tmx_pairs(self, element: Element) -> list[tuple[str | None, str | None, str, str]]:
+        variants: list[tuple[str | None, str]] = []
+        for child in element:
+            if _local(child.tag) != "tuv":
+                continue
+            # TMX 1.1 used ``lang``; later versions ``xml:lang``.
+            locale = normalize_locale(child.get(_XML_LANG) or child.get("lang"))
+            seg = next((part for part in child if _local(part.tag) == "seg"), None)
+            variants.append((locale, segment_text(seg) if seg is not None else ""))
+        if not variants:
+            return []
+        source_locale = self._source_locale or variants[0][0]
+        source = next((text for locale, text in variants if locale == source_locale), "")
+        return [
+            (source_locale, locale, source, text)
+            for locale, text in variants
+            if locale != source_locale
+        ]
+
+    def _xliff_pairs(self, element: Element) -> list[tuple[str | None, str | None, str, str]]:
+        # Direct children only: ``alt-trans`` proposals hold their own source/target.
+        source = target = None
+        for child in element:
+            if _local(child.tag) == "source":
+                source = child
+            elif _local(child.tag) == "target":
+                target = child
+        if source is None or target is None:
+            return []
+        target_locale = normalize_locale(target.get(_XML_LANG)) or self._target_locale
+        return [(self._source_locale, target_locale, segment_text(source), segment_text(target))]
+
+
+async def _split_head(chunks: AsyncIterable[bytes]) -> tuple[bytes, AsyncIterator[bytes]]:
+    """Read at least ``_HEAD_BYTES`` of an upload; returns what was read and the rest."""
+
+    iterator = aiter(chunks)
+    head = b""
+    async for chunk in iterator:
+        head += chunk
+        if len(head) >= _HEAD_BYTES:
+            break
+    return head, iterator
+
+
+def _head_digest(head: bytes) -> str:
+    # The length is kept so a first upload shorter than ``_HEAD_BYTES`` still compares.
+    return f"{len(head)}:{hashlib.sha256(head).hexdigest()}"
+
+
+def _locale_matches(column: ColumnElement[str], locale: str) -> ColumnElement[bool]:
+    # ``th`` matches units stored as ``th`` or any regional variant such as ``th-th``.
+    return or_(column == locale, column.like(f"{locale}-%"))
+
+
+class TranslationMemoryService:
+    """Resumable TMX/XLIFF imports and exact-match lookups against ``tm_units``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_import(self, import_id: str) -> TranslationMemoryImport | None:
+        return await self._session.get(TranslationMemoryImport, import_id)
+
+    async def start_import(
+        self, import_id: str | None = None, filename: str | None = None
+    ) -> TranslationMemoryImport:
+        """Create an import, or reopen an unfinished one to resume it."""
+
+        if import_id is None:
+            record = TranslationMemoryImport(filename=(filename or None) and filename[:255])
+            self._session.add(record)
+        else:
+            record = await self.get_import(import_id)
+            if record is None:
+                raise LookupError(f"Translation memory import {import_id} not found")
+            if record.status == "completed":
+                raise ValueError(f"Translation memory import {import_id} already completed")
+            record.status = "running"
+            record.error = None
+        await self._session.commit()
+        return record
+
+    async def run_import(
+        self, import_id: str, chunks: AsyncIterable[bytes], batch_size: int
+    ) -> AsyncIterator[dict]:
+        """Parse an upload and store its units in batches, yielding progress events.
+
+        Each batch commits together with ``units_seen``. If the upload is cut off, the
+        import stays ``running`` and a re-upload with the same id skips the units
+        already stored (re-inserting a unit is a no-op either way).
+        """
+
+        record = await self.get_import(import_id)
+        if record is None:
+            raise LookupError(f"Translation memory import {import_id} not found")
+        resume_from = record.units_seen
+        yield {"status": "started", "import_id": record.id, "resume_from": resume_from}
+
+        head, rest = await _split_head(chunks)
+        if record.head_digest is None:
+            record.head_digest = _head_digest(head[:_HEAD_BYTES])
+        elif _head_digest(head[: int(record.head_digest.partition(":")[0])]) != record.head_digest:
+            # The import itself is untouched; re-uploading the right file still resumes it.
+            error = "The upload does not match the file this import started with"
+            yield {"status": "failed", "import_id": record.id, "error": error}
+            return
+
+        parser = TranslationMemoryParser()
+        batch: list[ParsedUnit] = []
+        seen = 0
+        try:
+
+            async def parsed() -> AsyncIterator[ParsedUnit]:
+                for unit in parser.feed(head):
+                    yield unit
+                async for chunk in rest:
+                    for unit in parser.feed(chunk):
+                        yield unit
+                for unit in parser.close():
+                    yield unit
+
+            async for unit in parsed():
+                seen += 1
+                if seen <= resume_from:
+                    continue
+                batch.append(unit)
+                if len(batch) >= max(1, batch_size):
+                    await self._commit_batch(record, parser, batch, seen)
+                    batch = []
+                    yield {"status": "progress", "units": seen, "skipped": parser.skipped}
+        except (ParseError, ValueError) as exc:
+            # Units parsed before the error are still stored.
+            await self._commit_batch(record, parser, batch, max(seen, resume_from))
+            record.status = "failed"
+            record.error = str(exc)
+            await self._session.commit()
+            yield {"status": "failed", "import_id": record.id, "error": str(exc)}
+            return
+
+        await self._commit_batch(record, parser, batch, max(seen, resume_from))
+        record.status = "completed"
+        record.units_imported = (
+            await self._session.scalar(
+                select(func.count())
+                .select_from(TranslationMemoryUnit.__table__)
+                .where(TranslationMemoryUnit.__table__.c.import_id == record.id)
+            )
+            or 0
+        )
+        await self._session.commit()
+        yield {
+            "status": "done",
+            "import_id": record.id,
+            "format": record.format,
+            "units": record.units_seen,
+            "skipped": record.units_skipped,
+            "imported": record.units_imported,
+        }
+
+    async def _commit_batch(
+        self,
+        record: TranslationMemoryImport,
+        parser: TranslationMemoryParser,
+        batch: list[ParsedUnit],
+        seen: int,
+    ) -> None:
+        if batch:
+            table = TranslationMemoryUnit.__table__
+            await self._session.execute(
+                dialect_insert(self._session, table).on_conflict_do_nothing(
+                    index_elements=[table.c.unit_hash]
+                ),
+                [
+                    {
+                        "import_id": record.id,
+                        "source_locale": unit.source_locale,
+                        "target_locale": unit.target_locale,
+                        "source_text": unit.source_text,
+                        "target_text": unit.target_text,
+                        "source_hash": source_hash(unit.source_text),
+                        "unit_hash": _unit_hash(unit),
+                    }
+                    for unit in batch
+                ],
+            )
+        record.format = parser.format or record.format
+        record.units_seen = seen
+        record.units_skipped = parser.skipped
+        await self._session.commit()
+
+    async def lookup(
+        self,
+        text: str,
+        source_locale: str = SOURCE_LOCALE,
+        target_locale: str = PRIMARY_LOCALE,
+        limit: int = 10,
+    ) -> TranslationMemoryLookup:
+        """Exact matches (after whitespace normalization) for ``text``, newest first."""
+
+        units = TranslationMemoryUnit.__table__.c
+        rows = await self._session.execute(
+            select(
+                units.source_locale,
+                units.target_locale,
+                units.source_text,
+                units.target_text,
+                units.import_id,
+            )
+            .where(
+                units.source_hash == source_hash(text),
+                _locale_matches(units.source_locale, normalize_locale(source_locale) or ""),
+                _locale_matches(units.target_locale, normalize_locale(target_locale) or ""),
+            )
+            .order_by(units.id.desc())
+            .limit(limit)
+        )
+        return TranslationMemoryLookup(
+            text=text,
+            items=[TranslationMemoryMatch.model_validate(row._mapping) for row in rows],
+        )
+
+
+def _xml(text: str) -> str:
+    return escape(_INVALID_XML_CHARS.sub("", text))
+
+
+def _attr(text: str) -> str:
+    return quoteattr(_INVALID_XML_CHARS.sub("", text))
+
+
+class TranslationMemoryExporter:
+    """Stream approved submissions and glossary entries as TMX 1.4 or XLIFF 1.2."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    @staticmethod
+    def filename(format: TranslationMemoryFormat) -> str:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        return f"leo-translation-memory-{stamp}.{'tmx' if format == 'tmx' else 'xlf'}"
+
+    async def stream(
+        self,
+        format: TranslationMemoryFormat,
+        scope: TranslationMemoryExportScope = "all",
+        target_locale: str = PRIMARY_LOCALE,
+    ) -> AsyncIterator[bytes]:
+        target_locale = normalize_locale(target_locale) or PRIMARY_LOCALE
+        buffer = io.StringIO()
+        origins = [origin for origin in ("submissions", "glossary") if scope in ("all", origin)]
+        buffer.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        if format == "tmx":
+            buffer.write(
+                '<tmx version="1.4">\n'
+                '  <header creationtool="Leo" creationtoolversion="0.1.0" segtype="sentence"'
+                f' o-tmf="leo" adminlang="en" srclang={_attr(SOURCE_LOCALE)}'
+                ' datatype="plaintext"/>\n'
+                "  <body>\n"
+            )
+        else:
+            buffer.write(
+                '<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">\n'
+            )
+
+        for origin in origins:
+            rows = self._submissions if origin == "submissions" else self._glossary
+            if format == "xliff":
+                buffer.write(
+                    f"  <file original={_attr(origin)} source-language={_attr(SOURCE_LOCALE)}"
+                    f' target-language={_attr(target_locale)} datatype="plaintext">\n'
+                    "    <body>\n"
+                )
+            async for unit_id, source, target in rows(target_locale):
+                if format == "tmx":
+                    buffer.write(
+                        f"    <tu tuid={_attr(f'{origin}:{unit_id}')}>\n"
+                        f'      <prop type="x-origin">{origin}</prop>\n'
+                        f"      <tuv xml:lang={_attr(SOURCE_LOCALE)}>"
+                        f"<seg>{_xml(source)}</seg></tuv>\n"
+                        f"      <tuv xml:lang={_attr(target_locale)}>"
+                        f"<seg>{_xml(target)}</seg></tuv>\n"
+                        "    </tu>\n"
+                    )
+                else:
+                    buffer.write(
+                        f"      <trans-unit id={_attr(unit_id)}>\n"
+                        f"        <source>{_xml(source)}</source>\n"
+                        f'        <target state="final">{_xml(target)}</target>\n'
+                        "      </trans-unit>\n"
+                    )
+                if buffer.tell() >= _FLUSH_BYTES:
+                    yield buffer.getvalue().encode("utf-8")
+                    buffer.seek(0)
+                    buffer.truncate()
+            if format == "xliff":
+                buffer.write("    </body>\n  </file>\n")
+
+        buffer.write("  </body>\n</tmx>\n" if format == "tmx" else "</xliff>\n")
+        yield buffer.getvalue().encode("utf-8")
+
+    async def _submissions(self, target_locale: str) -> AsyncIterator[tuple[str, str, str]]:
+        submissions = Submission.__table__.c
+        primary = target_locale == PRIMARY_LOCALE
+        if primary:
+            final_key, draft_key = "thai_final", "thai_draft"
+            query = select(
+                submissions.id,
+                submissions.source_text,
+                submissions.thai_final,
+                submissions.thai_draft,
+                submissions.archived_at,
+            )
+        else:
+            final_key, draft_key = "final_text", "draft_text"
+            translations = SubmissionTranslation.__table__.c
+            # Archived submissions keep their translations in the archive.
+            query = (
+                select(
+                    submissions.id,
+                    submissions.source_text,
+                    translations.final_text,
+                    translations.draft_text,
+                    submissions.archived_at,
+                )
+                .outerjoin(
+                    SubmissionTranslation.__table__,
+                    (translations.submission_id == submissions.id)
+                    & (translations.locale == target_locale),
+                )
+                .where(translations.locale.is_not(None) | submissions.archived_at.is_not(None))
+            )
+        result = await self._session.stream(
+            query.where(submissions.status == SubmissionStatus.APPROVED.value)
+            .order_by(submissions.created_at, submissions.id)
+            .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        )
+        archiver = SubmissionArchiver(self._session)
+        async for partition in result.partitions():
+            rows = [dict(row._mapping) for row in partition]
+            await archiver.hydrate_rows(rows, translation_locale=None if primary else target_locale)
+            for row in rows:
+                if row[draft_key] is None:
+                    continue
+                # Approving an unedited draft leaves the final copy empty.
+                yield row["id"], row["source_text"], row[final_key] or row[draft_key]
+
+    async def _glossary(self, target_locale: str) -> AsyncIterator[tuple[str, str, str]]:
+        if target_locale != PRIMARY_LOCALE:
+            return
+        entries = GlossaryEntry.__table__.c
+        result = await self._session.stream(
+            select(entries.id, entries.source_term, entries.thai_term)
+            .order_by(entries.source_term)
+            .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        )
+        async for partition in result.partitions():
+            for row in partition:
+                yield tuple(row)  # type: ignore[misc]
@@ -0,0 +1,201 @@
+"""Glossary usage and warning analytics over the normalized junction tables."""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, delete, distinct, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import GlossaryEntry, Submission, SubmissionGlossaryTerm, SubmissionWarning
+from ..schemas import (
+    GlossaryUsage,
+    GlossaryUsageItem,
+    WarningBreakdown,
+    WarningCodeBreakdown,
+    WarningTermCount,
+)
+from .glossary_impact import normalize_term
+from .status_counts import StatusCounter
+
+WARNING_BLOCKED_TERM = "blocked_term"
+WARNING_SENSITIVE_TERM = "sensitive_term"
+# Legacy warning strings that match neither pattern below.
+WARNING_OTHER = "other"
+
+_BACKFILL_BATCH_SIZE = 1000
+_BLOCKED = re.compile(r"^Blocked term detected: '(.+)'\.$")
+_SENSITIVE = re.compile(r"^Sensitive glossary terms present: (.+)\. Ensure reviewer")
+
+
+def parse_warnings(warnings: Iterable[str]) -> list[tuple[str, str]]:
+    """Recover ``(code, term)`` pairs from stored warning strings (backfill only)."""
+
+    codes: list[tuple[str, str]] = []
+    for warning in warnings:
+        if match := _BLOCKED.match(warning):
+            codes.append((WARNING_BLOCKED_TERM, normalize_term(match.group(1))))
+        elif match := _SENSITIVE.match(warning):
+            codes.extend(
+                (WARNING_SENSITIVE_TERM, normalize_term(pair.partition(" → ")[0]))
+                for pair in match.group(1).split(", ")
+            )
+        else:
+            codes.append((WARNING_OTHER, ""))
+    return _unique(codes)
+
+
+async def index_warnings(
+    session: AsyncSession,
+    submission_id: str,
+    codes: Sequence[tuple[str, str]],
+    replace: bool = False,
+) -> None:
+    """Record a submission's structured warnings; the caller owns the transaction."""
+
+    if replace:
+        await session.execute(
+            delete(SubmissionWarning).where(SubmissionWarning.submission_id == submission_id)
+        )
+    if codes:
+        await session.execute(
+            insert(SubmissionWarning),
+            [
+                {"submission_id": submission_id, "code": code, "term": term}
+                for code, term in _unique(codes)
+            ],
+        )
+
+
+def _unique(codes: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    # Terms are truncated to the column width before de-duplicating the primary key.
+    return list(dict.fromkeys((code, term[:255]) for code, term in codes))
+
+
+class UsageAnalyticsService:
+    """Top glossary terms and warning rates, answered from indexed junction rows."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def glossary_usage(self, limit: int = 20, days: int | None = None) -> GlossaryUsage:
+        terms = SubmissionGlossaryTerm.__table__.c
+        entries = GlossaryEntry.__table__.c
+        submissions = func.count().label("submissions")
+        stale = entries.thai_term.is_not(None) & (terms.thai_term != entries.thai_term)
+        query = (
+            select(
+                terms.source_term,
+                func.max(terms.glossary_entry_id),
+                submissions,
+                # Drafts generated with a Thai term the glossary no longer uses.
+                func.sum(case((stale, 1), else_=0)),
+            )
+            .select_from(SubmissionGlossaryTerm.__table__)
+            .outerjoin(GlossaryEntry.__table__, entries.id == terms.glossary_entry_id)
+            .group_by(terms.source_term)
+            .order_by(submissions.desc(), terms.source_term)
+            .limit(limit)
+        )
+        window = self._window(days)
+        if window is not None:
+            query = query.join(
+                Submission.__table__, Submission.__table__.c.id == terms.submission_id
+            ).where(window)
+        items = [
+            GlossaryUsageItem(
+                source_term=source_term,
+                glossary_entry_id=entry_id,
+                submissions=count,
+                stale_submissions=stale_count or 0,
+            )
+            for source_term, entry_id, count, stale_count in await self._session.execute(query)
+        ]
+        return GlossaryUsage(days=days, items=items)
+
+    async def warning_breakdown(
+        self, days: int | None = None, terms_per_code: int = 10
+    ) -> WarningBreakdown:
+        warnings = SubmissionWarning.__table__.c
+        window = self._window(days)
+
+        def scoped(query):
+            if window is None:
+                return query
+            return query.join(
+                Submission.__table__, Submission.__table__.c.id == warnings.submission_id
+            ).where(window)
+
+        if window is None:
+            total = sum((await StatusCounter(self._session).counts()).values())
+        else:
+            total = (
+                await self._session.scalar(
+                    select(func.count()).select_from(Submission.__table__).where(window)
+                )
+                or 0
+            )
+
+        by_code = await self._session.execute(
+            scoped(
+                select(warnings.code, func.count(distinct(warnings.submission_id)))
+                .select_from(SubmissionWarning.__table__)
+                .group_by(warnings.code)
+            )
+        )
+        term_counts = func.count().label("submissions")
+        by_term = await self._session.execute(
+            scoped(
+                select(warnings.code, warnings.term, term_counts)
+                .select_from(SubmissionWarning.__table__)
+                .where(warnings.term != "")
+                .group_by(warnings.code, warnings.term)
+                .order_by(term_counts.desc(), warnings.term)
+            )
+        )
+        terms: dict[str, list[WarningTermCount]] = {}
+        for code, term, count in by_term:
+            bucket = terms.setdefault(code, [])
+            if len(bucket) < terms_per_code:
+                bucket.append(WarningTermCount(term=term, submissions=count))
+
+        items = sorted(
+            (
+                WarningCodeBreakdown(
+                    code=code,
+                    submissions=count,
+                    rate=round(count / total, 4) if total else 0.0,
+                    terms=terms.get(code, []),
+                )
+                for code, count in by_code
+            ),
+            key=lambda item: (-item.submissions, item.code),
+        )
+        return WarningBreakdown(days=days, total_submissions=total, items=items)
+
+    async def rebuild_warning_index(self) -> int:
+        """Rebuild ``submission_warnings`` from ``Submission.warnings``; returns rows written."""
+
+        await self._session.execute(delete(SubmissionWarning))
+        written = 0
+        result = await self._session.stream(select(Submission.id, Submission.warnings))
+        async for rows in result.partitions(_BACKFILL_BATCH_SIZE):
+            params = [
+                {"submission_id": row.id, "code": code, "term": term}
+                for row in rows
+                for code, term in parse_warnings(row.warnings or [])
+            ]
+            if params:
+                await self._session.execute(insert(SubmissionWarning), params)
+                written += len(params)
+        await self._session.commit()
+        return written
+
+    @staticmethod
+    def _window(days: int | None):
+        if not days:
+            return None
+        return Submission.__table__.c.created_at >= datetime.now(timezone.utc) - timedelta(
+            days=days
+        )
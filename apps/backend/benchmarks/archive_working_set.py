@@ -0,0 +1,139 @@
+"""Hot table size and scan time before and after archiving old submissions.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.archive_working_set [--rows 20000] [--archived-share 0.8]
+
+Seeds a temporary SQLite database with ``--rows`` approved submissions carrying
+realistic English/Thai copy, ``--archived-share`` of them older than the retention
+age. Reports the on-disk bytes of ``submissions`` and its indexes (``dbstat``) and the
+time of a full-table scan (a filter on the unindexed ``channel`` column, which is
+what ad-hoc metrics filters do), then runs the archival job and measures again. The
+archive pass itself is timed too.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models import Submission, SubmissionStatus
+from app.services.archive import SubmissionArchiver
+from app.services.near_duplicates import NearDuplicateService
+
+_SEED_BATCH = 2_000
+_SOURCE = (
+    "Save 20% on sneakers this weekend only. Members earn double points in store and "
+    "online, and every order over 1,500 baht ships free. "
+)
+_THAI = (
+    "ลดราคา 20% สำหรับรองเท้าผ้าใบสุดสัปดาห์นี้เท่านั้น "
+    "สมาชิกรับแต้มสองเท่าทั้งที่ร้านและออนไลน์ "
+)
+
+
+async def _seed(engine, rows: int, archived_share: float) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    rng = random.Random(rows)
+    # Creates always store a fingerprint; one per copy length is close enough here.
+    fingerprints = {
+        repeat: NearDuplicateService.fingerprint(_SOURCE * repeat) for repeat in range(4, 12)
+    }
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as connection:
+        for start in range(0, rows, _SEED_BATCH):
+            batch = []
+            for _ in range(min(_SEED_BATCH, rows - start)):
+                old = rng.random() < archived_share
+                age = rng.randrange(400, 900) if old else rng.randrange(30)
+                created = now - timedelta(days=age)
+                repeat = rng.randrange(4, 12)
+                batch.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "title": f"Campaign {rng.randrange(10**6)}",
+                        "source_text": f"{rng.random()} " + _SOURCE * repeat,
+                        "source_fingerprint": fingerprints[repeat],
+                        "thai_draft": f"{rng.random()} " + _THAI * repeat,
+                        "thai_final": f"{rng.random()} " + _THAI * repeat,
+                        "reviewer_notes": "Checked against the glossary and brand voice.",
+                        "status": SubmissionStatus.APPROVED.value,
+                        "channel": rng.choice(["social", "email", "ads", "web"]),
+                        "usage_tokens": rng.randrange(200, 2000),
+                        "cost_usd": rng.random() / 10,
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                )
+            await connection.execute(insert(Submission), batch)
+
+
+async def _measure(engine, label: str) -> None:
+    async with engine.connect() as connection:
+        size = await connection.scalar(
+            text(
+                "SELECT SUM(pgsize) FROM dbstat JOIN sqlite_master USING (name) "
+                "WHERE tbl_name = 'submissions'"
+            )
+        )
+        timings = []
+        for _ in range(5):
+            started = time.perf_counter()
+            await connection.execute(
+                text("SELECT count(*), sum(cost_usd) FROM submissions WHERE channel = 'email'")
+            )
+            timings.append(time.perf_counter() - started)
+    print(
+        f"{label:>7}: submissions + indexes {size / 2**20:7.1f} MiB, "
+        f"scan {min(timings) * 1000:6.1f} ms"
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}"
+        engine = create_engine(Settings(database_url=url))
+        try:
+            await _seed(engine, args.rows, args.archived_share)
+            await _measure(engine, "before")
+            sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+            started = time.perf_counter()
+            async with sessions() as session:
+                archived = await SubmissionArchiver(session).archive_older_than(
+                    365, args.batch_size
+                )
+            elapsed = time.perf_counter() - started
+            print(
+                f"archived {archived} rows in {elapsed:.1f} s "
+                f"({archived / elapsed:.0f} rows/s)"
+            )
+            async with engine.connect() as connection:
+                await connection.execute(text("VACUUM"))
+            await _measure(engine, "after")
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--archived-share", type=float, default=0.8)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
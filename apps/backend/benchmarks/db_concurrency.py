@@ -0,0 +1,160 @@
+"""Throughput under mixed reads and writes: default SQLite engine vs the tuned profile.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.db_concurrency [--workers 16] [--seconds 5] [--write-ratio 0.2]
+
+Each profile gets a fresh database in a temporary directory, seeded with ``--rows``
+submissions. ``--workers`` tasks then loop for ``--seconds``, each operation on its
+own pooled session: reads fetch a page of a status tab (the list endpoint's query),
+writes update one submission's final copy and commit. ``default`` is
+``create_async_engine`` with no options (rollback journal, where a writer blocks
+readers); ``tuned`` is ``app.db.session.create_engine`` (WAL, ``synchronous=NORMAL``,
+busy timeout, mmap). Lock errors are counted rather than retried.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.core.config import Settings
+from app.db.base import Base
+from app.db.session import create_engine
+from app.models import Submission, SubmissionStatus
+
+_SEED_BATCH = 5_000
+_SOURCE = "Save 20% on sneakers this weekend only. Members earn double points in store."
+_DRAFT = "ลดราคา 20% สำหรับรองเท้าผ้าใบสุดสัปดาห์นี้เท่านั้น สมาชิกรับแต้มสองเท่าที่ร้าน"
+
+
+async def _seed(engine: AsyncEngine, rows: int) -> list[str]:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    rng = random.Random(rows)
+    statuses = [status.value for status in SubmissionStatus]
+    now = datetime.now(timezone.utc)
+    ids = [str(uuid.uuid4()) for _ in range(rows)]
+    async with engine.begin() as connection:
+        for start in range(0, rows, _SEED_BATCH):
+            batch = []
+            for submission_id in ids[start : start + _SEED_BATCH]:
+                created = now - timedelta(minutes=rng.randrange(60 * 24 * 90))
+                batch.append(
+                    {
+                        "id": submission_id,
+                        "title": f"Campaign {submission_id[:8]}",
+                        "source_text": _SOURCE,
+                        "thai_draft": _DRAFT,
+                        "status": rng.choice(statuses),
+                        "usage_tokens": rng.randrange(200, 2000),
+                        "cost_usd": rng.random() / 10,
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                )
+            await connection.execute(insert(Submission), batch)
+    return ids
+
+
+async def _worker(
+    sessions: async_sessionmaker,
+    ids: list[str],
+    write_ratio: float,
+    deadline: float,
+    seed: int,
+    results: dict[str, list[float]],
+    errors: list[str],
+) -> None:
+    rng = random.Random(seed)
+    statuses = [status.value for status in SubmissionStatus]
+    table = Submission.__table__
+    while time.perf_counter() < deadline:
+        write = rng.random() < write_ratio
+        started = time.perf_counter()
+        try:
+            async with sessions() as session:
+                if write:
+                    await session.execute(
+                        update(table)
+                        .where(table.c.id == rng.choice(ids))
+                        .values(thai_final=f"{_DRAFT} {rng.random()}")
+                    )
+                    await session.commit()
+                else:
+                    await session.execute(
+                        select(table.c.id, table.c.title, table.c.status, table.c.created_at)
+                        .where(table.c.status == rng.choice(statuses))
+                        .order_by(table.c.created_at.desc(), table.c.id.desc())
+                        .limit(50)
+                    )
+        except OperationalError as exc:
+            errors.append(str(exc.orig))
+            continue
+        results["writes" if write else "reads"].append(time.perf_counter() - started)
+
+
+def _p99(values: list[float]) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+async def _run(profile: str, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}"
+        if profile == "default":
+            engine = create_async_engine(url)
+        else:
+            engine = create_engine(Settings(database_url=url))
+        try:
+            ids = await _seed(engine, args.rows)
+            sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+            results: dict[str, list[float]] = {"reads": [], "writes": []}
+            errors: list[str] = []
+            deadline = time.perf_counter() + args.seconds
+            await asyncio.gather(
+                *(
+                    _worker(sessions, ids, args.write_ratio, deadline, seed, results, errors)
+                    for seed in range(args.workers)
+                )
+            )
+        finally:
+            await engine.dispose()
+
+    reads, writes = results["reads"], results["writes"]
+    print(
+        f"{profile:>8}: {(len(reads) + len(writes)) / args.seconds:8.0f} ops/s  "
+        f"reads {len(reads) / args.seconds:7.0f}/s "
+        f"(p50 {statistics.median(reads or [0]) * 1000:6.1f} ms, "
+        f"p99 {_p99(reads) * 1000:7.1f} ms)  "
+        f"writes {len(writes) / args.seconds:6.0f}/s (p99 {_p99(writes) * 1000:7.1f} ms)  "
+        f"lock errors {len(errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--profiles", nargs="+", default=["default", "tuned"])
+    args = parser.parse_args()
+    for profile in args.profiles:
+        asyncio.run(_run(profile, args))
+
+
+if __name__ == "__main__":
+    main()
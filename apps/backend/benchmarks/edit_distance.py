@@ -0,0 +1,79 @@
+"""Benchmark the post-edit distance on long documents.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.edit_distance
+
+Compares the bit-parallel implementation used on write against a textbook dynamic
+programming baseline (skipped for sizes where it would take minutes).
+"""
+from __future__ import annotations
+
+import random
+import time
+
+from app.core.edit_distance import graphemes, levenshtein
+
+_THAI_WORDS = (
+    "ลดราคา พิเศษ สุดสัปดาห์ นี้ เท่านั้น สมาชิก รับ แต้ม สองเท่า สินค้า ใหม่ ร้านค้า"
+).split()
+_DP_LIMIT = 3_000
+
+
+def _document(size: int, rng: random.Random) -> str:
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_THAI_WORDS)
+        words.append(word)
+        length += len(word)
+    return "".join(words)[:size]
+
+
+def _post_edit(text: str, rng: random.Random, rate: float = 0.05) -> str:
+    chars = list(text)
+    for _ in range(int(len(chars) * rate)):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5:
+            chars[position] = rng.choice("กขคงจ")
+        else:
+            chars.insert(position, rng.choice("่้"))
+    return "".join(chars)
+
+
+def _dp_levenshtein(a: list[str], b: list[str]) -> int:
+    previous = list(range(len(b) + 1))
+    for i, left in enumerate(a, start=1):
+        current = [i]
+        for j, right in enumerate(b, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (left != right))
+            )
+        previous = current
+    return previous[-1]
+
+
+def _timed(func, *args) -> tuple[int, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(7)
+    print(f"{'chars':>8} {'graphemes':>10} {'distance':>9} {'bit-parallel':>13} {'dp':>10}")
+    for size in (1_000, 3_000, 10_000, 50_000):
+        draft = _document(size, rng)
+        final = _post_edit(draft, rng)
+        a, b = graphemes(draft), graphemes(final)
+        distance, fast = _timed(levenshtein, a, b)
+        dp_column = "skipped"
+        if size <= _DP_LIMIT:
+            dp_distance, slow = _timed(_dp_levenshtein, a, b)
+            assert dp_distance == distance
+            dp_column = f"{slow * 1000:.1f}ms"
+        print(f"{size:>8} {len(a):>10} {distance:>9} {fast * 1000:>11.1f}ms {dp_column:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure event-loop lag while large DOCX exports render.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.export_event_loop [--concurrency 8] [--paragraphs 400]
+
+A ticker sleeps 10ms in a loop and records how late each wake-up is, while
+``--concurrency`` exports of a long submission render inline on the loop, on a
+thread pool, or on a process pool. Inline rendering blocks every other request for
+the whole render; the pools keep the loop responsive (the thread pool still
+contends on the GIL, the process pool does not).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.services.docx_render import DocxContent, DocxRenderPool, load_template, render_docx
+
+_TICK = 0.010
+_PARAGRAPH = "ลดราคา 20% สำหรับรองเท้าผ้าใบสุดสัปดาห์นี้เท่านั้น สมาชิกรับแต้มสองเท่าที่ร้าน "
+
+
+def _content(paragraphs: int) -> DocxContent:
+    body = "\n".join(_PARAGRAPH * 4 for _ in range(paragraphs))
+    return DocxContent(
+        title="Quarterly catalogue",
+        status="approved",
+        tone="friendly",
+        audience="members",
+        channel="email",
+        source_text=body,
+        thai_draft=body,
+        thai_final=body,
+        reviewer_notes="Checked against the glossary.",
+        warnings=tuple(f"Warning {index}" for index in range(20)),
+    )
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_TICK)
+        lags.append(time.perf_counter() - started - _TICK)
+
+
+async def _run(mode: str, content: DocxContent, concurrency: int, workers: int) -> None:
+    pool = None if mode == "inline" else DocxRenderPool(workers, mode, load_template())
+    if pool is not None:
+        # Warm the workers so process start-up is not counted as lag.
+        await asyncio.gather(*(pool.render(content) for _ in range(workers)))
+
+    async def inline() -> bytes:
+        await asyncio.sleep(0)
+        return render_docx(content)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(_TICK * 3)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(inline() if pool is None else pool.render(content) for _ in range(concurrency))
+        )
+    finally:
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+        if pool is not None:
+            pool.shutdown()
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{mode:>8}: {elapsed * 1000:8.0f} ms total  "
+        f"lag median {statistics.median(lags_ms):7.1f} ms  "
+        f"p99 {p99:7.1f} ms  max {lags_ms[-1]:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    content = _content(args.paragraphs)
+    size = len(render_docx(content))
+    print(f"{args.concurrency} concurrent exports of a {size / 1024:.0f} KiB DOCX")
+    for mode in ("inline", "thread", "process"):
+        asyncio.run(_run(mode, content, args.concurrency, args.workers))
+
+
+if __name__ == "__main__":
+    main()
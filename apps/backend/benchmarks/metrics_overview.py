@@ -0,0 +1,131 @@
+"""Benchmark ``MetricsService.overview`` against the row-loading implementation it replaced.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.metrics_overview [--sizes 10000 100000 1000000]
+
+Each size seeds a fresh SQLite database in a temporary directory. The legacy path
+materializes every submission as an ORM object, so it is skipped above
+``--legacy-limit`` rows.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert, select
+
+from app.core.config import get_settings
+from app.db.init_db import upgrade_schema
+from app.db.session import get_engine, get_sessionmaker
+from app.models import Submission, SubmissionStatus
+from app.services.metrics import MetricsService
+
+_SEED_BATCH = 10_000
+_WARNING = "Blocked term detected: 'urgent'."
+_SOURCE = "Save 20% on sneakers this weekend only. Members earn double points in store."
+_DRAFT = "ลดราคา 20% สำหรับรองเท้าผ้าใบสุดสัปดาห์นี้เท่านั้น สมาชิกรับแต้มสองเท่าที่ร้าน"
+
+
+async def _seed(rows: int) -> None:
+    rng = random.Random(rows)
+    statuses = [status.value for status in SubmissionStatus]
+    now = datetime.now(timezone.utc)
+    async with get_sessionmaker()() as session:
+        for start in range(0, rows, _SEED_BATCH):
+            batch = []
+            for _ in range(min(_SEED_BATCH, rows - start)):
+                status = rng.choice(statuses)
+                approved = status == SubmissionStatus.APPROVED.value
+                batch.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "title": "Weekend sale",
+                        "source_text": _SOURCE,
+                        "thai_draft": _DRAFT,
+                        "thai_final": _DRAFT if approved else None,
+                        "usage_tokens": rng.randint(200, 900),
+                        "cost_usd": rng.random() / 100,
+                        "glossary_terms": [],
+                        "warnings": [_WARNING] if rng.random() < 0.1 else [],
+                        "status": status,
+                        "post_edit_ratio": rng.random() / 4 if approved else None,
+                        "time_to_approval_seconds": rng.uniform(600, 86_400) if approved else None,
+                        "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+                        "updated_at": now,
+                    }
+                )
+            await session.execute(insert(Submission), batch)
+            await session.commit()
+
+
+async def _legacy_overview() -> dict[str, int]:
+    """The previous implementation: load every row, count in Python."""
+
+    async with get_sessionmaker()() as session:
+        submissions = (await session.execute(select(Submission))).scalars().all()
+        by_status = {status.value: 0 for status in SubmissionStatus}
+        total_tokens = 0
+        for submission in submissions:
+            by_status[submission.status] += 1
+            total_tokens += submission.usage_tokens or 0
+        return {"total": len(submissions), "tokens": total_tokens}
+
+
+async def _overview() -> dict[str, int]:
+    async with get_sessionmaker()() as session:
+        overview = await MetricsService(session).overview()
+        return {"total": overview.total_submissions, "tokens": overview.total_tokens}
+
+
+async def _measure(func) -> tuple[dict[str, int], float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+async def _run(rows: int, legacy_limit: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["LEO_DATABASE_URL"] = f"sqlite+aiosqlite:///{directory}/bench.db"
+        os.environ["LEO_SEED_INITIAL_GLOSSARY"] = "false"
+        get_settings.cache_clear()  # type: ignore[attr-defined]
+        await upgrade_schema()
+        await _seed(rows)
+
+        result, elapsed, peak = await _measure(_overview)
+        assert result["total"] == rows
+        line = f"{rows:>9} {elapsed * 1000:>10.1f}ms {peak:>8.2f}MiB"
+        if rows <= legacy_limit:
+            legacy, legacy_elapsed, legacy_peak = await _measure(_legacy_overview)
+            assert legacy == result
+            line += f" {legacy_elapsed * 1000:>10.1f}ms {legacy_peak:>8.1f}MiB"
+        else:
+            line += f" {'skipped':>12} {'':>11}"
+        print(line, flush=True)
+        await get_engine().dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-limit", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'aggregate':>12} {'peak':>11} {'legacy':>12} {'peak':>11}")
+    for rows in args.sizes:
+        await _run(rows, args.legacy_limit)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
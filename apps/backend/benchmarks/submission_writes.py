@@ -0,0 +1,85 @@
+"""Create throughput with per-request commits vs group commit.
+
+Run from ``apps/backend``::
+
+    python -m benchmarks.submission_writes [--requests 400] [--concurrency 32]
+
+Each mode gets a fresh SQLite database in a temporary directory and a warm glossary
+cache, then ``--requests`` ``POST /submissions`` calls run through the ASGI app with
+``--concurrency`` in flight (no translation provider is configured, so drafting is
+local and the database write path dominates). ``per-request`` commits every create
+on its own; ``group`` sets ``LEO_SUBMISSION_GROUP_COMMIT_MS`` so creates arriving
+together share one transaction.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import get_settings
+from app.main import create_app
+
+_SOURCE = "Save 20% on sneakers this weekend only. Members earn double points in store."
+
+
+def _p99(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+async def _run(mode: str, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["LEO_DATABASE_URL"] = f"sqlite+aiosqlite:///{directory}/bench.db"
+        os.environ["LEO_SEED_INITIAL_GLOSSARY"] = "false"
+        os.environ["LEO_SUBMISSION_GROUP_COMMIT_MS"] = (
+            str(args.window_ms) if mode == "group" else "0"
+        )
+        get_settings.cache_clear()
+        app = create_app()
+        transport = ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with AsyncClient(transport=transport, base_url="http://bench") as client:
+                await client.post("/translate", json={"text": _SOURCE})
+                semaphore = asyncio.Semaphore(args.concurrency)
+                latencies: list[float] = []
+
+                async def create(index: int) -> None:
+                    async with semaphore:
+                        started = time.perf_counter()
+                        response = await client.post(
+                            "/submissions",
+                            json={"title": f"Promo {index}", "source_text": f"{_SOURCE} {index}"},
+                        )
+                        response.raise_for_status()
+                        latencies.append(time.perf_counter() - started)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(create(index) for index in range(args.requests)))
+                elapsed = time.perf_counter() - started
+
+    print(
+        f"{mode:>11}: {args.requests / elapsed:7.0f} creates/s  "
+        f"p50 {statistics.median(latencies) * 1000:6.1f} ms  "
+        f"p99 {_p99(latencies) * 1000:6.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--modes", nargs="+", default=["per-request", "group"])
+    args = parser.parse_args()
+    for mode in args.modes:
+        asyncio.run(_run(mode, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from app.main import create_app
 async def client(tmp_path):
     os.environ["LEO_DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_path}/test.db"
     os.environ["LEO_SEED_INITIAL_GLOSSARY"] = "false"
+    os.environ["LEO_EXPORT_CACHE_DIR"] = str(tmp_path / "export_cache")
     os.environ["LEO_BLOCKED_TERMS"] = "[\"urgent\"]"
     get_settings.cache_clear()  # type: ignore[attr-defined]
     app = create_app()
@@ -0,0 +1,87 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+
+from app.db.session import get_sessionmaker
+from app.models import Submission, SubmissionArchive, SubmissionTranslation
+from app.services.archive import archive_submissions
+
+
+async def _backdate(days: int) -> None:
+    moment = datetime.now(timezone.utc) - timedelta(days=days)
+    async with get_sessionmaker()() as session:
+        await session.execute(update(Submission).values(created_at=moment, updated_at=moment))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_old_approved_submissions_are_archived_and_read_back(client: AsyncClient):
+    approved = []
+    for index in range(3):
+        created = await client.post(
+            "/submissions",
+            json={
+                "title": f"Launch {index}",
+                "source_text": f"Welcome to Leo, offer {index}",
+                "target_locales": ["vi"],
+            },
+        )
+        submission_id = created.json()["id"]
+        await client.put(
+            f"/submissions/{submission_id}",
+            json={
+                "status": "approved",
+                "thai_final": f"ยินดีต้อนรับ {index}",
+                "locale_finals": {"vi": f"Chào mừng {index}"},
+            },
+        )
+        approved.append(submission_id)
+    editing = (
+        await client.post("/submissions", json={"title": "Draft", "source_text": "Not yet"})
+    ).json()["id"]
+    await _backdate(400)
+    before = {
+        submission_id: (await client.get(f"/submissions/{submission_id}")).json()
+        for submission_id in approved
+    }
+
+    assert await archive_submissions(days=30, batch_size=2) == 3
+    assert await archive_submissions(days=30, batch_size=2) == 0
+    async with get_sessionmaker()() as session:
+        stub = await session.get(Submission, approved[0])
+        assert stub.archived_at is not None
+        assert (stub.source_text, stub.thai_final, stub.status) == ("", None, "approved")
+        assert (await session.get(Submission, editing)).archived_at is None
+        assert await session.scalar(select(func.count()).select_from(SubmissionArchive)) == 3
+        assert await session.scalar(select(func.count()).select_from(SubmissionTranslation)) == 0
+
+    # Reads are unchanged.
+    for submission_id, expected in before.items():
+        assert (await client.get(f"/submissions/{submission_id}")).json() == expected
+    listing = await client.get("/submissions", params={"fields": "source_text,thai_final"})
+    by_id = {item["id"]: item for item in listing.json()["items"]}
+    assert by_id[approved[1]]["thai_final"] == "ยินดีต้อนรับ 1"
+    export = await client.get("/submissions/export", params={"status": "approved"})
+    assert "Welcome to Leo, offer 2" in export.text
+    tmx = await client.get(
+        "/translation-memory/export",
+        params={"format": "tmx", "scope": "submissions", "target_locale": "vi"},
+    )
+    segments = {seg.text for seg in ET.fromstring(tmx.content).iter("seg")}
+    assert {"Welcome to Leo, offer 0", "Chào mừng 0"} <= segments
+
+    # Editing moves the text back into the hot tables first.
+    edited = await client.put(f"/submissions/{approved[0]}", json={"reviewer_notes": "Re-checked"})
+    assert edited.status_code == 200
+    body = edited.json()
+    assert body["source_text"] == "Welcome to Leo, offer 0"
+    assert body["reviewer_notes"] == "Re-checked"
+    assert [item["final_text"] for item in body["translations"]] == ["Chào mừng 0"]
+    async with get_sessionmaker()() as session:
+        restored = await session.get(Submission, approved[0])
+        assert restored.archived_at is None
+        assert restored.thai_final == "ยินดีต้อนรับ 0"
+        assert await session.get(SubmissionArchive, approved[0]) is None
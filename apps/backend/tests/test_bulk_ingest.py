@@ -0,0 +1,81 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.bulk_ingest import iter_csv_rows, iter_lines
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_span_chunks_and_quoted_newlines():
+    data = (
+        "﻿title,source,channel\r\n"
+        'Banner,"Line one\nline ""two""",web\r\n'
+        ",,\r\n"
+        "ป้าย,สวัสดี,\r\n"
+    ).encode()
+    rows = [row async for row in iter_csv_rows(iter_lines(_chunks(data, 5)))]
+    assert rows == [
+        {"title": "Banner", "source": 'Line one\nline "two"', "channel": "web"},
+        {"title": "ป้าย", "source": "สวัสดี", "channel": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_quotes_inside_unquoted_fields_are_literal():
+    data = 'title,source\nPhone,5" screen\nTablet,"10"" screen"\nWatch,"1.5"" face\n(round)"\n'
+    rows = [row async for row in iter_csv_rows(iter_lines(_chunks(data.encode(), 7)))]
+    assert [row["source"] for row in rows] == ['5" screen', '10" screen', '1.5" face\n(round)']
+
+    with pytest.raises(ValueError, match="Unterminated"):
+        [row async for row in iter_csv_rows(iter_lines(_chunks(b'title\n"open\n', 4)))]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_reports_progress_per_row(client: AsyncClient):
+    body = "title,source,tone,audience,channel\n" + "".join(
+        f"Item {index},Shop item {index} today,playful,,email\n" for index in range(5)
+    ) + "Missing source,,,,\n"
+
+    response = await client.post(
+        "/submissions/bulk", content=body.encode(), headers={"content-type": "text/csv"}
+    )
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["status"] for event in events[:-1]].count("created") == 5
+    invalid = next(event for event in events if event["status"] == "invalid")
+    assert invalid["row"] == 6
+    assert invalid["errors"][0].startswith("source_text")
+    assert events[-1] == {"status": "done", "rows": 6, "created": 5, "invalid": 1, "failed": 0}
+
+    counts = (await client.get("/submissions/counts")).json()
+    assert counts["total"] == 5
+    search = (await client.get("/submissions/search", params={"q": "item"})).json()
+    assert search["total"] == 5
+    created = next(event for event in events if event["status"] == "created")
+    detail = (await client.get(f"/submissions/{created['id']}")).json()
+    assert detail["tone"] == "playful" and detail["channel"] == "email"
+    assert detail["translation_prompt"].startswith("You are a senior Thai copywriter")
+
+    jsonl = "\n".join(
+        [
+            json.dumps({"title": "JSON row", "source_text": "Hello", "target_locales": ["vi"]}),
+            "not json",
+        ]
+    )
+    response = await client.post("/submissions/bulk?format=jsonl", content=jsonl.encode())
+    events = [json.loads(line) for line in response.text.splitlines()]
+    # Invalid rows are reported as soon as they are parsed, created rows per batch.
+    assert [(event.get("row"), event["status"]) for event in events] == [
+        (2, "invalid"),
+        (1, "created"),
+        (None, "done"),
+    ]
+
+    unknown = await client.post("/submissions/bulk", content=b"title\nx\n")
+    assert unknown.status_code == 400
@@ -0,0 +1,133 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.db.session import get_sessionmaker
+from app.models import GlossaryEntry, SubmissionGlossaryTerm, SubmissionStatus
+from app.services.usage_analytics import UsageAnalyticsService
+
+
+@pytest.mark.asyncio
+async def test_glossary_change_lists_and_redrafts_affected_submissions(client: AsyncClient):
+    entry = (
+        await client.post("/glossary", json={"source_term": "Flash Sale", "thai_term": "ลดด่วน"})
+    ).json()
+
+    drafts = []
+    for title in ("Banner", "Email", "Push"):
+        response = await client.post(
+            "/submissions",
+            json={"title": title, "source_text": f"Join our flash sale today ({title})."},
+        )
+        assert response.status_code == 201
+        drafts.append(response.json())
+    unrelated = await client.post(
+        "/submissions", json={"title": "Other", "source_text": "Thanks for shopping."}
+    )
+    assert unrelated.status_code == 201
+
+    approved_id = drafts[0]["id"]
+    await client.put(
+        f"/submissions/{approved_id}", json={"status": SubmissionStatus.APPROVED.value}
+    )
+
+    # Nothing is stale until the Thai term changes.
+    stale = await client.get(f"/glossary/{entry['id']}/submissions")
+    assert stale.json() == {"items": [], "total": 0}
+
+    await client.put(f"/glossary/{entry['id']}", json={"thai_term": "แฟลชเซล"})
+
+    affected = await client.get(f"/glossary/{entry['id']}/submissions")
+    assert affected.status_code == 200
+    affected_ids = {item["id"] for item in affected.json()["items"]}
+    assert affected_ids == {drafts[1]["id"], drafts[2]["id"]}
+    assert {item["thai_term_used"] for item in affected.json()["items"]} == {"ลดด่วน"}
+
+    with_approved = await client.get(
+        f"/glossary/{entry['id']}/submissions", params={"include_approved": "true"}
+    )
+    assert with_approved.json()["total"] == 3
+
+    queued = await client.post(f"/glossary/{entry['id']}/redraft")
+    assert queued.status_code == 202
+    assert set(queued.json()["submission_ids"]) == affected_ids
+
+    # Background re-drafting finished with the response; only the approved draft is stale now.
+    after = await client.get(
+        f"/glossary/{entry['id']}/submissions", params={"include_approved": "true"}
+    )
+    assert [item["id"] for item in after.json()["items"]] == [approved_id]
+
+    redrafted = (await client.get(f"/submissions/{drafts[1]['id']}")).json()
+    assert "flash sale → แฟลชเซล" in [term.lower() for term in redrafted["glossary_terms"]]
+
+
+@pytest.mark.asyncio
+async def test_affected_submissions_follow_the_entry_id(client: AsyncClient):
+    entry = (
+        await client.post("/glossary", json={"source_term": "Flash Sale", "thai_term": "ลดด่วน"})
+    ).json()
+    indexed = (
+        await client.post(
+            "/submissions", json={"title": "Indexed", "source_text": "Flash sale today."}
+        )
+    ).json()
+    legacy = (
+        await client.post(
+            "/submissions", json={"title": "Legacy", "source_text": "Flash sale tonight."}
+        )
+    ).json()
+
+    async with get_sessionmaker()() as session:
+        # A row indexed before entry ids were recorded, then a source term edit.
+        await session.execute(
+            update(SubmissionGlossaryTerm)
+            .where(SubmissionGlossaryTerm.submission_id == legacy["id"])
+            .values(glossary_entry_id=None)
+        )
+        await session.execute(
+            update(GlossaryEntry)
+            .where(GlossaryEntry.id == entry["id"])
+            .values(source_term="Flash Sales")
+        )
+        await session.commit()
+
+    await client.put(f"/glossary/{entry['id']}", json={"thai_term": "แฟลชเซล"})
+    affected = (await client.get(f"/glossary/{entry['id']}/submissions")).json()
+    assert [item["id"] for item in affected["items"]] == [indexed["id"]]
+
+
+@pytest.mark.asyncio
+async def test_glossary_usage_and_warning_analytics(client: AsyncClient):
+    entry = (
+        await client.post(
+            "/glossary",
+            json={"source_term": "Gift Card", "thai_term": "บัตรของขวัญ", "is_sensitive": True},
+        )
+    ).json()
+    await client.post("/glossary", json={"source_term": "Coupon", "thai_term": "คูปอง"})
+    for text in ("Urgent: gift card deal", "Gift card and coupon", "Coupon inside"):
+        response = await client.post("/submissions", json={"title": text, "source_text": text})
+        assert response.status_code == 201
+
+    await client.put(f"/glossary/{entry['id']}", json={"thai_term": "กิฟต์การ์ด"})
+    usage = (await client.get("/metrics/glossary-usage", params={"days": 7})).json()
+    assert [
+        (item["source_term"], item["submissions"], item["stale_submissions"])
+        for item in usage["items"]
+    ] == [("coupon", 2, 0), ("gift card", 2, 2)]
+    assert usage["items"][1]["glossary_entry_id"] == entry["id"]
+
+    breakdown = (await client.get("/metrics/warnings", params={"days": 7})).json()
+    assert breakdown["total_submissions"] == 3
+    by_code = {item["code"]: item for item in breakdown["items"]}
+    assert by_code["sensitive_term"]["submissions"] == 2
+    assert by_code["sensitive_term"]["terms"] == [{"term": "gift card", "submissions": 2}]
+    assert by_code["blocked_term"]["rate"] == pytest.approx(1 / 3, abs=1e-4)
+
+    # Rebuilding from the stored warning messages yields the same rows.
+    async with get_sessionmaker()() as session:
+        assert await UsageAnalyticsService(session).rebuild_warning_index() == 3
+    assert (await client.get("/metrics/warnings", params={"days": 7})).json()["items"] == (
+        breakdown["items"]
+    )
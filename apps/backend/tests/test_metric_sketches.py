@@ -0,0 +1,78 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.sketch import DDSketch
+from app.db.session import get_sessionmaker
+from app.models import MetricSketch
+from app.services.sketches import MetricSketchService, SketchRecorder, bucket_start
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_ddsketch_quantiles_are_within_relative_accuracy_and_merge():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(6, 1.2) for _ in range(20_000)]
+    halves = DDSketch(0.01), DDSketch(0.01)
+    for index, value in enumerate(values):
+        halves[index % 2].add(value)
+
+    merged = DDSketch.from_dict(halves[0].to_dict())
+    merged.merge(halves[1])
+    assert merged.count == len(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert abs(merged.quantile(q) - exact) <= 0.01 * exact
+    assert merged.quantile(1) == max(values)
+    assert DDSketch().quantile(0.5) is None
+
+
+@pytest.mark.asyncio
+async def test_percentiles_merge_flushed_workers_and_pending(client: AsyncClient):
+    recorder = SketchRecorder(0.01)
+    for latency in range(1, 101):
+        recorder.record("provider_latency_ms", float(latency), "openai")
+    recorder.record("usage_tokens", None, "openai")
+
+    async with get_sessionmaker()() as session:
+        service = MetricSketchService(session, recorder)
+        assert await service.flush() == 1
+        # A second flush in the same bucket merges into this worker's row.
+        recorder.record("provider_latency_ms", 1000.0, "openai")
+        assert await service.flush() == 1
+
+        other_worker = DDSketch(0.01)
+        for _ in range(99):
+            other_worker.add(5.0)
+        session.add(
+            MetricSketch(
+                bucket_start=bucket_start(datetime.now(timezone.utc)),
+                metric="provider_latency_ms",
+                provider="google_translate",
+                worker="other-host:1",
+                sketch=other_worker.to_dict(),
+                count=other_worker.count,
+            )
+        )
+        await session.commit()
+
+        recorder.record("provider_latency_ms", 2000.0, "openai")
+        overall = await service.percentiles(hours=1)
+        by_provider = await service.percentiles(hours=1, by_provider=True)
+
+    assert [(item.metric, item.count) for item in overall.items] == [("provider_latency_ms", 201)]
+    assert overall.items[0].max == 2000.0
+    assert overall.items[0].p50 == pytest.approx(5.0, rel=0.01)
+    providers = {item.provider: item for item in by_provider.items}
+    assert providers["openai"].count == 102
+    assert providers["openai"].p50 == pytest.approx(51, rel=0.02)
+    assert providers["google_translate"].p99 == pytest.approx(5.0, rel=0.01)
+
+    response = await client.get("/metrics/percentiles", params={"hours": 1})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["count"] == 200
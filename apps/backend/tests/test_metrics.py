@@ -1,7 +1,12 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
 
-from app.models import SubmissionStatus
+from app.core.edit_distance import levenshtein, post_edit_distance
+from app.db.session import get_sessionmaker
+from app.dependencies import redraft_submission_in_session
+from app.models import Submission, SubmissionDailyRollup, SubmissionStatus
+from app.services.rollups import MEASURES, DailyRollups
 
 
 @pytest.mark.asyncio
@@ -33,3 +38,115 @@ async def test_metrics_overview(client: AsyncClient):
     assert "approval_rate" in overview
     # When blocked term "urgent" exists, warnings should be counted
     assert overview["submissions_with_warnings"] >= 0
+
+
+def test_post_edit_distance_counts_graphemes():
+    # Changing a tone mark is one edit, not a removed and an inserted code point.
+    assert post_edit_distance("ไม่", "ไม้") == (1, 0.5)
+    assert post_edit_distance("", "") == (0, 0.0)
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("a" * 200 + "b", "b" + "a" * 200) == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_overview_reports_edit_metrics(client: AsyncClient):
+    created = await client.post(
+        "/submissions", json={"title": "Edits", "source_text": "Welcome to Leo"}
+    )
+    submission_id = created.json()["id"]
+    await client.put(f"/submissions/{submission_id}", json={"thai_final": "ยินดีต้อนรับ"})
+    await client.post(
+        "/submissions/bulk-transition",
+        json={"ids": [submission_id], "status": SubmissionStatus.APPROVED.value},
+    )
+
+    overview = (await client.get("/metrics/overview")).json()
+    assert overview["average_post_edit_distance"] > 0
+    assert 0 < overview["average_post_edit_ratio"] <= 1
+    assert overview["average_time_to_approval_hours"] >= 0
+
+    # Leaving approved clears the turnaround so it is measured again on re-approval.
+    await client.put(
+        f"/submissions/{submission_id}", json={"status": SubmissionStatus.IN_REVIEW.value}
+    )
+    overview = (await client.get("/metrics/overview")).json()
+    assert overview["average_time_to_approval_hours"] is None
+
+
+@pytest.mark.asyncio
+async def test_metrics_overview_aggregates_in_sql(client: AsyncClient):
+    for index, text in enumerate(["Act now, urgent sale", "Calm weekend sale", "Urgent!"]):
+        await client.post("/submissions", json={"title": f"Sale {index}", "source_text": text})
+
+    async with get_sessionmaker()() as session:
+        await session.execute(update(Submission).values(usage_tokens=10, cost_usd=0.5))
+        # A JSON null must not count as having warnings.
+        await session.execute(
+            update(Submission).where(Submission.title == "Sale 1").values(warnings=None)
+        )
+        await session.commit()
+
+    overview = (await client.get("/metrics/overview")).json()
+    assert overview["total_submissions"] == 3
+    assert overview["submissions_by_status"][SubmissionStatus.EDITING.value] == 3
+    assert overview["submissions_with_warnings"] == 2
+    assert overview["total_tokens"] == 30
+    assert overview["average_tokens"] == 10
+    assert overview["total_cost_usd"] == 1.5
+    assert overview["approval_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_daily_rollups_track_writes_and_match_rebuild(client: AsyncClient):
+    ids = []
+    for index, channel in enumerate(["email", "email", "social", None]):
+        created = await client.post(
+            "/submissions",
+            json={"title": f"Rollup {index}", "source_text": "Urgent sale", "channel": channel},
+        )
+        ids.append(created.json()["id"])
+    await client.put(f"/submissions/{ids[0]}", json={"thai_final": "ลดราคา"})
+    await client.put(f"/submissions/{ids[0]}", json={"status": SubmissionStatus.APPROVED.value})
+    await client.post(
+        "/submissions/bulk-transition",
+        json={"filter": {"channel": "email"}, "status": SubmissionStatus.IN_REVIEW.value},
+    )
+    await client.post(
+        "/submissions/bulk-transition",
+        json={"ids": ids[1:3], "status": SubmissionStatus.APPROVED.value},
+    )
+    async with get_sessionmaker()() as session:
+        await redraft_submission_in_session(session, ids[3])
+
+    async def snapshot() -> dict:
+        async with get_sessionmaker()() as session:
+            rows = (await session.scalars(select(SubmissionDailyRollup))).all()
+        return {
+            (row.day, row.status, row.provider, row.channel): tuple(
+                round(getattr(row, name), 6) for name in MEASURES
+            )
+            for row in rows
+            if row.submissions
+        }
+
+    maintained = await snapshot()
+    async with get_sessionmaker()() as session:
+        await DailyRollups(session).rebuild()
+    assert maintained == await snapshot()
+
+    series = (await client.get("/metrics/timeseries", params={"days": 7})).json()
+    assert len(series["points"]) == 1
+    point = series["points"][0]
+    assert point["submissions"] == 4
+    assert point["approved"] == 2
+    assert point["submissions_with_warnings"] == 4
+    assert point["average_post_edit_ratio"] > 0
+
+    by_channel = (
+        await client.get("/metrics/timeseries", params={"days": 7, "group_by": "channel"})
+    ).json()
+    assert {item["group"]: item["submissions"] for item in by_channel["points"]} == {
+        None: 1,
+        "email": 2,
+        "social": 1,
+    }
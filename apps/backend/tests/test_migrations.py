@@ -0,0 +1,69 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from httpx import AsyncClient
+from sqlalchemy import inspect, text
+
+from app.core.config import get_settings
+from app.db.base import Base
+from app.db.init_db import upgrade_schema
+from app.db.migrations import (
+    BASELINE_REVISION,
+    MIGRATIONS_DIR,
+    alembic_config,
+    compare_type,
+    include_name,
+)
+from app.db.session import get_engine
+
+
+@pytest.mark.asyncio
+async def test_migrations_build_the_model_schema(client: AsyncClient):
+    def diff(connection):
+        context = MigrationContext.configure(
+            connection, opts={"compare_type": compare_type, "include_name": include_name}
+        )
+        return compare_metadata(context, Base.metadata)
+
+    async with get_engine().connect() as connection:
+        assert await connection.run_sync(diff) == []
+
+
+@pytest.mark.asyncio
+async def test_pre_migration_database_is_stamped_and_upgraded(monkeypatch, tmp_path):
+    monkeypatch.setenv("LEO_DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path}/legacy.db")
+    get_settings.cache_clear()
+    try:
+        # What ``create_all`` left behind before the app shipped migrations.
+        async with get_engine().begin() as connection:
+            await connection.run_sync(
+                lambda sync: command.upgrade(alembic_config(sync), BASELINE_REVISION)
+            )
+            await connection.execute(text("DROP TABLE alembic_version"))
+            await connection.execute(
+                text(
+                    "INSERT INTO submissions (id, title, source_text, thai_draft, "
+                    "glossary_terms, warnings, status) "
+                    "VALUES ('legacy', 'Old', 'Hello', 'สวัสดี', '[]', '[]', 'approved')"
+                )
+            )
+
+        await upgrade_schema()
+        await upgrade_schema()
+
+        async with get_engine().connect() as connection:
+            version = await connection.scalar(text("SELECT version_num FROM alembic_version"))
+            assert version == ScriptDirectory(str(MIGRATIONS_DIR)).get_current_head()
+            columns = await connection.run_sync(
+                lambda sync: {column["name"] for column in inspect(sync).get_columns("submissions")}
+            )
+            assert {"source_fingerprint", "archived_at"} <= columns
+            query = text("SELECT title, created_at FROM submissions")
+            legacy = (await connection.execute(query)).one()
+            assert legacy.title == "Old"
+            # ``CURRENT_TIMESTAMP`` rows gain the microseconds bound parameters carry.
+            assert legacy.created_at.endswith(".000000")
+    finally:
+        get_settings.cache_clear()
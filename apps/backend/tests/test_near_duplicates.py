@@ -0,0 +1,121 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.simhash import bands, hamming_distance, simhash, to_signed
+from app.db.session import get_sessionmaker
+from app.models import Submission, SubmissionStatus
+from app.models.submission import fingerprint_columns
+from app.services.near_duplicates import adapt_reused_copy, backfill_fingerprints
+
+
+def test_close_fingerprints_share_a_band():
+    base = simhash("Save big on the Leo sneaker collection this weekend only.")
+    variant = simhash("Save big on the Leo sandal collection this weekend only.")
+    unrelated = simhash("Our quarterly report covers revenue growth across Asia.")
+    assert hamming_distance(base, variant) < hamming_distance(base, unrelated)
+
+    # Three flipped bits can spoil at most three of the four bands.
+    flipped = base ^ (1 << 3 | 1 << 20 | 1 << 40)
+    assert sum(left == right for left, right in zip(bands(base), bands(flipped))) == 1
+    # Stored (signed) fingerprints split into the same bands.
+    assert bands(to_signed(base)) == bands(base)
+
+
+def test_adapt_reused_copy_swaps_changed_numbers():
+    adapted = adapt_reused_copy(
+        "Sale ends 12/05. Only 1,299 baht.",
+        "Sale ends 19/05. Only 999 baht.",
+        "ลดราคาถึง 12/05 เพียง 1,299 บาท",
+    )
+    assert adapted == "ลดราคาถึง 19/05 เพียง 999 บาท"
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_reuse_flow(client: AsyncClient):
+    original = await client.post(
+        "/submissions",
+        json={
+            "title": "Weekend promo",
+            "source_text": "Enjoy 20% off all sneakers until 12/05 at every Leo store.",
+        },
+    )
+    assert original.status_code == 201
+    original_id = original.json()["id"]
+
+    approve = await client.put(
+        f"/submissions/{original_id}",
+        json={"thai_final": "ลด 20% ทุกคู่ถึง 12/05", "status": SubmissionStatus.APPROVED.value},
+    )
+    assert approve.status_code == 200
+
+    lookup = await client.post(
+        "/submissions/near-duplicates",
+        json={"source_text": "Enjoy 30% off all sneakers until 19/05 at every Leo store."},
+    )
+    assert lookup.status_code == 200
+    items = lookup.json()["items"]
+    assert items and items[0]["id"] == original_id
+
+    reused = await client.post(
+        "/submissions",
+        json={
+            "title": "Weekend promo (next week)",
+            "source_text": "Enjoy 30% off all sneakers until 19/05 at every Leo store.",
+            "reuse_near_duplicate": True,
+        },
+    )
+    assert reused.status_code == 201
+    body = reused.json()
+    assert body["provider_name"] == "near_duplicate"
+    assert body["thai_draft"] == "ลด 30% ทุกคู่ถึง 19/05"
+    assert original_id in body["notes"]
+
+    related = await client.get(f"/submissions/{body['id']}/near-duplicates")
+    assert related.status_code == 200
+    assert [item["id"] for item in related.json()["items"]] == [original_id]
+
+
+@pytest.mark.asyncio
+async def test_lookups_read_fingerprints_from_the_database(client: AsyncClient):
+    source = "Enjoy 20% off all sneakers until 12/05 at every Leo store."
+    fingerprint = to_signed(simhash(source))
+    legacy = "Our quarterly report covers revenue growth across Asia."
+    # Rows written by other workers reach lookups through the database alone; hundreds
+    # of unapproved variants must not hide the approved one that sorts after them.
+    async with get_sessionmaker()() as session:
+        session.add_all(
+            Submission(
+                id=f"draft-{index:04d}",
+                title="Variant",
+                source_text=source,
+                thai_draft="ร่าง",
+                **fingerprint_columns(fingerprint),
+            )
+            for index in range(600)
+        )
+        session.add(
+            Submission(
+                id="zz-approved",
+                title="Approved",
+                source_text=source,
+                thai_draft="ร่าง",
+                thai_final="ลด 20% ทุกคู่ถึง 12/05",
+                status=SubmissionStatus.APPROVED.value,
+                **fingerprint_columns(fingerprint),
+            )
+        )
+        session.add(
+            Submission(id="legacy", title="Legacy", source_text=legacy, thai_draft="ร่าง")
+        )
+        await session.commit()
+
+    lookup = await client.post(
+        "/submissions/near-duplicates", json={"source_text": source, "approved_only": True}
+    )
+    assert [item["id"] for item in lookup.json()["items"]] == ["zz-approved"]
+
+    # Rows from before fingerprints existed match once the backfill command has run.
+    async with get_sessionmaker()() as session:
+        assert await backfill_fingerprints(session) == 1
+    lookup = await client.post("/submissions/near-duplicates", json={"source_text": legacy})
+    assert [item["id"] for item in lookup.json()["items"]] == ["legacy"]
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.core.delta import apply_delta, make_delta
+
+
+def test_delta_round_trips_mixed_script_edits():
+    old = "Save 20% on sneakers this weekend. ลดราคาพิเศษสุดสัปดาห์นี้"
+    new = "Save 25% on Leo sneakers this weekend! ลดราคาสุดสัปดาห์นี้เท่านั้น"
+    delta = make_delta(old, new)
+    assert apply_delta(old, delta) == new
+    assert len(str(delta)) < len(new)
+    assert make_delta(new, new) == []
+
+
+@pytest.mark.asyncio
+async def test_revisions_reconstruct_across_snapshots(client: AsyncClient, monkeypatch):
+    monkeypatch.setenv("LEO_REVISION_SNAPSHOT_INTERVAL", "3")
+    get_settings.cache_clear()  # type: ignore[attr-defined]
+
+    created = await client.post(
+        "/submissions", json={"title": "History", "source_text": "Welcome to Leo"}
+    )
+    submission_id = created.json()["id"]
+    finals = [f"ยินดีต้อนรับสู่ Leo รอบที่ {index}" for index in range(1, 6)]
+    for final in finals:
+        await client.put(f"/submissions/{submission_id}", json={"thai_final": final})
+    # Saving identical text does not create a revision.
+    await client.put(f"/submissions/{submission_id}", json={"thai_final": finals[-1]})
+
+    listing = (await client.get(f"/submissions/{submission_id}/revisions")).json()
+    assert listing["total"] == 6
+    assert [item["is_snapshot"] for item in reversed(listing["items"])] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+    first = (await client.get(f"/submissions/{submission_id}/revisions/1")).json()
+    assert first["reason"] == "created"
+    # Timestamps carry UTC like the rest of the API, SQLite included.
+    assert datetime.fromisoformat(first["created_at"]).utcoffset() == timedelta(0)
+    assert first["thai_final"] is None
+    for revision, final in enumerate(finals, start=2):
+        state = (await client.get(f"/submissions/{submission_id}/revisions/{revision}")).json()
+        assert state["thai_final"] == final
+        assert state["thai_draft"] == created.json()["thai_draft"]
+
+    diff = (
+        await client.get(
+            f"/submissions/{submission_id}/revisions/diff", params={"from": 2, "to": 6}
+        )
+    ).json()
+    assert {"op": "delete", "text": "1"} in diff["thai_final"]
+    assert {"op": "insert", "text": "5"} in diff["thai_final"]
+    assert all(segment["op"] == "equal" for segment in diff["thai_draft"])
+
+    missing = await client.get(f"/submissions/{submission_id}/revisions/9")
+    assert missing.status_code == 404
@@ -0,0 +1,50 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.segmentation import search_phrases, segment_for_search
+
+
+def test_thai_text_is_indexed_as_bigrams():
+    assert segment_for_search("Hello สวัสดี").split() == ["hello", "สว", "วั", "ัส", "สด", "ดี"]
+    assert search_phrases("e-mail ลดราคา") == [["e", "mail"], ["ลด", "ดร", "รา", "าค", "คา"]]
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_paginates_submissions(client: AsyncClient):
+    for title, source in (
+        ("Songkran banner", "Splash into savings this Songkran."),
+        ("Weekend email", "Our Songkran sale ends Sunday."),
+        ("Loyalty push", "Double points for members."),
+    ):
+        response = await client.post("/submissions", json={"title": title, "source_text": source})
+        assert response.status_code == 201
+
+    results = await client.get("/submissions/search", params={"q": "songkran"})
+    assert results.status_code == 200
+    body = results.json()
+    assert body["total"] == 2
+    # Title matches carry more weight than body matches.
+    assert [item["title"] for item in body["items"]] == ["Songkran banner", "Weekend email"]
+
+    second_page = await client.get(
+        "/submissions/search", params={"q": "songkran", "limit": 1, "offset": 1}
+    )
+    assert [item["title"] for item in second_page.json()["items"]] == ["Weekend email"]
+
+    loyalty = (await client.get("/submissions/search", params={"q": "members"})).json()
+    submission_id = loyalty["items"][0]["id"]
+    await client.put(
+        f"/submissions/{submission_id}", json={"thai_final": "สะสมแต้มสองเท่าสำหรับสมาชิก"}
+    )
+
+    # Any Thai substring of two or more characters matches, without word boundaries.
+    thai = (await client.get("/submissions/search", params={"q": "สมาชิก"})).json()
+    assert [item["id"] for item in thai["items"]] == [submission_id]
+    assert (await client.get("/submissions/search", params={"q": "แต้ม songkran"})).json()[
+        "total"
+    ] == 0
+
+    filtered = await client.get(
+        "/submissions/search", params={"q": "songkran", "status": "approved"}
+    )
+    assert filtered.json() == {"items": [], "total": 0}
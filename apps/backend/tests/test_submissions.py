@@ -1,7 +1,20 @@
+import asyncio
+import csv
+import io
+import zipfile
+
 import pytest
+from docx import Document
 from httpx import AsyncClient
+from sqlalchemy import event
 
+from app.core.config import get_settings
+from app.db.group_commit import GroupCommitter
+from app.db.session import get_engine
 from app.models import SubmissionStatus
+from app.services import docx_render, exports
+from app.services.docx_render import DocxContent, DocxRenderPool
+from app.services.export_cache import get_export_cache
 
 
 @pytest.mark.asyncio
@@ -81,3 +94,333 @@ async def test_submission_flow(client: AsyncClient):
     )
     assert export_social.status_code == 200
     assert export_social.headers["content-type"].startswith("text/plain")
+
+
+@pytest.mark.asyncio
+async def test_submission_list_keyset_pagination(client: AsyncClient):
+    created_ids = []
+    for index in range(5):
+        response = await client.post(
+            "/submissions",
+            json={"title": f"Item {index}", "source_text": f"Promo number {index}"},
+        )
+        created_ids.append(response.json()["id"])
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get("/submissions", params=params)).json()
+        assert page["total"] == 5
+        assert all("source_text" not in item and "thai_draft" not in item for item in page["items"])
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == list(reversed(created_ids))
+
+    projected = await client.get("/submissions", params={"fields": "title,thai_draft", "limit": 1})
+    assert projected.status_code == 200
+    assert set(projected.json()["items"][0]) == {"id", "title", "thai_draft"}
+
+    invalid = await client.get("/submissions", params={"fields": "password"})
+    assert invalid.status_code == 400
+    bad_cursor = await client.get("/submissions", params={"cursor": "not-a-cursor"})
+    assert bad_cursor.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_status_counts_follow_transitions(client: AsyncClient):
+    ids = []
+    for index in range(3):
+        response = await client.post(
+            "/submissions", json={"title": f"Count {index}", "source_text": "Count me in"}
+        )
+        ids.append(response.json()["id"])
+
+    await client.put(f"/submissions/{ids[0]}", json={"status": SubmissionStatus.IN_REVIEW.value})
+    await client.put(f"/submissions/{ids[1]}", json={"status": SubmissionStatus.APPROVED.value})
+    # Re-applying the same status must not double count.
+    await client.put(f"/submissions/{ids[1]}", json={"status": SubmissionStatus.APPROVED.value})
+
+    counts = (await client.get("/submissions/counts")).json()
+    assert counts["total"] == 3
+    assert counts["counts"] == {
+        SubmissionStatus.EDITING.value: 1,
+        SubmissionStatus.IN_REVIEW.value: 1,
+        SubmissionStatus.APPROVED.value: 1,
+        SubmissionStatus.NEEDS_CHANGES.value: 0,
+    }
+
+    approved = await client.get("/submissions", params={"status": SubmissionStatus.APPROVED.value})
+    assert approved.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_reports_per_id_outcomes(client: AsyncClient):
+    ids = []
+    for index, channel in enumerate(("email", "email", "social")):
+        response = await client.post(
+            "/submissions",
+            json={"title": f"Bulk {index}", "source_text": "Hello", "channel": channel},
+        )
+        ids.append(response.json()["id"])
+    await client.put(f"/submissions/{ids[1]}", json={"status": SubmissionStatus.IN_REVIEW.value})
+    await client.put(f"/submissions/{ids[2]}", json={"status": SubmissionStatus.APPROVED.value})
+
+    response = await client.post(
+        "/submissions/bulk-transition",
+        json={
+            "ids": [ids[0], ids[1], ids[2], "missing"],
+            "status": SubmissionStatus.APPROVED.value,
+            "reviewer_notes": "Campaign approved",
+        },
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [(item["id"], item["outcome"]) for item in body["items"]] == [
+        (ids[0], "updated"),
+        (ids[1], "updated"),
+        (ids[2], "unchanged"),
+        ("missing", "not_found"),
+    ]
+    assert body["items"][1]["previous_status"] == SubmissionStatus.IN_REVIEW.value
+    assert (body["updated"], body["unchanged"], body["not_found"]) == (2, 1, 1)
+
+    detail = (await client.get(f"/submissions/{ids[0]}")).json()
+    assert detail["status"] == SubmissionStatus.APPROVED.value
+    assert detail["reviewer_notes"] == "Campaign approved"
+    assert detail["last_reviewed_at"] is not None
+    counts = (await client.get("/submissions/counts")).json()["counts"]
+    assert counts[SubmissionStatus.APPROVED.value] == 3
+    assert counts[SubmissionStatus.EDITING.value] == 0
+
+    by_filter = await client.post(
+        "/submissions/bulk-transition",
+        json={"filter": {"channel": "email"}, "status": SubmissionStatus.NEEDS_CHANGES.value},
+    )
+    assert {item["id"] for item in by_filter.json()["items"]} == {ids[0], ids[1]}
+    counts = (await client.get("/submissions/counts")).json()["counts"]
+    assert counts[SubmissionStatus.NEEDS_CHANGES.value] == 2
+
+    invalid = await client.post(
+        "/submissions/bulk-transition",
+        json={"filter": {}, "status": SubmissionStatus.APPROVED.value},
+    )
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_streams_filtered_csv_and_zip(client: AsyncClient, monkeypatch):
+    # Force several flushes so the chunked paths are exercised.
+    monkeypatch.setattr(exports, "_FLUSH_BYTES", 256)
+    ids = []
+    for index in range(6):
+        created = await client.post(
+            "/submissions",
+            json={
+                "title": f"Month end {index}",
+                "source_text": f"Offer number {index}, see you at the store.",
+                "channel": "email" if index % 2 else "social",
+            },
+        )
+        ids.append(created.json()["id"])
+
+    response = await client.get("/submissions/export", params={"channel": "email"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment; filename=submissions-" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert [row["id"] for row in rows] == ids[1::2]
+    assert rows[0]["title"] == "Month end 1"
+    assert rows[0]["thai_draft"]
+
+    archive_response = await client.get(
+        "/submissions/export", params={"format": "zip", "status": "editing"}
+    )
+    assert archive_response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(archive_response.content)) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        assert len(names) == 12
+        assert f"month-end-0-{ids[0]}.txt" in names
+        document = Document(io.BytesIO(archive.read(f"month-end-0-{ids[0]}.docx")))
+        assert document.paragraphs[0].text == "Month end 0"
+
+    empty = await client.get("/submissions/export", params={"status": "approved"})
+    assert empty.content.decode("utf-8-sig").strip().startswith("id,title")
+
+
+@pytest.mark.asyncio
+async def test_docx_pool_renders_from_the_configured_template(tmp_path):
+    branded = Document()
+    branded.add_paragraph("ACME letterhead")
+    template_path = tmp_path / "template.docx"
+    branded.save(template_path)
+
+    content = DocxContent(
+        title="Launch",
+        status="approved",
+        tone=None,
+        audience=None,
+        channel="email",
+        source_text="Hello",
+        thai_draft="สวัสดี",
+        thai_final=None,
+        reviewer_notes=None,
+        warnings=("Check the date",),
+    )
+    pool = DocxRenderPool(1, "thread", template_path.read_bytes())
+    try:
+        rendered = await pool.render(content)
+    finally:
+        pool.shutdown()
+        # Thread pools install the template process-wide; restore the default.
+        docx_render.install_template(docx_render.load_template())
+
+    paragraphs = [paragraph.text for paragraph in Document(io.BytesIO(rendered)).paragraphs]
+    assert paragraphs[:3] == ["ACME letterhead", "Launch", "Status: approved"]
+    assert "Pending edits" in paragraphs
+    assert paragraphs[-1] == "Check the date"
+
+
+@pytest.mark.asyncio
+async def test_export_cache_serves_repeats_and_drops_stale_versions(
+    client: AsyncClient, monkeypatch
+):
+    created = await client.post(
+        "/submissions", json={"title": "Cached", "source_text": "Export me twice."}
+    )
+    submission_id = created.json()["id"]
+    url = f"/submissions/{submission_id}/export"
+
+    first = await client.get(url, params={"format": "docx"})
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    def fail(self, format):
+        raise AssertionError("cached export was rendered again")
+
+    monkeypatch.setattr(exports.ExportService, "render", fail)
+    repeat = await client.get(url, params={"format": "docx"})
+    assert repeat.content == first.content
+    assert repeat.headers["etag"] == etag
+    assert "submission-" in repeat.headers["content-disposition"]
+
+    not_modified = await client.get(
+        url, params={"format": "docx"}, headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    unsupported = await client.get(url, params={"format": "bogus"}, headers={"If-None-Match": "*"})
+    assert unsupported.status_code == 422
+    monkeypatch.undo()
+
+    await client.put(f"/submissions/{submission_id}", json={"thai_final": "ฉบับแก้ไข"})
+    edited = await client.get(url, params={"format": "docx"}, headers={"If-None-Match": etag})
+    assert edited.status_code == 200
+    assert edited.headers["etag"] != etag
+    cache_dir = get_export_cache().directory
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # Eviction keeps the directory under the byte budget, newest entries first.
+    monkeypatch.setenv("LEO_EXPORT_CACHE_MAX_BYTES", str(len(edited.content) + 150))
+    monkeypatch.setenv("LEO_EXPORT_CACHE_DIR", str(cache_dir.parent / "small_cache"))
+    get_settings.cache_clear()
+    await client.get(url, params={"format": "docx"})
+    await client.get(url, params={"format": "csv"})
+    cache = get_export_cache()
+    assert [path.name.rsplit("-", 1)[1] for path in cache.directory.iterdir()] == ["csv"]
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_bulk_export_writes_parquet_and_arrow(client: AsyncClient):
+    pyarrow = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    ipc = pytest.importorskip("pyarrow.ipc")
+
+    for index in range(3):
+        await client.post(
+            "/submissions",
+            json={"title": f"Metric {index}", "source_text": f"Row {index} for analysts."},
+        )
+
+    parquet = await client.get("/submissions/export", params={"format": "parquet"})
+    assert parquet.status_code == 200
+    assert parquet.headers["content-type"] == "application/vnd.apache.parquet"
+    assert ".parquet" in parquet.headers["content-disposition"]
+    table = pq.read_table(io.BytesIO(parquet.content))
+    assert table.num_rows == 3
+    assert table.schema.field("created_at").type == pyarrow.timestamp("us", tz="UTC")
+    assert table.schema.field("usage_tokens").type == pyarrow.int64()
+    assert table.column("title").to_pylist() == ["Metric 0", "Metric 1", "Metric 2"]
+
+    arrow = await client.get(
+        "/submissions/export",
+        params={"format": "arrow", "columns": "id,status,warnings", "status": "editing"},
+    )
+    assert arrow.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    stream = ipc.open_stream(arrow.content).read_all()
+    assert stream.column_names == ["id", "status", "warnings"]
+    assert stream.column("status").to_pylist() == ["editing"] * 3
+    assert stream.schema.field("warnings").type == pyarrow.list_(pyarrow.string())
+
+    unknown = await client.get(
+        "/submissions/export", params={"format": "parquet", "columns": "id,secret"}
+    )
+    assert unknown.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_group_commit_shares_one_transaction(client: AsyncClient, monkeypatch):
+    monkeypatch.setenv("LEO_SUBMISSION_GROUP_COMMIT_MS", "200")
+    get_settings.cache_clear()
+    commits = []
+
+    def listener(connection) -> None:
+        commits.append(1)
+
+    event.listen(get_engine().sync_engine, "commit", listener)
+    try:
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/submissions",
+                    json={"title": f"Promo {index}", "source_text": f"Sale number {index}"},
+                )
+                for index in range(5)
+            )
+        )
+    finally:
+        event.remove(get_engine().sync_engine, "commit", listener)
+        monkeypatch.delenv("LEO_SUBMISSION_GROUP_COMMIT_MS")
+        get_settings.cache_clear()
+    assert [response.status_code for response in responses] == [201] * 5
+    assert len(commits) == 1
+    created = responses[2].json()
+    assert (await client.get(f"/submissions/{created['id']}")).json() == created
+    assert (await client.get("/submissions/counts")).json()["total"] == 5
+
+
+@pytest.mark.asyncio
+async def test_group_commit_retries_a_failed_batch_item_by_item():
+    # Only the bad item's caller sees the failure.
+    flushed = []
+
+    async def flush(items: list[int]) -> None:
+        if 3 in items:
+            raise ValueError("bad item")
+        flushed.append(items)
+
+    committer = GroupCommitter(flush, window_seconds=0.05, max_batch=10)
+    outcomes = await asyncio.gather(
+        *(committer.submit(item) for item in range(5)), return_exceptions=True
+    )
+    assert [isinstance(outcome, ValueError) for outcome in outcomes] == [
+        False, False, False, True, False
+    ]
+    assert flushed == [[0], [1], [2], [4]]
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select, text
+
+from app.core.compression import compress_text, decompress_text
+from app.db.session import get_sessionmaker
+from app.models import TextBlob
+from app.services.text_blobs import SOURCE_SECTION_REF, compact_text_storage
+
+
+def test_compression_round_trips_and_skips_tiny_values():
+    long_text = "ลดราคาพิเศษสุดสัปดาห์นี้เท่านั้น " * 20
+    packed = compress_text(long_text)
+    assert len(packed) < len(long_text.encode("utf-8")) / 4
+    assert decompress_text(packed) == long_text
+
+    assert compress_text("Hi") == b"\x00Hi"
+    assert decompress_text(compress_text("")) == ""
+
+
+@pytest.mark.asyncio
+async def test_prompts_are_deduplicated_and_resolved_on_detail(client: AsyncClient):
+    created = []
+    for source in ("Meet the new Leo app.", "Download the Leo app today."):
+        response = await client.post(
+            "/submissions", json={"title": "App launch", "source_text": source}
+        )
+        assert response.status_code == 201
+        created.append(response.json())
+
+    async with get_sessionmaker()() as session:
+        stored = (
+            await session.execute(
+                text(
+                    "SELECT translation_prompt, prompt_sections, typeof(source_text) "
+                    "FROM submissions"
+                )
+            )
+        ).all()
+        blob_count = await session.scalar(select(func.count()).select_from(TextBlob))
+    assert all(row[0] is None and row[2] == "blob" for row in stored)
+    # Both prompts share every other section; the source text is referenced, not stored.
+    assert all(SOURCE_SECTION_REF in json.loads(row[1]) for row in stored)
+    sections_per_prompt = len(created[0]["translation_prompt"].split("\n\n"))
+    assert blob_count == sections_per_prompt - 1
+
+    detail = (await client.get(f"/submissions/{created[0]['id']}")).json()
+    assert detail["translation_prompt"] == created[0]["translation_prompt"]
+    assert detail["translation_prompt"].startswith("You are a senior Thai copywriter")
+    assert detail["source_text"] == "Meet the new Leo app."
+
+    listed = (await client.get("/submissions", params={"fields": "translation_prompt"})).json()
+    assert {item["translation_prompt"] for item in listed["items"]} == {
+        item["translation_prompt"] for item in created
+    }
+
+
+@pytest.mark.asyncio
+async def test_compact_text_storage_converts_legacy_rows(client: AsyncClient):
+    legacy_prompt = "You are a senior Thai copywriter.\n\nContent to adapt:\nHello"
+    async with get_sessionmaker()() as session:
+        await session.execute(
+            text(
+                "INSERT INTO submissions (id, title, source_text, thai_draft, translation_prompt, "
+                "glossary_terms, warnings, status, created_at, updated_at) VALUES "
+                "('legacy', 'Legacy', 'Hello', 'สวัสดี', :prompt, '[]', '[]', 'editing', "
+                "'2024-01-01 00:00:00.000000', '2024-01-01 00:00:00.000000')"
+            ),
+            {"prompt": legacy_prompt},
+        )
+        await session.commit()
+
+        assert await compact_text_storage(session) == 1
+        row = (
+            await session.execute(
+                text(
+                    "SELECT translation_prompt, typeof(thai_draft), updated_at, prompt_sections "
+                    "FROM submissions WHERE id = 'legacy'"
+                )
+            )
+        ).one()
+    assert row[0] is None and row[1] == "blob"
+    assert row[2].startswith("2024-01-01")
+    assert json.loads(row[3])[-1] == SOURCE_SECTION_REF
+
+    detail = (await client.get("/submissions/legacy")).json()
+    assert detail["translation_prompt"] == legacy_prompt
+    assert detail["thai_draft"] == "สวัสดี"
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import Settings
+from app.schemas.glossary import GlossaryEntryRead
+from app.services.providers.base import ProviderOutput
+from app.services.translation import TranslationService
+
+
+class CountingGlossary:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def matched_entries(self, english_text: str) -> list[GlossaryEntryRead]:
+        self.calls += 1
+        return [GlossaryEntryRead(id="1", source_term="brand", thai_term="แบรนด์")]
+
+
+class ConcurrentOrchestrator:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, prompt: str, locale: str = "th") -> ProviderOutput:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return ProviderOutput(thai_text=f"{locale}: draft", provider_name="fake", raw_prompt=prompt)
+
+
+@pytest.mark.asyncio
+async def test_translate_many_shares_glossary_pass_and_fans_out():
+    glossary = CountingGlossary()
+    orchestrator = ConcurrentOrchestrator()
+    service = TranslationService(
+        settings=Settings(blocked_terms=[]),
+        glossary_service=glossary,  # type: ignore[arg-type]
+        orchestrator=orchestrator,  # type: ignore[arg-type]
+    )
+
+    results = await service.translate_many("Meet the brand.", locales=["th", "vi", "id"])
+
+    assert glossary.calls == 1
+    assert orchestrator.peak == 3
+    assert {locale: result.thai_text for locale, result in results.items()} == {
+        "th": "th: draft",
+        "vi": "vi: draft",
+        "id": "id: draft",
+    }
+    assert results["vi"].prompt.startswith("You are a senior Vietnamese copywriter")
+    assert "brand (approved Thai: แบรนด์)" in results["vi"].prompt
+    assert "brand → แบรนด์" in results["th"].prompt
+
+
+@pytest.mark.asyncio
+async def test_submission_stores_drafts_per_locale(client: AsyncClient):
+    translate = await client.post(
+        "/translate", json={"text": "Welcome to Leo", "target_locales": ["vi", "ID"]}
+    )
+    assert translate.status_code == 200
+    body = translate.json()
+    assert body["prompt"].startswith("You are a senior Thai copywriter")
+    assert [item["locale"] for item in body["translations"]] == ["vi", "id"]
+
+    unsupported = await client.post(
+        "/translate", json={"text": "Welcome", "target_locales": ["xx"]}
+    )
+    assert unsupported.status_code == 422
+
+    created = await client.post(
+        "/submissions",
+        json={"title": "Launch", "source_text": "Welcome to Leo", "target_locales": ["vi"]},
+    )
+    assert created.status_code == 201
+    submission = created.json()
+    assert submission["thai_draft"]
+    assert [item["locale"] for item in submission["translations"]] == ["vi"]
+
+    updated = await client.put(
+        f"/submissions/{submission['id']}", json={"locale_finals": {"vi": "Chào mừng đến Leo"}}
+    )
+    assert updated.status_code == 200
+    assert updated.json()["translations"][0]["final_text"] == "Chào mừng đến Leo"
+
+    missing = await client.put(
+        f"/submissions/{submission['id']}", json={"locale_finals": {"id": "Selamat datang"}}
+    )
+    assert missing.status_code == 400
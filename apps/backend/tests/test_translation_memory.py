@@ -0,0 +1,141 @@
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+from app.services import translation_memory
+from app.services.translation_memory import TranslationMemoryParser
+
+TMX = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<tmx version="1.4"><header srclang="en-US" segtype="sentence" o-tmf="x"'
+    ' adminlang="en" datatype="plaintext" creationtool="agency" creationtoolversion="1"/>'
+    "<body>"
+    + "".join(
+        f'<tu tuid="{index}"><tuv xml:lang="en-US"><seg>Offer {index}'
+        ' <bpt i="1">&lt;b&gt;</bpt>today<ept i="1">&lt;/b&gt;</ept></seg></tuv>'
+        f'<tuv xml:lang="th-TH"><seg>ข้อเสนอ {index} วันนี้</seg></tuv></tu>'
+        for index in range(7)
+    )
+    + '<tu tuid="empty"><tuv xml:lang="en-US"><seg>No target</seg></tuv></tu>'
+    "</body></tmx>"
+).encode()
+
+
+def _events(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def test_parser_reads_xliff_in_small_chunks_and_detaches_units():
+    document = (
+        '<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">'
+        '<file source-language="en" target-language="vi" datatype="plaintext"><body>'
+        '<trans-unit id="1"><source>Hello <g id="1">friend</g></source>'
+        "<target>Xin chào bạn</target>"
+        "<alt-trans><source>Hello</source><target>Chào</target></alt-trans></trans-unit>"
+        '<trans-unit id="2"><source>Untranslated</source></trans-unit>'
+        "</body></file></xliff>"
+    ).encode()
+    parser = TranslationMemoryParser()
+    units = []
+    for start in range(0, len(document), 7):
+        units.extend(parser.feed(document[start : start + 7]))
+    units.extend(parser.close())
+
+    assert parser.format == "xliff"
+    assert [(unit.source_text, unit.target_text, unit.target_locale) for unit in units] == [
+        ("Hello friend", "Xin chào bạn", "vi")
+    ]
+    assert parser.skipped == 1
+    # Only the document skeleton is still attached.
+    assert parser._stack == []
+
+
+@pytest.mark.asyncio
+async def test_tmx_import_streams_batches_and_resumes(client: AsyncClient, monkeypatch):
+    monkeypatch.setenv("LEO_TM_IMPORT_BATCH_SIZE", "3")
+    monkeypatch.setattr(translation_memory, "_HEAD_BYTES", 64)
+    get_settings.cache_clear()
+
+    # The first upload is cut off mid-document.
+    cut = TMX.index(b'<tu tuid="5">') + 20
+    first = await client.post("/translation-memory/imports?filename=agency.tmx", content=TMX[:cut])
+    events = _events(first)
+    import_id = events[0]["import_id"]
+    assert [event["status"] for event in events] == ["started", "progress", "failed"]
+    status = (await client.get(f"/translation-memory/imports/{import_id}")).json()
+    assert status["status"] == "failed"
+    assert status["units_seen"] == 5
+    assert status["format"] == "tmx"
+
+    other = await client.post(
+        f"/translation-memory/imports?import_id={import_id}", content=TMX.replace(b"1.4", b"1.3")
+    )
+    assert _events(other)[-1]["status"] == "failed"
+
+    resumed = await client.post(
+        f"/translation-memory/imports?import_id={import_id}", content=_chunks(TMX, 50)
+    )
+    events = _events(resumed)
+    assert events[0] == {"status": "started", "import_id": import_id, "resume_from": 5}
+    assert events[-1] == {
+        "status": "done",
+        "import_id": import_id,
+        "format": "tmx",
+        "units": 7,
+        "skipped": 1,
+        "imported": 7,
+    }
+    again = await client.post(f"/translation-memory/imports?import_id={import_id}", content=TMX)
+    assert again.status_code == 409
+
+    lookup = await client.get(
+        "/translation-memory/lookup", params={"text": "Offer  6 today", "target_locale": "th"}
+    )
+    items = lookup.json()["items"]
+    assert len(items) == 1
+    assert items[0]["target_text"] == "ข้อเสนอ 6 วันนี้"
+    assert items[0]["source_locale"] == "en-us"
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_export_round_trips_through_import(client: AsyncClient):
+    await client.post("/glossary", json={"source_term": "sale", "thai_term": "ลดราคา"})
+    created = await client.post(
+        "/submissions", json={"title": "Promo", "source_text": "Big sale & more <today>"}
+    )
+    submission_id = created.json()["id"]
+    await client.post("/submissions", json={"title": "Draft", "source_text": "Not approved"})
+    await client.put(
+        f"/submissions/{submission_id}",
+        json={"status": "approved", "thai_final": "ลดราคาครั้งใหญ่"},
+    )
+
+    tmx = await client.get("/translation-memory/export", params={"format": "tmx"})
+    assert tmx.headers["content-type"].startswith("application/x-tmx+xml")
+    root = ET.fromstring(tmx.content)
+    units = root.findall("./body/tu")
+    assert [unit.get("tuid") for unit in units] == [
+        f"submissions:{submission_id}",
+        units[1].get("tuid"),
+    ]
+    assert units[0].findall("tuv/seg")[0].text == "Big sale & more <today>"
+    assert units[1].findall("tuv/seg")[1].text == "ลดราคา"
+
+    xliff = await client.get(
+        "/translation-memory/export", params={"format": "xliff", "scope": "submissions"}
+    )
+    imported = await client.post("/translation-memory/imports", content=xliff.content)
+    assert _events(imported)[-1]["imported"] == 1
+    lookup = await client.get(
+        "/translation-memory/lookup", params={"text": "Big sale & more <today>"}
+    )
+    assert lookup.json()["items"][0]["target_text"] == "ลดราคาครั้งใหญ่"
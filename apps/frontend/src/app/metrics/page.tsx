@@ -2,7 +2,12 @@
 
 import { useEffect, useState } from "react";
 
-import { MetricsOverview, fetchMetricsOverview } from "@/lib/api";
+import {
+  MetricsOverview,
+  MetricsTimeseries,
+  fetchMetricsOverview,
+  fetchMetricsTimeseries,
+} from "@/lib/api";
 
 const statusLabels: Record<string, string> = {
   editing: "Editing",
@@ -13,6 +18,7 @@ const statusLabels: Record<string, string> = {
 
 export default function MetricsPage() {
   const [metrics, setMetrics] = useState<MetricsOverview | null>(null);
+  const [series, setSeries] = useState<MetricsTimeseries | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [days, setDays] = useState<number | undefined>();
@@ -21,8 +27,12 @@ export default function MetricsPage() {
     setLoading(true);
     setError(null);
     try {
-      const data = await fetchMetricsOverview(window);
+      const [data, daily] = await Promise.all([
+        fetchMetricsOverview(window),
+        fetchMetricsTimeseries(window ?? 30),
+      ]);
       setMetrics(data);
+      setSeries(daily);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load metrics");
     } finally {
@@ -34,6 +44,8 @@ export default function MetricsPage() {
     void loadMetrics();
   }, []);
 
+  const peakDaily = Math.max(1, ...(series?.points.map((point) => point.submissions) ?? []));
+
   return (
     <div className="mx-auto flex w-full max-w-5xl flex-col gap-8 px-6 py-12">
       <header className="flex flex-col gap-2 md:flex-row md:items-center md:justify-between">
@@ -120,6 +132,50 @@ export default function MetricsPage() {
               ${metrics.total_cost_usd.toFixed(2)}
             </p>
           </div>
+
+          <div className="rounded-lg border border-gray-200 bg-white p-6 shadow-sm">
+            <p className="text-xs uppercase text-gray-500">Post-edit distance</p>
+            <p className="mt-2 text-2xl font-semibold text-gray-900">
+              {metrics.average_post_edit_ratio !== null
+                ? `${(metrics.average_post_edit_ratio * 100).toFixed(1)}%`
+                : "–"}
+            </p>
+            <p className="text-xs text-gray-500">
+              Avg edits / final:{" "}
+              {metrics.average_post_edit_distance !== null
+                ? metrics.average_post_edit_distance.toFixed(1)
+                : "–"}
+            </p>
+          </div>
+
+          <div className="rounded-lg border border-gray-200 bg-white p-6 shadow-sm">
+            <p className="text-xs uppercase text-gray-500">Time to approval</p>
+            <p className="mt-2 text-2xl font-semibold text-gray-900">
+              {metrics.average_time_to_approval_hours !== null
+                ? `${metrics.average_time_to_approval_hours.toFixed(1)}h`
+                : "–"}
+            </p>
+          </div>
+
+          {series && series.points.length > 0 && (
+            <div className="rounded-lg border border-gray-200 bg-white p-6 shadow-sm md:col-span-3">
+              <p className="text-xs uppercase text-gray-500">Daily submissions</p>
+              <ul className="mt-3 space-y-1 text-sm text-gray-700">
+                {series.points.map((point) => (
+                  <li key={point.day} className="flex items-center gap-3">
+                    <span className="w-24 shrink-0 text-xs text-gray-500">{point.day}</span>
+                    <span
+                      className="h-2 rounded bg-indigo-400"
+                      style={{ width: `${(point.submissions / peakDaily) * 100}%` }}
+                    />
+                    <span className="shrink-0 text-xs">
+                      {point.submissions} ({point.approved} approved)
+                    </span>
+                  </li>
+                ))}
+              </ul>
+            </div>
+          )}
         </div>
       )}
     </div>
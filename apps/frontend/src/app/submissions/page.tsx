@@ -4,9 +4,9 @@ import Link from "next/link";
 import { useEffect, useMemo, useState } from "react";
 
 import {
-  Submission,
   SubmissionListResponse,
   SubmissionStatus,
+  SubmissionSummary,
   fetchSubmissions,
 } from "@/lib/api";
 
@@ -20,17 +20,19 @@ const statusLabels: Record<SubmissionStatus, string> = {
 const statusOrder: SubmissionStatus[] = ["editing", "in_review", "needs_changes", "approved"];
 
 export default function SubmissionsPage() {
-  const [submissions, setSubmissions] = useState<Submission[]>([]);
+  const [submissions, setSubmissions] = useState<SubmissionSummary[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [statusFilter, setStatusFilter] = useState<SubmissionStatus | "all">("all");
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
-  const loadSubmissions = async (status?: SubmissionStatus) => {
+  const loadSubmissions = async (status?: SubmissionStatus, cursor?: string) => {
     setLoading(true);
     setError(null);
     try {
-      const response: SubmissionListResponse = await fetchSubmissions(status);
-      setSubmissions(response.items);
+      const response: SubmissionListResponse = await fetchSubmissions(status, cursor);
+      setSubmissions((current) => (cursor ? [...current, ...response.items] : response.items));
+      setNextCursor(response.next_cursor ?? null);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load submissions");
     } finally {
@@ -51,7 +53,7 @@ export default function SubmissionsPage() {
   }, [statusFilter]);
 
   const grouped = useMemo(() => {
-    const map = new Map<SubmissionStatus, Submission[]>();
+    const map = new Map<SubmissionStatus, SubmissionSummary[]>();
     for (const status of statusOrder) {
       map.set(status, []);
     }
@@ -108,7 +110,7 @@ export default function SubmissionsPage() {
 
       {error && <div className="rounded border border-red-200 bg-red-50 p-4 text-sm text-red-700">{error}</div>}
 
-      {loading ? (
+      {loading && submissions.length === 0 ? (
         <div className="text-sm text-gray-500">Loading submissions…</div>
       ) : submissions.length === 0 ? (
         <div className="rounded border border-dashed border-gray-300 p-8 text-center text-sm text-gray-500">
@@ -155,6 +157,18 @@ export default function SubmissionsPage() {
                 </section>
               );
             })}
+          {nextCursor && (
+            <button
+              type="button"
+              disabled={loading}
+              onClick={() =>
+                void loadSubmissions(statusFilter === "all" ? undefined : statusFilter, nextCursor)
+              }
+              className="self-center rounded border border-gray-200 px-4 py-2 text-sm text-gray-700 hover:border-indigo-200 hover:text-indigo-600 disabled:opacity-50"
+            >
+              {loading ? "Loading…" : "Load more"}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -98,16 +98,39 @@ export type SubmissionUpdate = {
   reviewer_notes?: string;
 };
 
+export type SubmissionSummary = Pick<
+  Submission,
+  | "id"
+  | "title"
+  | "status"
+  | "tone"
+  | "audience"
+  | "channel"
+  | "provider_name"
+  | "usage_tokens"
+  | "cost_usd"
+  | "last_reviewed_at"
+  | "created_at"
+  | "updated_at"
+>;
+
 export type SubmissionListResponse = {
-  items: Submission[];
+  items: SubmissionSummary[];
   total: number;
+  next_cursor?: string | null;
 };
 
-export async function fetchSubmissions(status?: SubmissionStatus): Promise<SubmissionListResponse> {
+export async function fetchSubmissions(
+  status?: SubmissionStatus,
+  cursor?: string,
+): Promise<SubmissionListResponse> {
   const url = new URL("/submissions", API_BASE_URL);
   if (status) {
     url.searchParams.append("status", status);
   }
+  if (cursor) {
+    url.searchParams.append("cursor", cursor);
+  }
   return handleResponse<SubmissionListResponse>(await fetch(url, { cache: "no-store" }));
 }
 
@@ -142,6 +165,9 @@ export type MetricsOverview = {
   average_tokens: number | null;
   total_tokens: number;
   total_cost_usd: number;
+  average_post_edit_distance: number | null;
+  average_post_edit_ratio: number | null;
+  average_time_to_approval_hours: number | null;
 };
 
 export async function fetchMetricsOverview(days?: number): Promise<MetricsOverview> {
@@ -152,6 +178,37 @@ export async function fetchMetricsOverview(days?: number): Promise<MetricsOvervi
   return handleResponse<MetricsOverview>(await fetch(url, { cache: "no-store" }));
 }
 
+export type MetricsTimeseriesPoint = {
+  day: string;
+  group: string | null;
+  submissions: number;
+  approved: number;
+  usage_tokens: number;
+  cost_usd: number;
+  submissions_with_warnings: number;
+  average_post_edit_ratio: number | null;
+  average_time_to_approval_hours: number | null;
+};
+
+export type MetricsTimeseries = {
+  generated_at: string;
+  days: number;
+  group_by: "status" | "provider" | "channel" | null;
+  points: MetricsTimeseriesPoint[];
+};
+
+export async function fetchMetricsTimeseries(
+  days = 30,
+  groupBy?: MetricsTimeseries["group_by"],
+): Promise<MetricsTimeseries> {
+  const url = new URL("/metrics/timeseries", API_BASE_URL);
+  url.searchParams.append("days", String(days));
+  if (groupBy) {
+    url.searchParams.append("group_by", groupBy);
+  }
+  return handleResponse<MetricsTimeseries>(await fetch(url, { cache: "no-store" }));
+}
+
 export async function exportSubmission(id: string, format: "csv" | "docx" | "social"): Promise<void> {
   const url = new URL(`/submissions/${id}/export`, API_BASE_URL);
   url.searchParams.append("format", format);